@@ -60,8 +60,22 @@ CREATE TABLE company_investor (
 );
 
 -- Índices para mejorar el rendimiento de las consultas
-CREATE INDEX idx_company_industry ON company(industry_id);
-CREATE INDEX idx_company_location ON company(location_id);
+-- Compuestos con id para la paginación por cursor (keyset): WHERE filtro AND id > ? ORDER BY id
+CREATE INDEX idx_company_industry ON company(industry_id, id);
+CREATE INDEX idx_company_location ON company(location_id, id);
+CREATE INDEX idx_company_industry_location ON company(industry_id, location_id, id);
+-- Filtros por rango (min_arr, max_arr, min_valuation, ...) y ordenamiento (sort/order) por métrica:
+-- ORDER BY métrica NULLS LAST, id en ambas direcciones, con id como desempate para el cursor
+CREATE INDEX idx_company_arr ON company(arr, id);
+CREATE INDEX idx_company_arr_desc ON company(arr DESC NULLS LAST, id);
+CREATE INDEX idx_company_valuation ON company(valuation, id);
+CREATE INDEX idx_company_valuation_desc ON company(valuation DESC NULLS LAST, id);
+CREATE INDEX idx_company_total_funding ON company(total_funding, id);
+CREATE INDEX idx_company_total_funding_desc ON company(total_funding DESC NULLS LAST, id);
+CREATE INDEX idx_company_founding_year ON company(founding_year, id);
+CREATE INDEX idx_company_founding_year_desc ON company(founding_year DESC NULLS LAST, id);
+-- Versión de los datos (conteo y último updated_at) para invalidar agregados cacheados
+CREATE INDEX idx_company_updated_at ON company(updated_at);
 CREATE INDEX idx_company_investor_company ON company_investor(company_id);
 CREATE INDEX idx_company_investor_investor ON company_investor(investor_id);
 
@@ -0,0 +1,94 @@
+"""Router for admin endpoints."""
+
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from backend.core import cache
+from backend.core.settings import settings
+from backend.schemas.admin import CacheInvalidateResponse, CacheStats
+from backend.services import company_detail_service
+
+router = APIRouter()
+
+
+async def require_admin_token(
+    x_admin_token: str | None = Header(default=None, description="Admin API token"),
+) -> None:
+    """FastAPI dependency that guards admin endpoints.
+
+    Admin endpoints are disabled while ``settings.admin_token`` is empty.
+
+    Args:
+        x_admin_token: Token sent in the ``X-Admin-Token`` header.
+
+    Raises:
+        HTTPException: 403 if admin endpoints are disabled or the token is wrong.
+    """
+    if not settings.admin_token or not secrets.compare_digest(
+        x_admin_token or "", settings.admin_token
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.post(
+    "/admin/cache/invalidate",
+    response_model=CacheInvalidateResponse,
+    status_code=200,
+    dependencies=[Depends(require_admin_token)],
+)
+async def invalidate_cache(
+    name: str | None = Query(default=None, description="Cache to invalidate (all when omitted)"),
+) -> CacheInvalidateResponse:
+    """Invalidate in-process caches so the next request reloads from upstream.
+
+    Args:
+        name: Optional cache name; every registered cache when omitted.
+
+    Returns:
+        Names of the invalidated caches.
+
+    Raises:
+        HTTPException: 404 if the cache name is unknown.
+    """
+    try:
+        invalidated = cache.invalidate(name)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown cache: {name}") from None
+    return CacheInvalidateResponse(invalidated=invalidated)
+
+
+@router.post(
+    "/admin/cache/companies/{company_id}/invalidate",
+    response_model=CacheInvalidateResponse,
+    status_code=200,
+    dependencies=[Depends(require_admin_token)],
+)
+async def invalidate_company(company_id: int) -> CacheInvalidateResponse:
+    """Drop one company from the detail cache after it changed upstream.
+
+    Args:
+        company_id: Company primary key.
+
+    Returns:
+        The detail cache name if the company was cached, otherwise nothing.
+    """
+    invalidated = company_detail_service.invalidate_company(company_id)
+    return CacheInvalidateResponse(
+        invalidated=[company_detail_service.detail_cache.name] if invalidated else []
+    )
+
+
+@router.get(
+    "/admin/cache/stats",
+    response_model=dict[str, CacheStats],
+    status_code=200,
+    dependencies=[Depends(require_admin_token)],
+)
+async def cache_stats() -> dict[str, CacheStats]:
+    """Report hit/miss counters of the response caches.
+
+    Returns:
+        Counters keyed by cache name.
+    """
+    return {name: CacheStats(**stats) for name, stats in cache.get_stats().items()}
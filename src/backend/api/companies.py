@@ -1,39 +1,500 @@
 """Router for company endpoints."""
 
-from fastapi import APIRouter, Depends, Query
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from supabase._async.client import AsyncClient
 
+from backend.core.cursor import InvalidCursorError
+from backend.core.responses import ModelResponse
+from backend.core.settings import settings
 from backend.core.supabase_client import get_supabase
-from backend.schemas.company import CompanyListResponse
-from backend.services import company_service
+from backend.schemas.aggregate import AggregateGroupBy, CompanyAggregates
+from backend.schemas.company import (
+    DEFAULT_FIELDS,
+    CompanyBatchRequest,
+    CompanyBatchResponse,
+    CompanyFacets,
+    CompanyListResponse,
+    CompanyRanges,
+    CompanyRead,
+    CompanySearchResponse,
+    CompanySortKey,
+    IdFilter,
+    SortOrder,
+)
+from backend.services import (
+    aggregate_service,
+    company_detail_service,
+    company_service,
+    export_service,
+    facet_service,
+    search_service,
+)
 
 router = APIRouter()
 
+_company_list_adapter = TypeAdapter(CompanyListResponse)
+_facets_adapter = TypeAdapter(CompanyFacets)
+_aggregates_adapter = TypeAdapter(CompanyAggregates)
+_company_adapter = TypeAdapter(CompanyRead)
+_batch_adapter = TypeAdapter(CompanyBatchResponse)
+_search_adapter = TypeAdapter(CompanySearchResponse)
+
+_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+_COLUMNAR_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """Parse a comma-separated sparse fieldset into canonical field order.
+
+    ``id`` is always included so items stay identifiable and cursors work.
+
+    Args:
+        fields: Comma-separated field names, or None for every field.
+
+    Returns:
+        Requested fields in schema order, or None for every field.
+
+    Raises:
+        HTTPException: 400 if a field name is unknown.
+    """
+    if fields is None:
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - CompanyRead.model_fields.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    requested.add("id")
+    return tuple(field for field in CompanyRead.model_fields if field in requested)
+
+
+def _parse_ids(values: list[str] | None, name: str) -> IdFilter | None:
+    """Parse repeated and/or comma-separated IDs into a canonical filter.
+
+    IDs are deduplicated and sorted so every spelling of the same selection
+    shares one cache entry; a single ID stays a plain int.
+
+    Args:
+        values: Raw query parameter values, e.g. ``["1,3", "2"]``.
+        name: Query parameter name reported in the error location.
+
+    Returns:
+        One ID, a sorted tuple of IDs, or None when no ID is given.
+
+    Raises:
+        RequestValidationError: If a value is not an integer, reported as a
+            422 in the same shape as FastAPI's own parameter errors.
+    """
+    parsed: set[int] = set()
+    errors = []
+    parts = [part for value in values or () for part in value.split(",") if part.strip()]
+    for part in parts:
+        try:
+            parsed.add(int(part))
+        except ValueError:
+            errors.append(
+                {
+                    "type": "int_parsing",
+                    "loc": ("query", name),
+                    "msg": "Input should be a valid integer, unable to parse string as an integer",
+                    "input": part,
+                }
+            )
+    if errors:
+        raise RequestValidationError(errors)
+    ids = sorted(parsed)
+    if not ids:
+        return None
+    return ids[0] if len(ids) == 1 else tuple(ids)
+
+
+def industry_filter(
+    industry_id: list[str] | None = Query(
+        default=None, description="Filter by industry ID; repeat or comma-separate for several"
+    ),
+) -> IdFilter | None:
+    """Collect the ``industry_id`` query parameters into one filter."""
+    return _parse_ids(industry_id, "industry_id")
+
+
+def location_filter(
+    location_id: list[str] | None = Query(
+        default=None, description="Filter by location ID; repeat or comma-separate for several"
+    ),
+) -> IdFilter | None:
+    """Collect the ``location_id`` query parameters into one filter."""
+    return _parse_ids(location_id, "location_id")
+
+
+def company_ranges(
+    min_arr: int | None = Query(default=None, ge=0, description="Minimum ARR (USD)"),
+    max_arr: int | None = Query(default=None, ge=0, description="Maximum ARR (USD)"),
+    min_valuation: int | None = Query(default=None, ge=0, description="Minimum valuation (USD)"),
+    min_total_funding: int | None = Query(
+        default=None, ge=0, description="Minimum total funding (USD)"
+    ),
+    founded_after: int | None = Query(default=None, description="Founded in this year or later"),
+    founded_before: int | None = Query(default=None, description="Founded in this year or earlier"),
+) -> CompanyRanges | None:
+    """Collect the metric range query parameters into one filter.
+
+    Args:
+        min_arr: Optional minimum Annual Recurring Revenue.
+        max_arr: Optional maximum Annual Recurring Revenue.
+        min_valuation: Optional minimum valuation.
+        min_total_funding: Optional minimum total funding.
+        founded_after: Optional earliest founding year (inclusive).
+        founded_before: Optional latest founding year (inclusive).
+
+    Returns:
+        The range filter, or None when no bound is given.
+    """
+    ranges = CompanyRanges(
+        min_arr=min_arr,
+        max_arr=max_arr,
+        min_valuation=min_valuation,
+        min_total_funding=min_total_funding,
+        founded_after=founded_after,
+        founded_before=founded_before,
+    )
+    if all(value is None for _, value in ranges):
+        return None
+    return ranges
+
 
 @router.get("/companies", response_model=CompanyListResponse, status_code=200)
 async def list_companies(
-    industry_id: int | None = Query(default=None, description="Filter by industry ID"),
-    location_id: int | None = Query(default=None, description="Filter by location ID"),
+    industry_id: IdFilter | None = Depends(industry_filter),
+    location_id: IdFilter | None = Depends(location_filter),
+    investor_id: int | None = Query(default=None, description="Filter by investor ID"),
+    ranges: CompanyRanges | None = Depends(company_ranges),
     page: int = Query(default=1, ge=1, description="Page number (1-based)"),
     size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    include_total: bool = Query(
+        default=True, description="Compute total and total_pages (skips the count when false)"
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque keyset cursor; send an empty value to start cursor pagination",
+    ),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated company fields to return, e.g. id,name,arr",
+    ),
+    sort: CompanySortKey | None = Query(
+        default=None, description="Metric to sort by; id order when omitted"
+    ),
+    order: SortOrder = Query(default="asc", description="Sort direction; NULL values come last"),
+    include_investors: bool = Query(
+        default=False, description="Embed the investors of each company"
+    ),
     client: AsyncClient = Depends(get_supabase),
-) -> CompanyListResponse:
+) -> ModelResponse:
     """List companies with optional filters and pagination.
 
     Args:
-        industry_id: Optional filter by industry ID.
-        location_id: Optional filter by location ID.
+        industry_id: Optional filter by industry ID; any of several IDs matches.
+        location_id: Optional filter by location ID; any of several IDs matches.
+        investor_id: Optional filter by investor ID.
+        ranges: Optional bounds on ARR, valuation, funding and founding year.
         page: Page number, starting from 1.
         size: Number of items per page (1-100).
+        include_total: Whether to compute the total count of matching companies.
+        cursor: Keyset cursor from a previous ``next_cursor``; enables cursor mode.
+        fields: Optional sparse fieldset; only these columns are fetched upstream.
+        sort: Optional metric to sort by (arr, valuation, total_funding, founding_year).
+        order: Sort direction, ``asc`` or ``desc``.
+        include_investors: Whether to embed investors; same as adding
+            ``investors`` to ``fields``. Fetched in the same query as the page.
         client: Injected async Supabase client.
 
     Returns:
         Paginated list of companies with metadata.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or from another sort,
+            or if a field is unknown.
     """
-    return await company_service.get_companies(
+    selected = _parse_fields(fields)
+    if include_investors and "investors" not in (selected or ()):
+        selected = (*(selected or DEFAULT_FIELDS), "investors")
+    try:
+        response = await company_service.get_companies_cached(
+            client,
+            industry_id=industry_id,
+            location_id=location_id,
+            investor_id=investor_id,
+            ranges=ranges,
+            page=page,
+            size=size,
+            include_total=include_total,
+            cursor=cursor,
+            fields=selected,
+            sort=sort,
+            order=order,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    omitted = set(CompanyRead.model_fields) - set(selected or DEFAULT_FIELDS)
+    return ModelResponse(
+        response, adapter=_company_list_adapter, exclude={"items": {"__all__": omitted}}
+    )
+
+
+@router.get("/companies/facets", response_model=CompanyFacets, status_code=200)
+async def get_company_facets(
+    industry_id: IdFilter | None = Depends(industry_filter),
+    location_id: IdFilter | None = Depends(location_filter),
+    ranges: CompanyRanges | None = Depends(company_ranges),
+    investor_id: int | None = Query(default=None, description="Filter by investor ID"),
+    client: AsyncClient = Depends(get_supabase),
+) -> ModelResponse:
+    """Count matching companies per industry and per location.
+
+    Args:
+        industry_id: Optional filter by industry ID; any of several IDs matches.
+        location_id: Optional filter by location ID; any of several IDs matches.
+        ranges: Optional bounds on ARR, valuation, funding and founding year.
+        investor_id: Optional filter by investor ID.
+        client: Injected async Supabase client.
+
+    Returns:
+        Facet counts for the filter sidebar.
+    """
+    facets = await facet_service.get_facets(
         client,
         industry_id=industry_id,
         location_id=location_id,
-        page=page,
-        size=size,
+        ranges=ranges,
+        investor_id=investor_id,
     )
+    return ModelResponse(facets, adapter=_facets_adapter)
+
+
+@router.get(
+    "/companies/search",
+    response_model=CompanySearchResponse,
+    status_code=200,
+    responses={501: {"description": "numpy is not installed"}},
+)
+async def search_companies(
+    q: str = Query(
+        min_length=1, max_length=100, description="Text to search in names and products"
+    ),
+    limit: int = Query(default=10, ge=1, le=50, description="Maximum number of results"),
+    client: AsyncClient = Depends(get_supabase),
+) -> ModelResponse:
+    """Search companies by name and products, tolerant to typos.
+
+    Answered from an in-memory trigram index, so it is cheap enough to call
+    on every keystroke.
+
+    Args:
+        q: Search text; case, accents and punctuation are ignored.
+        limit: Maximum number of results (1-50).
+        client: Injected async Supabase client.
+
+    Returns:
+        Matching companies with relevance scores, best first.
+
+    Raises:
+        HTTPException: 501 if the optional numpy dependency is not installed.
+    """
+    if not search_service.SEARCH_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Search requires the 'search' extra (numpy)")
+
+    results = await search_service.search_companies(client, q, limit=limit)
+    return ModelResponse(results, adapter=_search_adapter)
+
+
+@router.get(
+    "/companies/aggregates",
+    response_model=CompanyAggregates,
+    status_code=200,
+    responses={501: {"description": "numpy is not installed"}},
+)
+async def get_company_aggregates(
+    group_by: AggregateGroupBy = Query(default="industry", description="Dimension to group by"),
+    client: AsyncClient = Depends(get_supabase),
+) -> ModelResponse:
+    """Summarize ARR, valuation and total funding per industry or country.
+
+    Args:
+        group_by: ``industry`` or ``country``.
+        client: Injected async Supabase client.
+
+    Returns:
+        Count, sum, median and percentiles of each metric per group.
+
+    Raises:
+        HTTPException: 501 if the optional numpy dependency is not installed.
+    """
+    if not aggregate_service.AGGREGATES_AVAILABLE:
+        raise HTTPException(
+            status_code=501, detail="Aggregates require the 'analytics' extra (numpy)"
+        )
+
+    aggregates = await aggregate_service.get_aggregates(client, group_by)
+    return ModelResponse(aggregates, adapter=_aggregates_adapter)
+
+
+@router.get(
+    "/companies/export",
+    response_class=StreamingResponse,
+    status_code=200,
+    responses={200: {"content": {media: {} for media in _EXPORT_MEDIA_TYPES.values()}}},
+)
+async def export_companies(
+    industry_id: IdFilter | None = Depends(industry_filter),
+    location_id: IdFilter | None = Depends(location_filter),
+    ranges: CompanyRanges | None = Depends(company_ranges),
+    export_format: Literal["ndjson", "csv"] = Query(
+        default="ndjson", alias="format", description="Export format"
+    ),
+    client: AsyncClient = Depends(get_supabase),
+) -> StreamingResponse:
+    """Stream every matching company as NDJSON or CSV.
+
+    Rows are fetched upstream in keyset chunks and each chunk is written to
+    the response as soon as it arrives, so memory stays flat.
+
+    Args:
+        industry_id: Optional filter by industry ID; any of several IDs matches.
+        location_id: Optional filter by location ID; any of several IDs matches.
+        ranges: Optional bounds on ARR, valuation, funding and founding year.
+        export_format: Output format, ``ndjson`` or ``csv`` (``format`` query parameter).
+        client: Injected async Supabase client.
+
+    Returns:
+        Streaming response with the exported companies.
+    """
+    chunks = export_service.iter_company_chunks(
+        client,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        chunk_size=settings.export_chunk_size,
+    )
+    if export_format == "csv":
+        body = export_service.stream_csv(chunks)
+    else:
+        body = export_service.stream_ndjson(chunks)
+
+    return StreamingResponse(
+        body,
+        media_type=_EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="companies.{export_format}"'},
+    )
+
+
+@router.get(
+    "/companies/export/columnar",
+    response_class=StreamingResponse,
+    status_code=200,
+    responses={
+        200: {"content": {media: {} for media in _COLUMNAR_MEDIA_TYPES.values()}},
+        501: {"description": "pyarrow is not installed"},
+    },
+)
+async def export_companies_columnar(
+    industry_id: IdFilter | None = Depends(industry_filter),
+    location_id: IdFilter | None = Depends(location_filter),
+    ranges: CompanyRanges | None = Depends(company_ranges),
+    columnar_format: Literal["arrow", "parquet"] = Query(
+        default="arrow", alias="format", description="Columnar format"
+    ),
+    client: AsyncClient = Depends(get_supabase),
+) -> StreamingResponse:
+    """Export matching companies as Arrow IPC or Parquet for analytics.
+
+    Args:
+        industry_id: Optional filter by industry ID; any of several IDs matches.
+        location_id: Optional filter by location ID; any of several IDs matches.
+        ranges: Optional bounds on ARR, valuation, funding and founding year.
+        columnar_format: ``arrow`` or ``parquet`` (``format`` query parameter).
+        client: Injected async Supabase client.
+
+    Returns:
+        Streaming response with the columnar export.
+
+    Raises:
+        HTTPException: 501 if the optional pyarrow dependency is not installed.
+    """
+    if not export_service.COLUMNAR_AVAILABLE:
+        raise HTTPException(
+            status_code=501, detail="Columnar export requires the 'analytics' extra (pyarrow)"
+        )
+
+    body = export_service.stream_columnar(
+        client,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        chunk_size=settings.export_chunk_size,
+        columnar_format=columnar_format,
+    )
+    extension = "arrows" if columnar_format == "arrow" else "parquet"
+    return StreamingResponse(
+        body,
+        media_type=_COLUMNAR_MEDIA_TYPES[columnar_format],
+        headers={"Content-Disposition": f'attachment; filename="companies.{extension}"'},
+    )
+
+
+@router.post("/companies/batch", response_model=CompanyBatchResponse, status_code=200)
+async def get_companies_batch(
+    request: CompanyBatchRequest,
+    client: AsyncClient = Depends(get_supabase),
+) -> ModelResponse:
+    """Get several companies by id in one request, e.g. for comparison views.
+
+    Args:
+        request: Company ids to fetch (1-100).
+        client: Injected async Supabase client.
+
+    Returns:
+        Found companies in request order and the ids that do not exist.
+    """
+    batch = await company_detail_service.get_companies_by_ids(client, request.ids)
+    return ModelResponse(batch, adapter=_batch_adapter, memoize=False)
+
+
+@router.get(
+    "/companies/{company_id}",
+    response_model=CompanyRead,
+    status_code=200,
+    responses={404: {"description": "Company not found"}},
+)
+async def get_company(
+    company_id: int,
+    client: AsyncClient = Depends(get_supabase),
+) -> ModelResponse:
+    """Get one company with its industry, location and investors.
+
+    Declared after the static ``/companies/...`` routes so they are matched first.
+
+    Args:
+        company_id: Company primary key.
+        client: Injected async Supabase client.
+
+    Returns:
+        The company details.
+
+    Raises:
+        HTTPException: 404 if the company does not exist.
+    """
+    company = await company_detail_service.get_company(client, company_id)
+    if company is None:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return ModelResponse(company, adapter=_company_adapter)
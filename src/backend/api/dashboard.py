@@ -0,0 +1,68 @@
+"""Router for the dashboard bootstrap endpoint."""
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
+from supabase._async.client import AsyncClient
+
+from backend.api.companies import company_ranges, industry_filter, location_filter
+from backend.core.responses import ModelResponse
+from backend.core.supabase_client import get_supabase
+from backend.schemas.company import CompanyRanges, CompanySortKey, IdFilter, SortOrder
+from backend.schemas.dashboard import DashboardResponse
+from backend.services import dashboard_service
+
+router = APIRouter()
+
+_dashboard_adapter = TypeAdapter(DashboardResponse)
+
+
+@router.get("/dashboard", response_model=DashboardResponse, status_code=200)
+async def get_dashboard(
+    industry_id: IdFilter | None = Depends(industry_filter),
+    location_id: IdFilter | None = Depends(location_filter),
+    investor_id: int | None = Query(default=None, description="Filter by investor ID"),
+    ranges: CompanyRanges | None = Depends(company_ranges),
+    page: int = Query(default=1, ge=1, description="Page number (1-based)"),
+    size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    include_total: bool = Query(
+        default=True, description="Compute total and total_pages (skips the count when false)"
+    ),
+    sort: CompanySortKey | None = Query(
+        default=None, description="Metric to sort by; id order when omitted"
+    ),
+    order: SortOrder = Query(default="asc", description="Sort direction; NULL values come last"),
+    client: AsyncClient = Depends(get_supabase),
+) -> ModelResponse:
+    """Return industries, locations and a page of companies in one response.
+
+    Replaces the separate ``/industries``, ``/locations`` and ``/companies``
+    calls of a dashboard render; the three are resolved concurrently.
+
+    Args:
+        industry_id: Optional filter by industry ID; any of several IDs matches.
+        location_id: Optional filter by location ID; any of several IDs matches.
+        investor_id: Optional filter by investor ID.
+        ranges: Optional bounds on ARR, valuation, funding and founding year.
+        page: Page number, starting from 1.
+        size: Number of items per page (1-100).
+        include_total: Whether to compute the total count of matching companies.
+        sort: Optional metric to sort by (arr, valuation, total_funding, founding_year).
+        order: Sort direction, ``asc`` or ``desc``.
+        client: Injected async Supabase client.
+
+    Returns:
+        Filter options and the requested page of companies.
+    """
+    dashboard = await dashboard_service.get_dashboard(
+        client,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        investor_id=investor_id,
+        page=page,
+        size=size,
+        include_total=include_total,
+        sort=sort,
+        order=order,
+    )
+    return ModelResponse(dashboard, adapter=_dashboard_adapter)
@@ -3,8 +3,9 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from backend.core.responses import ModelResponse
 from backend.core.settings import settings
 
 router = APIRouter()
@@ -19,17 +20,21 @@ class HealthResponse(BaseModel):
     timestamp: datetime
 
 
+_health_adapter = TypeAdapter(HealthResponse)
+
+
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> ModelResponse:
     """
     Health check endpoint.
 
     Returns:
         HealthResponse: Current health status of the API
     """
-    return HealthResponse(
+    health = HealthResponse(
         status="healthy",
         version=settings.app_version,
         environment=settings.environment,
         timestamp=datetime.now(timezone.utc),
     )
+    return ModelResponse(health, adapter=_health_adapter, memoize=False)
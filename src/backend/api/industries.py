@@ -1,19 +1,23 @@
 """Router for industry endpoints."""
 
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from supabase._async.client import AsyncClient
 
+from backend.core.responses import ModelResponse
 from backend.core.supabase_client import get_supabase
 from backend.schemas.industry import IndustryRead
 from backend.services import industry_service
 
 router = APIRouter()
 
+_industries_adapter = TypeAdapter(list[IndustryRead])
+
 
 @router.get("/industries", response_model=list[IndustryRead], status_code=200)
 async def list_industries(
     client: AsyncClient = Depends(get_supabase),
-) -> list[IndustryRead]:
+) -> ModelResponse:
     """List all industries ordered by name.
 
     Args:
@@ -22,4 +26,5 @@ async def list_industries(
     Returns:
         List of all industries.
     """
-    return await industry_service.get_all_industries(client)
+    industries = await industry_service.get_all_industries(client)
+    return ModelResponse(industries, adapter=_industries_adapter)
@@ -0,0 +1,30 @@
+"""Router for investor endpoints."""
+
+from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
+from supabase._async.client import AsyncClient
+
+from backend.core.responses import ModelResponse
+from backend.core.supabase_client import get_supabase
+from backend.schemas.investor import InvestorRead
+from backend.services import investor_service
+
+router = APIRouter()
+
+_investors_adapter = TypeAdapter(list[InvestorRead])
+
+
+@router.get("/investors", response_model=list[InvestorRead], status_code=200)
+async def list_investors(
+    client: AsyncClient = Depends(get_supabase),
+) -> ModelResponse:
+    """List all investors ordered by name.
+
+    Args:
+        client: Injected async Supabase client.
+
+    Returns:
+        List of all investors.
+    """
+    investors = await investor_service.get_all_investors(client)
+    return ModelResponse(investors, adapter=_investors_adapter)
@@ -1,19 +1,23 @@
 """Router for location endpoints."""
 
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from supabase._async.client import AsyncClient
 
+from backend.core.responses import ModelResponse
 from backend.core.supabase_client import get_supabase
 from backend.schemas.location import LocationRead
 from backend.services import location_service
 
 router = APIRouter()
 
+_locations_adapter = TypeAdapter(list[LocationRead])
+
 
 @router.get("/locations", response_model=list[LocationRead], status_code=200)
 async def list_locations(
     client: AsyncClient = Depends(get_supabase),
-) -> list[LocationRead]:
+) -> ModelResponse:
     """List all locations ordered by city.
 
     Args:
@@ -22,4 +26,5 @@ async def list_locations(
     Returns:
         List of all locations.
     """
-    return await location_service.get_all_locations(client)
+    locations = await location_service.get_all_locations(client)
+    return ModelResponse(locations, adapter=_locations_adapter)
@@ -0,0 +1,4 @@
+"""Micro-benchmarks for backend hot paths.
+
+Run from ``src/`` with ``python -m backend.benchmarks.<module>``.
+"""
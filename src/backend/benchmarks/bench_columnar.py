@@ -0,0 +1,74 @@
+"""Benchmark columnar exports against the JSON list endpoint payload.
+
+Builds the full company table (10k rows) from a zero-latency fake client
+and reports encoded size and build time per format.
+
+Usage (from ``src/``)::
+
+    python -m backend.benchmarks.bench_columnar
+"""
+
+import asyncio
+import time
+from math import ceil
+from typing import Any, Awaitable, Literal
+
+from pydantic import TypeAdapter
+
+from backend.benchmarks.fake_client import DelayedClient, make_company_rows
+from backend.core.responses import ModelResponse
+from backend.schemas.company import CompanyListResponse
+from backend.services import export_service
+from backend.services.company_service import to_company_reads
+
+ROWS = 10_000
+PAGE_SIZE = 100
+"""Maximum ``size`` of the JSON list endpoint."""
+
+_adapter = TypeAdapter(CompanyListResponse)
+
+
+async def _json_pages(rows: list[dict[str, Any]]) -> int:
+    """Total bytes of paging the whole table through /companies at size=100."""
+    total = 0
+    for page in range(ceil(len(rows) / PAGE_SIZE)):
+        chunk = rows[page * PAGE_SIZE : (page + 1) * PAGE_SIZE]
+        response = CompanyListResponse(
+            items=to_company_reads(chunk),
+            total=len(rows),
+            page=page + 1,
+            size=PAGE_SIZE,
+            total_pages=ceil(len(rows) / PAGE_SIZE),
+        )
+        total += len(ModelResponse(response, adapter=_adapter).body)
+    return total
+
+
+async def _columnar(client: Any, columnar_format: Literal["arrow", "parquet"]) -> int:
+    parts = [
+        part
+        async for part in export_service.stream_columnar(
+            client, chunk_size=1000, columnar_format=columnar_format
+        )
+    ]
+    return sum(len(part) for part in parts)
+
+
+async def _timed(label: str, coro: Awaitable[int]) -> None:
+    start = time.perf_counter()
+    size = await coro
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:<28} {size / 1024:>9.1f} KiB {elapsed:>9.1f} ms")
+
+
+async def main() -> None:
+    rows = make_company_rows(ROWS)
+    client = DelayedClient(rows, 0)
+    print(f"{ROWS} companies, excluding upstream latency")
+    await _timed(f"JSON list (size={PAGE_SIZE} pages)", _json_pages(rows))
+    await _timed("Arrow IPC stream", _columnar(client, "arrow"))
+    await _timed("Parquet", _columnar(client, "parquet"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+"""Benchmark concurrent page/count queries in ``company_service.get_companies``.
+
+Usage (from ``src/``)::
+
+    python -m backend.benchmarks.bench_company_service
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from backend.benchmarks.fake_client import DelayedClient, make_company_rows
+from backend.repositories import company_repository
+from backend.services import company_service
+
+DELAY = 0.05
+"""Simulated upstream round-trip in seconds."""
+
+ROUNDS = 20
+
+
+async def _sequential(client: Any) -> None:
+    """Baseline: page query then count query, one after the other."""
+    await company_repository.get_all(client, page=1, size=20)
+    await company_repository.count(client)
+
+
+async def _concurrent(client: Any) -> None:
+    await company_service.get_companies(client, page=1, size=20)
+
+
+async def _page_only(client: Any) -> None:
+    await company_service.get_companies(client, page=1, size=20, include_total=False)
+
+
+async def _measure(fn: Callable[[Any], Awaitable[None]], client: Any) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await fn(client)
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+async def main() -> None:
+    client = DelayedClient(make_company_rows(20), DELAY)
+    print(f"Upstream delay: {DELAY * 1000:.0f} ms, {ROUNDS} rounds")
+    for label, fn in [
+        ("sequential get_all + count", _sequential),
+        ("get_companies (concurrent)", _concurrent),
+        ("get_companies include_total=False", _page_only),
+    ]:
+        print(f"  {label:<36} {await _measure(fn, client):7.1f} ms/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
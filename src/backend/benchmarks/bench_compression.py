@@ -0,0 +1,73 @@
+"""Benchmark response compression of list payloads.
+
+Compares compressing a serialized body on every request with serving the
+cached compressed bytes for an unchanged ETag, for the reference industry
+list and for company pages.
+
+Usage (from ``src/``)::
+
+    python -m backend.benchmarks.bench_compression
+"""
+
+import time
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from backend.benchmarks.fake_client import make_company_rows
+from backend.core import compression
+from backend.core.compression import BROTLI_AVAILABLE
+from backend.core.responses import ModelResponse
+from backend.schemas.company import CompanyListResponse
+from backend.schemas.industry import IndustryRead
+from backend.services.company_service import to_company_reads
+
+ENCODINGS = ("gzip", "br") if BROTLI_AVAILABLE else ("gzip",)
+
+
+def _payloads() -> dict[str, ModelResponse]:
+    """Serialized bodies of a 90-row industry list and 20/100-row company pages."""
+    industries = [IndustryRead(id=i, name=f"Industry {i}") for i in range(1, 91)]
+    payloads = {
+        "industries (90)": ModelResponse(industries, adapter=TypeAdapter(list[IndustryRead]))
+    }
+    adapter = TypeAdapter(CompanyListResponse)
+    for size in (20, 100):
+        page = CompanyListResponse(
+            items=to_company_reads(make_company_rows(size)),
+            total=10_000,
+            page=1,
+            size=size,
+            total_pages=10_000 // size,
+        )
+        payloads[f"companies ({size})"] = ModelResponse(page, adapter=adapter)
+    return payloads
+
+
+def _best_us(fn: Callable[[], Any], rounds: int = 200) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main() -> None:
+    print(
+        f"{'payload':>16} {'coding':>6} {'bytes':>8} {'compressed':>10} "
+        f"{'encode µs':>10} {'cached µs':>10}"
+    )
+    for name, response in _payloads().items():
+        body, etag = bytes(response.body), response.headers["etag"]
+        for encoding in ENCODINGS:
+            compressed = compression.compress(body, encoding, etag)
+            print(
+                f"{name:>16} {encoding:>6} {len(body):>8} {len(compressed):>10} "
+                f"{_best_us(lambda: compression.compress(body, encoding)):>10.1f} "
+                f"{_best_us(lambda: compression.compress(body, encoding, etag)):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
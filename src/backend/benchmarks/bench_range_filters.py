@@ -0,0 +1,128 @@
+"""Benchmark metric range filters and sorting over 1M synthetic companies.
+
+Compares a per-row Python scan over the raw records with the vectorized
+boolean masks of the in-memory snapshot, then a per-request sort of the
+matches with the precomputed permutations and memoized filter buckets.
+Only the filter columns are generated; response objects are not needed
+to evaluate positions.
+
+Usage (from ``src/``)::
+
+    python -m backend.benchmarks.bench_range_filters
+"""
+
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from backend.repositories.company_repository import RANGE_BOUNDS
+from backend.repositories.company_snapshot import CompanySnapshot
+from backend.schemas.company import CompanyRanges
+
+ROWS = 1_000_000
+
+CASES = {
+    "min_arr": CompanyRanges(min_arr=35_000_000),
+    "arr window + founded": CompanyRanges(
+        min_arr=10_000_000, max_arr=40_000_000, founded_after=2010, founded_before=2015
+    ),
+    "all bounds": CompanyRanges(
+        min_arr=5_000_000,
+        max_arr=60_000_000,
+        min_valuation=1_000_000_000,
+        min_total_funding=100_000_000,
+        founded_after=2005,
+        founded_before=2020,
+    ),
+}
+
+ARR_DESC: dict[str, Any] = {"sort": "arr", "order": "desc"}
+
+
+def _make_rows(n: int) -> list[dict[str, Any]]:
+    """Flat company rows with the filter columns; every 7th metric is NULL."""
+    return [
+        {
+            "id": i,
+            "industry_id": 1 + i % 40,
+            "location_id": 1 + i % 60,
+            "founding_year": 1990 + i % 35,
+            "total_funding": None if i % 7 == 0 else 1_000_000 * (i % 500),
+            "arr": None if i % 7 == 1 else 100_000 * (i % 700),
+            "valuation": None if i % 7 == 2 else 10_000_000 * (i % 900),
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def _scan(rows: list[dict[str, Any]], ranges: CompanyRanges) -> list[int]:
+    """Per-row baseline: check every bound on every record."""
+    bounds = [
+        (column, operator, value)
+        for bound, (column, operator) in RANGE_BOUNDS.items()
+        if (value := getattr(ranges, bound)) is not None
+    ]
+    matches = []
+    for position, row in enumerate(rows):
+        for column, operator, value in bounds:
+            metric = row[column]
+            if metric is None or (metric < value if operator == "gte" else metric > value):
+                break
+        else:
+            matches.append(position)
+    return matches
+
+
+def _best_ms(fn: Callable[[], Any], rounds: int = 5) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _uncached(snapshot: CompanySnapshot, **kwargs: Any) -> Any:
+    """Evaluate positions without the per-snapshot bucket memo."""
+    snapshot._buckets.clear()
+    return snapshot.positions(**kwargs)
+
+
+def _sort_per_request(snapshot: CompanySnapshot, ranges: CompanyRanges) -> Any:
+    """Baseline: mask, then sort the matches by arr desc on every request."""
+    positions = _uncached(snapshot, ranges=ranges)
+    keys = -snapshot.metrics["arr"][positions]
+    return positions[np.lexsort((snapshot.ids[positions], keys))]
+
+
+def main() -> None:
+    rows = _make_rows(ROWS)
+    start = time.perf_counter()
+    snapshot = CompanySnapshot(rows, items=[])
+    print(f"snapshot columns built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    print(f"{'case':>22} {'matches':>9} {'scan ms':>9} {'mask ms':>9}")
+    for name, ranges in CASES.items():
+        positions = snapshot.positions(ranges=ranges)
+        assert positions.tolist() == _scan(rows, ranges)
+        print(
+            f"{name:>22} {len(positions):>9} "
+            f"{_best_ms(lambda: _scan(rows, ranges), rounds=2):>9.1f} "
+            f"{_best_ms(lambda: _uncached(snapshot, ranges=ranges)):>9.2f}"
+        )
+
+    print(f"\n{'sort=arr&order=desc':>22} {'sort ms':>9} {'perm ms':>9} {'memo ms':>9}")
+    for name, ranges in CASES.items():
+        sorted_positions = snapshot.positions(ranges=ranges, **ARR_DESC)
+        assert (sorted_positions == _sort_per_request(snapshot, ranges)).all()
+        print(
+            f"{name:>22} "
+            f"{_best_ms(lambda: _sort_per_request(snapshot, ranges)):>9.1f} "
+            f"{_best_ms(lambda: _uncached(snapshot, ranges=ranges, **ARR_DESC)):>9.2f} "
+            f"{_best_ms(lambda: snapshot.positions(ranges=ranges, **ARR_DESC)):>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
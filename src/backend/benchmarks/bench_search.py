@@ -0,0 +1,81 @@
+"""Benchmark the in-memory company search index.
+
+Indexes 10k synthetic companies with varied names and products, then
+reports per-query latency for typical search-as-you-type inputs and the
+cost of an incremental update against a full rebuild.
+
+Usage (from ``src/``)::
+
+    python -m backend.benchmarks.bench_search
+"""
+
+import time
+from itertools import product
+from typing import Any, Callable
+
+from backend.benchmarks.fake_client import make_company_rows
+from backend.repositories.company_search import CompanySearchIndex
+from backend.services.company_service import to_company_reads
+
+ROWS = 10_000
+
+_PREFIXES = ["Sales", "Data", "Cloud", "Pay", "Hub", "Zen", "Work", "Atlas", "Flow", "Signal"]
+_SUFFIXES = ["force", "dog", "flare", "ly", "spot", "desk", "day", "sian", "base", "wise"]
+_WORDS = ["Labs", "AI", "", "HQ", "Cloud", "", "Systems", "", "Software", ""]
+_PRODUCTS = [
+    "CRM, Marketing Automation",
+    "Observability, Log Management",
+    "Payments, Billing",
+    "Customer Support, Help Desk",
+    "HR, Payroll",
+    "Data Warehouse, Analytics",
+    "Security, Identity",
+    "Project Management, Collaboration",
+]
+
+QUERIES = ["s", "sa", "sales", "salesfroce", "datadog", "payroll", "zen desk", "cloud ai labs"]
+
+
+def _make_rows(n: int) -> list[dict[str, Any]]:
+    """Company rows with combinatorial names so trigram postings vary in size."""
+    names = [
+        " ".join(part for part in (f"{prefix}{suffix}", word) if part)
+        for prefix, suffix, word in product(_PREFIXES, _SUFFIXES, _WORDS)
+    ]
+    rows = make_company_rows(n)
+    for i, row in enumerate(rows):
+        row["name"] = f"{names[i % len(names)]} {i // len(names) or ''}".strip()
+        row["products"] = _PRODUCTS[i % len(_PRODUCTS)]
+    return rows
+
+
+def _best_us(fn: Callable[[], Any], rounds: int = 50) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main() -> None:
+    rows = _make_rows(ROWS)
+    items = to_company_reads(rows)
+    start = time.perf_counter()
+    index = CompanySearchIndex(rows, items)
+    print(f"indexed {ROWS} companies in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    print(f"\n{'query':>15} {'µs':>8}  top hit")
+    for query in QUERIES:
+        hits = index.search(query, limit=10)
+        top = f"{hits[0][0].name} ({hits[0][1]})" if hits else "-"
+        print(f"{query!r:>15} {_best_us(lambda: index.search(query, limit=10)):>8.1f}  {top}")
+
+    changed, changed_items = rows[:100], items[:100]
+    update_ms = _best_us(lambda: index.upsert(changed, changed_items), rounds=5) / 1000
+    rebuild_ms = _best_us(lambda: CompanySearchIndex(rows, items), rounds=3) / 1000
+    print(f"\nupsert 100 changed rows: {update_ms:.2f} ms, full rebuild: {rebuild_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
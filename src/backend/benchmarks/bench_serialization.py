@@ -0,0 +1,87 @@
+"""Benchmark the /companies response path: FastAPI response_model vs ModelResponse.
+
+Usage (from ``src/``)::
+
+    python -m backend.benchmarks.bench_serialization
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import TypeAdapter
+
+from backend.benchmarks.fake_client import make_company_rows
+from backend.core import responses
+from backend.core.responses import ModelResponse
+from backend.schemas.company import CompanyListResponse
+from backend.services.company_service import to_company_reads
+
+SIZES = (20, 100, 10_000)
+
+_field = create_model_field("Response", CompanyListResponse, mode="serialization")
+_adapter = TypeAdapter(CompanyListResponse)
+
+
+def _build(rows: list[dict[str, Any]]) -> CompanyListResponse:
+    """Validate rows once, as the service layer does."""
+    return CompanyListResponse(
+        items=to_company_reads(rows),
+        total=len(rows),
+        page=1,
+        size=len(rows),
+        total_pages=1,
+    )
+
+
+def _response_model_legacy(response: CompanyListResponse) -> bytes:
+    """Re-validate, then jsonable_encoder + json.dumps (FastAPI < 0.120 style)."""
+    value, _ = _field.validate(response, {}, loc=("response",))
+    return json.dumps(jsonable_encoder(value)).encode()
+
+
+async def _response_model(response: CompanyListResponse) -> bytes:
+    """Current FastAPI path: re-validate against response_model, then dump JSON."""
+    return bytes(await serialize_response(field=_field, response_content=response, dump_json=True))
+
+
+def _model_response(response: CompanyListResponse) -> bytes:
+    """Fast path: no re-validation, pydantic-core straight to bytes.
+
+    The render memo is cleared first so every round pays for serialization.
+    """
+    responses._rendered.clear()
+    return bytes(ModelResponse(response, adapter=_adapter).body)
+
+
+async def _per_row_us(
+    fn: Callable[[CompanyListResponse], bytes | Awaitable[bytes]],
+    response: CompanyListResponse,
+) -> float:
+    rounds = max(3, 20_000 // len(response.items))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn(response)
+        if not isinstance(result, bytes):
+            await result
+    return (time.perf_counter() - start) / rounds / len(response.items) * 1e6
+
+
+async def main() -> None:
+    print(f"{'rows':>7} {'legacy':>10} {'resp_model':>11} {'ModelResp':>10}   (µs/row)")
+    for size in SIZES:
+        response = _build(make_company_rows(size))
+        print(
+            f"{size:>7} "
+            f"{await _per_row_us(_response_model_legacy, response):>10.2f} "
+            f"{await _per_row_us(_response_model, response):>11.2f} "
+            f"{await _per_row_us(_model_response, response):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
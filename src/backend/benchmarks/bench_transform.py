@@ -0,0 +1,65 @@
+"""Benchmark the batched company row transform against the per-row path.
+
+Usage (from ``src/``)::
+
+    python -m backend.benchmarks.bench_transform
+"""
+
+import time
+from typing import Any, Callable
+
+from backend.benchmarks.fake_client import make_company_rows
+from backend.schemas.company import CompanyRead
+from backend.services.company_service import _format_location, to_company_reads
+
+SIZES = (20, 100, 10_000)
+
+
+def _to_company_read(raw: dict[str, Any]) -> CompanyRead:
+    """Previous per-row transform, kept here as the baseline."""
+    industry_name = ""
+    if raw.get("industry") and isinstance(raw["industry"], dict):
+        industry_name = raw["industry"].get("name", "")
+
+    location_str = ""
+    if raw.get("location") and isinstance(raw["location"], dict):
+        location_str = _format_location(raw["location"])
+
+    return CompanyRead(
+        id=raw["id"],
+        name=raw["name"],
+        industry=industry_name,
+        location=location_str,
+        products=raw.get("products", ""),
+        founding_year=raw.get("founding_year"),
+        total_funding=raw.get("total_funding"),
+        arr=raw.get("arr"),
+        valuation=raw.get("valuation"),
+    )
+
+
+def _per_row(rows: list[dict[str, Any]]) -> list[CompanyRead]:
+    return [_to_company_read(row) for row in rows]
+
+
+def _per_row_us(fn: Callable[[list[dict[str, Any]]], list[CompanyRead]], rows: list[Any]) -> float:
+    rounds = max(3, 50_000 // len(rows))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(rows)
+    return (time.perf_counter() - start) / rounds / len(rows) * 1e6
+
+
+def main() -> None:
+    print(f"{'rows':>7} {'per-row':>9} {'batched':>9}   (µs/row)")
+    for size in SIZES:
+        rows = make_company_rows(size)
+        assert _per_row(rows) == to_company_reads(rows)
+        print(
+            f"{size:>7} {_per_row_us(_per_row, rows):>9.2f} "
+            f"{_per_row_us(to_company_reads, rows):>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Fake Supabase client with configurable upstream latency for benchmarks."""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+
+class DelayedQuery:
+    """Chainable query builder that sleeps before returning canned data.
+
+    Attributes:
+        rows: Rows returned by ``execute``.
+        delay: Simulated upstream round-trip in seconds.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]], delay: float) -> None:
+        self.rows = rows
+        self.delay = delay
+        self._count: str | None = None
+        self._after_id: int | None = None
+        self._limit: int | None = None
+
+    def select(self, *args: Any, count: str | None = None, **kwargs: Any) -> "DelayedQuery":
+        """Record whether a count was requested and return the builder."""
+        self._count = count
+        return self
+
+    def gt(self, column: str, value: int) -> "DelayedQuery":
+        """Keep only rows whose id is greater than ``value`` (keyset pagination)."""
+        self._after_id = value
+        return self
+
+    def limit(self, value: int) -> "DelayedQuery":
+        """Return at most ``value`` rows."""
+        self._limit = value
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        """Accept any filter/modifier call (eq, range, order, ...) as a no-op."""
+        return lambda *args, **kwargs: self
+
+    async def execute(self) -> MagicMock:
+        """Sleep for the configured delay and return a response-like object."""
+        await asyncio.sleep(self.delay)
+        rows = self.rows
+        if self._after_id is not None:
+            rows = [row for row in rows if row["id"] > self._after_id]
+        response = MagicMock()
+        response.data = rows[: self._limit]
+        response.count = len(self.rows) if self._count else None
+        return response
+
+
+class DelayedClient:
+    """Stand-in for ``AsyncClient`` whose every query takes ``delay`` seconds."""
+
+    def __init__(self, rows: list[dict[str, Any]], delay: float) -> None:
+        self.rows = rows
+        self.delay = delay
+
+    def table(self, name: str) -> DelayedQuery:
+        """Return a delayed query builder for any table."""
+        return DelayedQuery(self.rows, self.delay)
+
+
+def make_company_rows(n: int) -> list[dict[str, Any]]:
+    """Build ``n`` raw company rows shaped like the PostgREST response.
+
+    Args:
+        n: Number of rows to generate.
+
+    Returns:
+        List of raw company dictionaries with embedded relations.
+    """
+    return [
+        {
+            "id": i,
+            "name": f"Company {i}",
+            "products": "Software",
+            "founding_year": 2000 + i % 25,
+            "total_funding": 1_000_000 * (i % 500),
+            "arr": 100_000 * (i % 700),
+            "valuation": 10_000_000 * (i % 900),
+            "employees": 10 + i % 5000,
+            "g2_rating": round(3 + (i % 20) / 10, 1),
+            "industry_id": 1 + i % 40,
+            "location_id": 1 + i % 60,
+            "industry": {"name": f"Industry {1 + i % 40}"},
+            "location": {
+                "city": f"City {1 + i % 60}",
+                "state": None if i % 3 else "CA",
+                "country": "USA",
+            },
+        }
+        for i in range(1, n + 1)
+    ]
@@ -0,0 +1,280 @@
+"""In-process caching primitives for slow-changing upstream data."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, Protocol, TypeVar
+
+from supabase._async.client import AsyncClient
+
+from backend.core.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+class RefreshableCache(Protocol):
+    """Interface shared by caches that can be registered for refresh."""
+
+    name: str
+
+    async def refresh(self, client: AsyncClient) -> Any: ...
+
+    def invalidate(self) -> None: ...
+
+
+C = TypeVar("C", bound=RefreshableCache)
+
+
+class TTLCache(Generic[T]):
+    """Single-value cache with a TTL and a stale-on-error fallback.
+
+    The value is produced by ``loader``. A fresh value is served from memory;
+    an expired or missing value is reloaded. If reloading fails and a previous
+    value exists, the stale value is served instead of raising.
+
+    Attributes:
+        name: Identifier used by the registry and the admin endpoint.
+        ttl: Seconds a loaded value stays fresh.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[AsyncClient], Awaitable[T]],
+        *,
+        ttl: float,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self._loader = loader
+        self._value: T | None = None
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether a value is cached and younger than the TTL."""
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    async def get(self, client: AsyncClient) -> T:
+        """Return the cached value, reloading it if expired.
+
+        Args:
+            client: Async Supabase client used when the value must be reloaded.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        if self.is_fresh:
+            return self._value  # type: ignore[return-value]
+
+        async with self._lock:
+            # Another waiter may have refreshed while we were queued.
+            if self.is_fresh:
+                return self._value  # type: ignore[return-value]
+            return await self._load(client)
+
+    async def refresh(self, client: AsyncClient) -> T:
+        """Reload the value regardless of its age.
+
+        Args:
+            client: Async Supabase client used to reload the value.
+
+        Returns:
+            The freshly loaded value, or the stale one if the reload failed.
+        """
+        async with self._lock:
+            return await self._load(client)
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next ``get`` goes upstream."""
+        self._value = None
+        self._loaded_at = None
+
+    async def _load(self, client: AsyncClient) -> T:
+        """Run the loader, falling back to the stale value on failure."""
+        try:
+            value = await self._loader(client)
+        except Exception:
+            if self._loaded_at is None:
+                raise
+            logger.warning("Refreshing cache %r failed, serving stale data", self.name)
+            return self._value  # type: ignore[return-value]
+
+        self._value = value
+        self._loaded_at = time.monotonic()
+        return value
+
+
+class KeyedTTLCache(Generic[K, T]):
+    """Bounded per-key cache with a TTL and a stale-on-error fallback.
+
+    Each key is loaded independently with ``loader(client, key)``. The least
+    recently used key is evicted once ``max_size`` keys are stored.
+
+    Attributes:
+        name: Identifier used by the registry and the admin endpoint.
+        ttl: Seconds a loaded value stays fresh.
+        max_size: Maximum number of keys kept in memory.
+        reload_on_refresh: Whether ``refresh`` reloads every cached key; when
+            False it only purges expired keys, which are reloaded on demand.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[AsyncClient, K], Awaitable[T]],
+        *,
+        ttl: float,
+        max_size: int,
+        reload_on_refresh: bool = True,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self.reload_on_refresh = reload_on_refresh
+        self._loader = loader
+        self._entries: OrderedDict[K, tuple[T, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, client: AsyncClient, key: K) -> T:
+        """Return the cached value for ``key``, reloading it if expired.
+
+        Args:
+            client: Async Supabase client used when the value must be reloaded.
+            key: Cache key.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if time.monotonic() - entry[1] < self.ttl:
+                return entry[0]
+        return await self._load(client, key)
+
+    async def refresh(self, client: AsyncClient) -> None:
+        """Reload every cached key regardless of its age, or purge expired ones.
+
+        With ``reload_on_refresh`` disabled nothing goes upstream: expired
+        keys are dropped so memory is not held by entries that can no
+        longer be served.
+
+        Args:
+            client: Async Supabase client used to reload the values.
+        """
+        if not self.reload_on_refresh:
+            now = time.monotonic()
+            for key, (_, loaded_at) in list(self._entries.items()):
+                if now - loaded_at >= self.ttl:
+                    del self._entries[key]
+            return
+
+        for key in list(self._entries):
+            await self._load(client, key)
+
+    def invalidate(self) -> None:
+        """Drop every cached key so the next ``get`` goes upstream."""
+        self._entries.clear()
+
+    def discard(self, key: K) -> bool:
+        """Drop one cached key so its next ``get`` goes upstream.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Whether the key was cached.
+        """
+        return self._entries.pop(key, None) is not None
+
+    async def _load(self, client: AsyncClient, key: K) -> T:
+        """Run the loader for ``key``, falling back to the stale value on failure."""
+        try:
+            value = await self._loader(client, key)
+        except Exception:
+            entry = self._entries.get(key)
+            if entry is None:
+                raise
+            logger.warning("Refreshing %r in cache %r failed, serving stale data", key, self.name)
+            return entry[0]
+
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return value
+
+
+_registry: dict[str, RefreshableCache] = {}
+
+
+def register(cache: C) -> C:
+    """Register a cache for background refresh and admin invalidation.
+
+    Args:
+        cache: Cache instance to register under its name.
+
+    Returns:
+        The same cache, so it can be used at module level assignment.
+    """
+    _registry[cache.name] = cache
+    return cache
+
+
+def get_registered() -> dict[str, RefreshableCache]:
+    """Return all registered caches keyed by name."""
+    return dict(_registry)
+
+
+def get_stats() -> dict[str, dict[str, int]]:
+    """Return counters of every registered cache that keeps statistics."""
+    return {
+        name: registered.stats()
+        for name, registered in _registry.items()
+        if isinstance(registered, ResponseCache)
+    }
+
+
+def invalidate(name: str | None = None) -> list[str]:
+    """Invalidate one registered cache, or all of them.
+
+    Args:
+        name: Cache name to invalidate. All caches when None.
+
+    Returns:
+        Names of the invalidated caches.
+
+    Raises:
+        KeyError: If ``name`` is not a registered cache.
+    """
+    names = [name] if name is not None else list(_registry)
+    for cache_name in names:
+        _registry[cache_name].invalidate()
+    return names
+
+
+async def refresh_periodically(client: AsyncClient, interval: float) -> None:
+    """Refresh every registered cache forever, once per ``interval`` seconds.
+
+    Intended to run as a background task started from the application
+    lifespan. Failures are logged and the previous values are kept.
+
+    Args:
+        client: Async Supabase client used for the refresh queries.
+        interval: Seconds to wait between refresh rounds.
+    """
+    while True:
+        for cache in list(_registry.values()):
+            try:
+                await cache.refresh(client)
+            except Exception:
+                logger.exception("Background refresh of cache %r failed", cache.name)
+        await asyncio.sleep(interval)
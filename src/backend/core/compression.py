@@ -0,0 +1,164 @@
+"""Response compression with a cache of precompressed bodies."""
+
+import gzip
+from collections import OrderedDict
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.http_cache import merge_vary
+from backend.core.settings import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional "compression" extra
+    brotli = None
+
+BROTLI_AVAILABLE = brotli is not None
+"""Whether the brotli package is installed and ``br`` can be served."""
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/")
+"""Content-type prefixes worth compressing; binary formats are left alone.
+
+Streamed bodies are never compressed, so the NDJSON export type is not listed.
+"""
+
+_compressed: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+"""Recently compressed bodies by (ETag, content-coding)."""
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """Pick the content-coding to use for a request.
+
+    Brotli is preferred when installed, then gzip; a coding is acceptable
+    unless the client gave it (or ``*``) a zero quality value.
+
+    Args:
+        accept_encoding: Value of the ``Accept-Encoding`` request header.
+
+    Returns:
+        ``"br"``, ``"gzip"``, or None to send the body uncompressed.
+    """
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding.strip():
+            qualities[coding.strip().lower()] = quality
+
+    for coding in ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",):
+        if qualities.get(coding, qualities.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+def _encode(body: bytes, encoding: str) -> bytes:
+    """Compress ``body`` with the given content-coding."""
+    if encoding == "br":
+        return bytes(brotli.compress(body, quality=settings.compression_brotli_quality))
+    return gzip.compress(body, compresslevel=settings.compression_gzip_level, mtime=0)
+
+
+def compress(body: bytes, encoding: str, etag: str | None = None) -> bytes:
+    """Compress a response body, reusing earlier results for the same ETag.
+
+    ``ModelResponse`` ETags are hashes of the body, so a tagged body is
+    compressed once per coding and later requests for the same data are
+    served from memory.
+
+    Args:
+        body: Uncompressed response body.
+        encoding: ``"br"`` or ``"gzip"``.
+        etag: ETag identifying ``body``; untagged bodies are not cached.
+
+    Returns:
+        The compressed body.
+    """
+    if etag is None:
+        return _encode(body, encoding)
+
+    key = (etag, encoding)
+    compressed = _compressed.get(key)
+    if compressed is not None:
+        _compressed.move_to_end(key)
+        return compressed
+
+    compressed = _encode(body, encoding)
+    _compressed[key] = compressed
+    while len(_compressed) > settings.compression_cache_size:
+        _compressed.popitem(last=False)
+    return compressed
+
+
+def _weaken(headers: MutableHeaders) -> None:
+    """Mark a strong ETag weak, since the coded bytes differ from the tagged ones."""
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["etag"] = f"W/{etag}"
+
+
+def _is_compressible(headers: MutableHeaders, body: bytes) -> bool:
+    """Whether a complete response body should be compressed."""
+    return (
+        len(body) >= settings.compression_min_size
+        and "content-encoding" not in headers
+        and headers.get("content-type", "").startswith(_COMPRESSIBLE_TYPES)
+    )
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with brotli or gzip.
+
+    Only bodies sent in one piece and at least
+    ``settings.compression_min_size`` bytes long are compressed; streamed
+    NDJSON and CSV exports go out uncompressed. Whenever a coding was negotiated the
+    ETag is made weak, since compressed bytes differ from the identity
+    encoding the strong tag was computed for; weakening every such
+    response, 304s and bodies below the size threshold included, keeps the
+    validator of a 200 and its revalidation identical. Weak tags still
+    match ``If-None-Match``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        pending_start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal pending_start
+            if message["type"] == "http.response.start":
+                pending_start = message
+                return
+            if pending_start is None:
+                await send(message)
+                return
+
+            start, pending_start = pending_start, None
+            headers = MutableHeaders(scope=start)
+            body = message.get("body", b"")
+            if not message.get("more_body", False) and _is_compressible(headers, body):
+                message = {**message, "body": compress(body, encoding, headers.get("etag"))}
+                headers["content-encoding"] = encoding
+                headers["content-length"] = str(len(message["body"]))
+                headers["vary"] = merge_vary(headers.get("vary"), "Accept-Encoding")
+            _weaken(headers)
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,48 @@
+"""Opaque cursor encoding for keyset pagination."""
+
+import base64
+import json
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(position: dict[str, Any]) -> str:
+    """Encode a keyset position into an opaque URL-safe cursor.
+
+    Args:
+        position: Keyset values of the last row returned, e.g. ``{"id": 42}``.
+
+    Returns:
+        URL-safe base64 string without padding.
+    """
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Opaque cursor string received from a client.
+
+    Returns:
+        The keyset position stored in the cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or lacks an integer id.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded))
+    except ValueError as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+    if not isinstance(position, dict):
+        raise InvalidCursorError("Malformed cursor")
+    cursor_id = position.get("id")
+    if not isinstance(cursor_id, int) or isinstance(cursor_id, bool):
+        raise InvalidCursorError("Malformed cursor")
+    return position
@@ -0,0 +1,119 @@
+"""HTTP caching: conditional GET and per-route Cache-Control/Vary headers."""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.settings import settings
+
+_CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+_NOT_MODIFIED_HEADERS = frozenset(
+    {
+        "cache-control",
+        "etag",
+        "vary",
+        "expires",
+        "date",
+        "access-control-allow-origin",
+        "access-control-allow-credentials",
+        "access-control-expose-headers",
+    }
+)
+"""Headers a 304 repeats from the 200 it replaces (RFC 9110 §15.4.5, plus CORS)."""
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an entity tag.
+
+    Uses the weak comparison required for ``If-None-Match``, so ``W/``
+    prefixes are ignored on both sides.
+
+    Args:
+        if_none_match: Value of the request header.
+        etag: Entity tag of the current representation.
+
+    Returns:
+        Whether the client already has the current representation.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in if_none_match.split(","))
+
+
+def _route_name(scope: Scope) -> str:
+    """Name of the matched route (its endpoint function name); empty if unmatched."""
+    return getattr(scope.get("route"), "name", "")
+
+
+def merge_vary(current: str | None, extra: str) -> str:
+    """Add ``extra`` fields to a ``Vary`` header without duplicating any."""
+    fields = [field.strip() for field in (current or "").split(",") if field.strip()]
+    known = {field.lower() for field in fields}
+    fields += [
+        field.strip()
+        for field in extra.split(",")
+        if field.strip() and field.strip().lower() not in known
+    ]
+    return ", ".join(fields)
+
+
+class HTTPCacheMiddleware:
+    """ASGI middleware adding HTTP caching to read endpoints.
+
+    For GET and HEAD requests it sets ``Cache-Control`` and ``Vary`` from
+    ``settings.http_cache_control`` / ``settings.http_vary`` (keyed by route
+    name, with a default for other routes), and answers with an empty
+    ``304 Not Modified`` when ``If-None-Match`` matches the response
+    ``ETag``. A ``Cache-Control`` set by the route is kept and ``Vary``
+    fields are added to any the route or CORS already set.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in _CACHEABLE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        not_modified = False
+
+        async def send_with_caching(message: Message) -> None:
+            nonlocal not_modified
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if message["status"] == 200:
+                    name = _route_name(scope)
+                    headers.setdefault(
+                        "cache-control",
+                        settings.http_cache_control.get(name, settings.http_cache_control_default),
+                    )
+                    vary = settings.http_vary.get(name, settings.http_vary_default)
+                    if vary:
+                        headers["vary"] = merge_vary(headers.get("vary"), vary)
+                    etag = headers.get("etag")
+                    not_modified = bool(
+                        if_none_match and etag and etag_matches(if_none_match, etag)
+                    )
+                if not_modified:
+                    await send(
+                        {
+                            "type": "http.response.start",
+                            "status": 304,
+                            "headers": [
+                                (header, value)
+                                for header, value in headers.raw
+                                if header.decode("latin-1") in _NOT_MODIFIED_HEADERS
+                            ],
+                        }
+                    )
+                    return
+            elif not_modified:
+                if not message.get("more_body", False):
+                    await send({"type": "http.response.body", "body": b""})
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_with_caching)
@@ -0,0 +1,144 @@
+"""Bounded response cache with stale-while-revalidate semantics."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from supabase._async.client import AsyncClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+class ResponseCache(Generic[K, T]):
+    """Bounded LRU response cache with stale-while-revalidate semantics.
+
+    Within ``ttl`` an entry is served as a hit. Up to ``ttl + stale_ttl`` it is
+    still served immediately while a background task revalidates it. Older or
+    missing entries are loaded inline; if that load fails, any previous entry
+    is served instead (stale-if-error).
+
+    Attributes:
+        name: Identifier used by the registry and the admin endpoint.
+        ttl: Seconds an entry is served without revalidation.
+        stale_ttl: Extra seconds an expired entry may be served while revalidating.
+        max_size: Maximum number of entries kept in memory.
+        hits: Requests served from a fresh entry.
+        stale_hits: Requests served from a stale entry.
+        misses: Requests that had to wait for the loader.
+        errors: Loader failures, inline or in the background.
+    """
+
+    def __init__(self, name: str, *, ttl: float, stale_ttl: float, max_size: int) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._entries: OrderedDict[K, tuple[T, float]] = OrderedDict()
+        self._revalidating: dict[K, asyncio.Task[None]] = {}
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached response for ``key`` or produce it with ``loader``.
+
+        Args:
+            key: Cache key identifying the request parameters.
+            loader: Zero-argument coroutine function producing the response.
+
+        Returns:
+            The cached, stale or freshly loaded response.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            age = time.monotonic() - entry[1]
+            if age < self.ttl:
+                self.hits += 1
+                return entry[0]
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._revalidate(key, loader)
+                return entry[0]
+
+        self.misses += 1
+        generation = self._generation
+        try:
+            value = await loader()
+        except Exception:
+            self.errors += 1
+            if entry is None:
+                raise
+            logger.warning("Loading %r in cache %r failed, serving stale data", key, self.name)
+            return entry[0]
+
+        self._store(key, value, generation)
+        return value
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "size": len(self._entries),
+        }
+
+    async def refresh(self, client: AsyncClient) -> None:
+        """Purge entries that are too old to be served even as stale.
+
+        Entries are revalidated on demand, so the periodic refresh only keeps
+        memory bounded by expired entries.
+
+        Args:
+            client: Unused; present for the registry interface.
+        """
+        now = time.monotonic()
+        for key, (_, stored_at) in list(self._entries.items()):
+            if now - stored_at >= self.ttl + self.stale_ttl:
+                del self._entries[key]
+
+    def invalidate(self) -> None:
+        """Drop every entry so the next request goes upstream."""
+        self._entries.clear()
+        self._generation += 1
+
+    def _store(self, key: K, value: T, generation: int) -> None:
+        """Store ``value`` under ``key`` and evict the least recently used entries.
+
+        Values loaded before the last ``invalidate`` are discarded.
+        """
+        if generation != self._generation:
+            return
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _revalidate(self, key: K, loader: Callable[[], Awaitable[T]]) -> None:
+        """Start a background reload of ``key`` unless one is already running."""
+        if key in self._revalidating:
+            return
+        generation = self._generation
+
+        async def _run() -> None:
+            try:
+                self._store(key, await loader(), generation)
+            except Exception:
+                self.errors += 1
+                logger.warning("Revalidating %r in cache %r failed", key, self.name)
+            finally:
+                self._revalidating.pop(key, None)
+
+        self._revalidating[key] = asyncio.create_task(_run())
@@ -0,0 +1,142 @@
+"""Response classes for returning already-validated Pydantic data."""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Mapping, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from backend.core.settings import settings
+
+T = TypeVar("T")
+
+_rendered: OrderedDict[tuple[int, int, str], tuple[Any, bytes, str]] = OrderedDict()
+"""Recently rendered bodies and ETags by (content, adapter, exclude) identity."""
+
+
+def _etag(body: bytes) -> str:
+    """Build a strong entity tag from a hash of the response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def render(
+    content: Any, adapter: TypeAdapter[Any], exclude: Any = None, *, memoize: bool = True
+) -> tuple[bytes, str]:
+    """Serialize ``content`` and tag it, reusing the bytes of recent renders.
+
+    Services hand out the same cached objects until their data changes, so
+    renders are memoized by object identity: repeated requests for cached
+    data skip serialization and hashing entirely. The memo keeps a reference
+    to ``content``, so an id cannot be reused while its entry is alive.
+    Content built anew for every request is rendered with ``memoize=False``
+    so its one-off entries do not evict reusable ones.
+
+    Args:
+        content: Validated model instance(s) matching the adapter type.
+        adapter: TypeAdapter for the response type, created once per route.
+        exclude: Optional pydantic exclude specification.
+        memoize: Whether to look up and store the render in the memo.
+
+    Returns:
+        The JSON body and its ETag.
+    """
+    if not memoize:
+        body = adapter.dump_json(content, exclude=exclude)
+        return body, _etag(body)
+
+    key = (id(content), id(adapter), repr(exclude))
+    entry = _rendered.get(key)
+    if entry is not None and entry[0] is content:
+        _rendered.move_to_end(key)
+        return entry[1], entry[2]
+
+    body = adapter.dump_json(content, exclude=exclude)
+    etag = _etag(body)
+    _rendered[key] = (content, body, etag)
+    while len(_rendered) > settings.response_render_cache_size:
+        _rendered.popitem(last=False)
+    return body, etag
+
+
+class ComposedCache(Generic[T]):
+    """Bounded memo of response objects composed from other cached objects.
+
+    ``render`` memoizes by object identity, so a service that builds a new
+    response object from cached parts on every call would be serialized
+    and hashed again even when nothing changed, conditional requests
+    included. Keyed by the identity of the parts plus the request
+    parameters, an unchanged composition returns the very same object.
+    Entries keep references to their parts, so an id cannot be reused
+    while its entry is alive.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[object, ...], tuple[tuple[object, ...], T]] = OrderedDict()
+
+    def get(self, parts: tuple[object, ...], params: Hashable, build: Callable[[], T]) -> T:
+        """Return the object composed from ``parts``, building it on first use.
+
+        Args:
+            parts: Cached objects the response is built from.
+            params: Request parameters that shape the response beyond ``parts``.
+            build: Zero-argument function composing the response.
+
+        Returns:
+            The memoized or freshly built response object.
+        """
+        key = (*map(id, parts), params)
+        entry = self._entries.get(key)
+        if entry is not None and all(a is b for a, b in zip(entry[0], parts, strict=True)):
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        value = build()
+        self._entries[key] = (parts, value)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every memoized object."""
+        self._entries.clear()
+
+
+class ModelResponse(Response):
+    """JSON response that serializes validated data straight to bytes.
+
+    Returning a Response from a route bypasses FastAPI's ``response_model``
+    handling, so data validated once in the service layer is not validated
+    again. The body is encoded by pydantic-core through ``adapter`` without
+    going through ``jsonable_encoder``. Routes keep declaring
+    ``response_model`` so the OpenAPI schema is unchanged.
+
+    Every response carries an ``ETag`` hashed from its body, which
+    ``HTTPCacheMiddleware`` uses to answer conditional requests.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        *,
+        adapter: TypeAdapter[Any],
+        exclude: Any = None,
+        memoize: bool = True,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Serialize ``content`` with ``adapter`` and build the response.
+
+        Args:
+            content: Validated model instance(s) matching the adapter type.
+            adapter: TypeAdapter for the response type, created once per route.
+            exclude: Optional pydantic exclude specification.
+            memoize: False for content built anew per request, see ``render``.
+            status_code: HTTP status code.
+            headers: Optional extra response headers.
+        """
+        body, etag = render(content, adapter, exclude, memoize=memoize)
+        super().__init__(body, status_code=status_code, headers={"ETag": etag, **(headers or {})})
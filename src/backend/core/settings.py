@@ -1,5 +1,7 @@
 """Application configuration settings."""
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,6 +18,45 @@ class Settings(BaseSettings):
     cors_origins: str = "http://localhost:3000"
     supabase_url: str = ""
     supabase_key: str = ""
+    supabase_pool_max_connections: int = 100
+    supabase_pool_max_keepalive: int = 20
+    supabase_keepalive_expiry: float = 30.0
+    supabase_timeout: float = 120.0
+    reference_cache_ttl: float = 3600.0
+    reference_cache_refresh_interval: float = 600.0
+    admin_token: str = ""
+    company_count_strategy: Literal["exact", "planned", "estimated"] = "exact"
+    company_count_cache_ttl: float = 300.0
+    company_count_cache_size: int = 512
+    company_response_cache_ttl: float = 30.0
+    company_response_cache_stale_ttl: float = 300.0
+    company_response_cache_size: int = 1024
+    company_detail_cache_ttl: float = 300.0
+    company_detail_cache_size: int = 4096
+    export_chunk_size: int = 1000
+    company_backend: Literal["postgrest", "snapshot"] = "postgrest"
+    company_snapshot_ttl: float = 900.0
+    company_aggregates_check_interval: float = 60.0
+    company_facets_check_interval: float = 60.0
+    company_search_check_interval: float = 30.0
+    response_render_cache_size: int = 256
+    http_cache_control_default: str = "no-cache"
+    http_cache_control: dict[str, str] = {
+        "health_check": "no-store",
+        "list_industries": "public, max-age=300, stale-while-revalidate=3600",
+        "list_locations": "public, max-age=300, stale-while-revalidate=3600",
+        "list_investors": "public, max-age=300, stale-while-revalidate=3600",
+        "list_companies": "public, max-age=30, stale-while-revalidate=300",
+        "get_dashboard": "public, max-age=30, stale-while-revalidate=300",
+        "search_companies": "public, max-age=30, stale-while-revalidate=300",
+        "cache_stats": "no-store",
+    }
+    http_vary_default: str = "Accept-Encoding"
+    http_vary: dict[str, str] = {}
+    compression_min_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5
+    compression_cache_size: int = 256
 
 
 settings = Settings()
@@ -0,0 +1,68 @@
+"""Coalescing of identical concurrent upstream calls (single-flight)."""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Hashable, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers with the same key.
+
+    The first caller for a key starts the call; callers arriving while it is
+    still running await the same future instead of starting their own. Once
+    the call finishes the key is forgotten, so later callers start afresh.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` once for all concurrent callers sharing ``key``.
+
+        Args:
+            key: Identifies calls that are interchangeable.
+            fn: Zero-argument coroutine function performing the call.
+
+        Returns:
+            The result of the shared call.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        # Shield so one cancelled caller does not cancel the call for the others.
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Drop ``key`` once its call is done, unless a newer call replaced it."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+
+def coalesce(fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+    """Decorate a coroutine function so identical concurrent calls are coalesced.
+
+    Calls are identical when their positional and keyword arguments are equal.
+    All arguments must be hashable; the Supabase client is keyed by identity.
+
+    Args:
+        fn: Coroutine function to wrap.
+
+    Returns:
+        Wrapped coroutine function with the same signature.
+    """
+    flight = SingleFlight()
+
+    @functools.wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        key = (args, tuple(sorted(kwargs.items())))
+        return await flight.do(key, lambda: fn(*args, **kwargs))
+
+    return wrapper
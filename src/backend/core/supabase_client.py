@@ -1,29 +1,83 @@
-"""Supabase async client configuration and dependency injection."""
+"""Supabase async client configuration and dependency injection.
+
+A single AsyncClient is shared by the whole process. It is created in the
+application lifespan and backed by one pooled ``httpx.AsyncClient`` so that
+requests reuse open upstream connections instead of paying the connection
+setup cost every time.
+"""
 
 from typing import AsyncGenerator
 
+import httpx
+from supabase import AsyncClientOptions
 from supabase._async.client import AsyncClient, create_client
 
 from backend.core.settings import settings
 
+_client: AsyncClient | None = None
+_http_client: httpx.AsyncClient | None = None
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all Supabase requests.
 
-async def _create_supabase_client() -> AsyncClient:
+    Returns:
+        httpx.AsyncClient: HTTP client with pool limits from settings.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.supabase_pool_max_connections,
+            max_keepalive_connections=settings.supabase_pool_max_keepalive,
+            keepalive_expiry=settings.supabase_keepalive_expiry,
+        ),
+        timeout=settings.supabase_timeout,
+    )
+
+
+async def _create_supabase_client(http_client: httpx.AsyncClient) -> AsyncClient:
     """Create and return an async Supabase client instance.
 
+    Args:
+        http_client: Pooled HTTP client used for upstream requests.
+
     Returns:
         AsyncClient: Configured Supabase async client.
     """
     return await create_client(
         supabase_url=settings.supabase_url,
         supabase_key=settings.supabase_key,
+        options=AsyncClientOptions(httpx_client=http_client),
     )
 
 
+async def init_supabase() -> AsyncClient:
+    """Create the shared Supabase client if it does not exist yet.
+
+    Returns:
+        AsyncClient: The process-wide Supabase client.
+    """
+    global _client, _http_client
+
+    if _client is None:
+        _http_client = _create_http_client()
+        _client = await _create_supabase_client(_http_client)
+    return _client
+
+
+async def close_supabase() -> None:
+    """Close the shared Supabase client and release pooled connections."""
+    global _client, _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+    _client = None
+    _http_client = None
+
+
 async def get_supabase() -> AsyncGenerator[AsyncClient, None]:
-    """FastAPI dependency that provides an async Supabase client.
+    """FastAPI dependency that provides the shared async Supabase client.
 
     Yields:
         AsyncClient: Supabase async client for use in request handlers.
     """
-    client = await _create_supabase_client()
-    yield client
+    yield await init_supabase()
@@ -0,0 +1,128 @@
+"""Single-value cache rebuilt when a cheap version probe changes."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from supabase._async.client import AsyncClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+V = TypeVar("V", bound=Hashable)
+
+
+class VersionedCache(Generic[T, V]):
+    """Single-value cache that is rebuilt only when the upstream data changes.
+
+    ``version_loader`` is a cheap probe returning a fingerprint of the data
+    (e.g. row count and latest update time). It runs at most once per
+    ``check_interval``; the expensive ``loader`` only runs when the probed
+    version differs from the one the cached value was built from. If the
+    probe or the reload fails and a previous value exists, it is served.
+
+    An optional ``updater`` applies a change incrementally instead:
+    ``updater(client, value, old_version, new_version)`` returns the
+    updated value, or None when the change cannot be applied and a full
+    reload is needed.
+
+    Attributes:
+        name: Identifier used by the registry and the admin endpoint.
+        check_interval: Seconds between two version probes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[AsyncClient], Awaitable[T]],
+        version_loader: Callable[[AsyncClient], Awaitable[V]],
+        *,
+        check_interval: float,
+        updater: Callable[[AsyncClient, T, V, V], Awaitable[T | None]] | None = None,
+    ) -> None:
+        self.name = name
+        self.check_interval = check_interval
+        self._loader = loader
+        self._version_loader = version_loader
+        self._updater = updater
+        self._value: T | None = None
+        self._version: V | None = None
+        self._loaded = False
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether a value is cached and its version was checked recently."""
+        return (
+            self._loaded
+            and self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.check_interval
+        )
+
+    async def get(self, client: AsyncClient) -> T:
+        """Return the cached value, rebuilding it if the data version changed.
+
+        Args:
+            client: Async Supabase client used to probe and reload.
+
+        Returns:
+            The cached or freshly built value.
+        """
+        if self.is_fresh:
+            return self._value  # type: ignore[return-value]
+
+        async with self._lock:
+            if self.is_fresh:
+                return self._value  # type: ignore[return-value]
+            return await self._sync(client)
+
+    async def refresh(self, client: AsyncClient) -> T | None:
+        """Probe the data version now and rebuild the value if it changed.
+
+        Nothing is built before the first ``get``, so unused values never
+        cost a full load.
+
+        Args:
+            client: Async Supabase client used to probe and reload.
+
+        Returns:
+            The current value, or None if nothing is cached yet.
+        """
+        if not self._loaded:
+            return None
+        async with self._lock:
+            return await self._sync(client)
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next ``get`` rebuilds it."""
+        self._value = None
+        self._version = None
+        self._loaded = False
+        self._checked_at = None
+
+    async def _sync(self, client: AsyncClient) -> T:
+        """Probe the version and reload on change, serving stale data on failure."""
+        try:
+            version = await self._version_loader(client)
+            if not self._loaded or version != self._version:
+                value = None
+                if self._loaded and self._updater is not None:
+                    value = await self._updater(
+                        client,
+                        self._value,  # type: ignore[arg-type]
+                        self._version,  # type: ignore[arg-type]
+                        version,
+                    )
+                self._value = await self._loader(client) if value is None else value
+                self._version = version
+                self._loaded = True
+        except Exception:
+            if not self._loaded:
+                raise
+            logger.warning("Refreshing cache %r failed, serving stale data", self.name)
+            return self._value  # type: ignore[return-value]
+
+        self._checked_at = time.monotonic()
+        return self._value  # type: ignore[return-value]
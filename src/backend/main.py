@@ -1,16 +1,25 @@
 """Top SaaS Backend - Main Application."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.api.admin import router as admin_router
 from backend.api.companies import router as companies_router
+from backend.api.dashboard import router as dashboard_router
 from backend.api.health import router as health_router
 from backend.api.industries import router as industries_router
+from backend.api.investors import router as investors_router
 from backend.api.locations import router as locations_router
+from backend.core import cache
+from backend.core.compression import CompressionMiddleware
+from backend.core.http_cache import HTTPCacheMiddleware
 from backend.core.settings import settings
+from backend.core.supabase_client import close_supabase, init_supabase
+from backend.repositories.company_snapshot import SNAPSHOT_AVAILABLE
 
 
 @asynccontextmanager
@@ -18,8 +27,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan events."""
     print(f"🚀 Starting {settings.app_name} v{settings.app_version}")
     print(f"📝 Environment: {settings.environment}")
+    if settings.company_backend == "snapshot" and not SNAPSHOT_AVAILABLE:
+        raise RuntimeError("COMPANY_BACKEND=snapshot requires the 'snapshot' extra (numpy)")
+    client = await init_supabase()
+    refresh_task = asyncio.create_task(
+        cache.refresh_periodically(client, settings.reference_cache_refresh_interval)
+    )
     yield
     print("👋 Shutting down...")
+    refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresh_task
+    await close_supabase()
 
 
 app = FastAPI(
@@ -37,8 +56,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Conditional GET and Cache-Control/Vary headers
+app.add_middleware(HTTPCacheMiddleware)
+
+# Compression wraps the conditional GET handling so 304s are never compressed
+app.add_middleware(CompressionMiddleware)
+
 # Register routers
 app.include_router(health_router, prefix="/api/v1", tags=["health"])
 app.include_router(companies_router, prefix="/api/v1", tags=["companies"])
 app.include_router(industries_router, prefix="/api/v1", tags=["industries"])
 app.include_router(locations_router, prefix="/api/v1", tags=["locations"])
+app.include_router(investors_router, prefix="/api/v1", tags=["investors"])
+app.include_router(dashboard_router, prefix="/api/v1", tags=["dashboard"])
+app.include_router(admin_router, prefix="/api/v1", tags=["admin"])
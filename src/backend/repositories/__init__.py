@@ -1 +1,5 @@
-"""Repositories for data access via Supabase client."""
+"""Repositories for data access via Supabase client.
+
+Read functions are wrapped with ``core.singleflight.coalesce``: concurrent
+calls with identical arguments share a single upstream query.
+"""
@@ -1,20 +1,197 @@
 """Repository for company data access via Supabase."""
 
-from typing import Any, cast
+from typing import Any, AsyncIterator, Literal, cast
 
 from supabase._async.client import AsyncClient
 
-COMPANY_SELECT = "*, industry(name), location(city, state, country)"
+from backend.core.singleflight import coalesce
+from backend.schemas.company import CompanyRanges, CompanySortKey, IdFilter, SortOrder
+
+CountMethod = Literal["exact", "planned", "estimated"]
+"""PostgREST count strategies: exact COUNT(*), planner estimate, or a hybrid."""
+
+COMPANY_COLUMNS: dict[str, str] = {
+    "id": "id",
+    "name": "name",
+    "industry": "industry_id, industry(name)",
+    "location": "location_id, location(city, state, country)",
+    "products": "products",
+    "founding_year": "founding_year",
+    "total_funding": "total_funding",
+    "arr": "arr",
+    "valuation": "valuation",
+    "employees": "employees",
+    "g2_rating": "g2_rating",
+    "investors": "investors:investor(id, name)",
+    "industry_id": "industry_id",
+    "location_id": "location_id",
+    "investor_ids": "investor_ids:company_investor(investor_id)",
+}
+"""Select fragment needed for each company field that can be projected."""
+
+LIST_FIELDS = (
+    "id",
+    "name",
+    "industry",
+    "location",
+    "products",
+    "founding_year",
+    "total_funding",
+    "arr",
+    "valuation",
+)
+"""Fields returned by the company list endpoint."""
+
+DETAIL_FIELDS = LIST_FIELDS + ("investors",)
+"""Fields returned by the company detail endpoint."""
+
+RANGE_BOUNDS: dict[str, tuple[str, Literal["gte", "lte"]]] = {
+    "min_arr": ("arr", "gte"),
+    "max_arr": ("arr", "lte"),
+    "min_valuation": ("valuation", "gte"),
+    "min_total_funding": ("total_funding", "gte"),
+    "founded_after": ("founding_year", "gte"),
+    "founded_before": ("founding_year", "lte"),
+}
+"""Column and inclusive comparison behind each ``CompanyRanges`` bound."""
+
+COMPANY_SELECT = ", ".join(COMPANY_COLUMNS[field] for field in LIST_FIELDS)
 """Select query with embedded relations for company table."""
 
 
+INVESTOR_FILTER_JOIN = "company_investor!inner()"
+"""Empty inner embed that restricts companies to those with a matching investor row."""
+
+
+def build_select(fields: tuple[str, ...] | None = None, *, investor_id: int | None = None) -> str:
+    """Build the select projection for a set of company fields.
+
+    ``investors`` embeds the many-to-many relation through
+    ``company_investor``, so a whole page and its investors come back from
+    one query. Filtering by investor adds an empty inner join on the
+    junction table that returns no columns.
+
+    Args:
+        fields: Field names to project, or None for the list endpoint fields.
+        investor_id: Investor filter of the query, if any.
+
+    Returns:
+        PostgREST select string containing only the needed columns.
+    """
+    select = COMPANY_SELECT if fields is None else ", ".join(COMPANY_COLUMNS[f] for f in fields)
+    if investor_id is not None:
+        select = f"{select}, {INVESTOR_FILTER_JOIN}"
+    return select
+
+
+def _apply_id_filter(query: Any, column: str, value: IdFilter | None) -> Any:
+    """Filter a foreign-key column by one ID (``eq``) or any of several (``in``)."""
+    if value is None:
+        return query
+    if isinstance(value, tuple):
+        return query.in_(column, value)
+    return query.eq(column, value)
+
+
+def _apply_filters(
+    query: Any,
+    *,
+    industry_id: IdFilter | None,
+    location_id: IdFilter | None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
+) -> Any:
+    """Apply the optional company filters to a PostgREST query builder.
+
+    The investor filter needs ``INVESTOR_FILTER_JOIN`` in the select, see
+    ``build_select``.
+
+    Args:
+        query: PostgREST query builder for the company table.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
+
+    Returns:
+        The query builder with filters applied.
+    """
+    query = _apply_id_filter(query, "industry_id", industry_id)
+    query = _apply_id_filter(query, "location_id", location_id)
+
+    if investor_id is not None:
+        query = query.eq("company_investor.investor_id", investor_id)
+
+    if ranges is not None:
+        for bound, (column, operator) in RANGE_BOUNDS.items():
+            value = getattr(ranges, bound)
+            if value is not None:
+                query = getattr(query, operator)(column, value)
+
+    return query
+
+
+def _apply_sort(query: Any, sort: CompanySortKey, order: SortOrder) -> Any:
+    """Order a query by a metric with NULLs last and id as the tie-breaker.
+
+    Args:
+        query: PostgREST query builder for the company table.
+        sort: Metric column to sort by.
+        order: Sort direction of the metric.
+
+    Returns:
+        The query builder with ordering applied.
+    """
+    return query.order(sort, desc=order == "desc", nullsfirst=False).order("id")
+
+
+def _apply_sorted_keyset(
+    query: Any,
+    *,
+    sort: CompanySortKey,
+    order: SortOrder,
+    after_id: int,
+    after_value: int | None,
+) -> Any:
+    """Keep only rows that come after ``(after_value, after_id)`` in sort order.
+
+    Mirrors ``_apply_sort``: rows with a later metric value, rows with the
+    same value and a greater id, then the NULL tail ordered by id.
+
+    Args:
+        query: PostgREST query builder for the company table.
+        sort: Metric column the query is sorted by.
+        order: Sort direction of the metric.
+        after_id: Id of the last row of the previous page.
+        after_value: Metric value of that row; None if it was NULL.
+
+    Returns:
+        The query builder with the keyset condition applied.
+    """
+    if after_value is None:
+        return query.is_(sort, "null").gt("id", after_id)
+
+    beyond = "lt" if order == "desc" else "gt"
+    return query.or_(
+        f"{sort}.{beyond}.{after_value},"
+        f"and({sort}.eq.{after_value},id.gt.{after_id}),"
+        f"{sort}.is.null"
+    )
+
+
+@coalesce
 async def get_all(
     client: AsyncClient,
     *,
-    industry_id: int | None = None,
-    location_id: int | None = None,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
     page: int = 1,
     size: int = 20,
+    fields: tuple[str, ...] | None = None,
+    sort: CompanySortKey | None = None,
+    order: SortOrder = "asc",
 ) -> list[dict[str, Any]]:
     """Fetch companies with optional filters and pagination.
 
@@ -23,21 +200,29 @@ async def get_all(
 
     Args:
         client: Async Supabase client instance.
-        industry_id: Optional industry ID to filter by.
-        location_id: Optional location ID to filter by.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
         page: Page number (1-based).
         size: Number of items per page.
+        fields: Optional API fields to project; all fields when None.
+        sort: Optional metric to sort by; unordered when None.
+        order: Sort direction of ``sort``.
 
     Returns:
         List of company records as dictionaries with embedded relations.
     """
-    query = client.table("company").select(COMPANY_SELECT)
-
-    if industry_id is not None:
-        query = query.eq("industry_id", industry_id)
-
-    if location_id is not None:
-        query = query.eq("location_id", location_id)
+    query = client.table("company").select(build_select(fields, investor_id=investor_id))
+    query = _apply_filters(
+        query,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        investor_id=investor_id,
+    )
+    if sort is not None:
+        query = _apply_sort(query, sort, order)
 
     start = (page - 1) * size
     end = start + size - 1
@@ -46,29 +231,259 @@ async def get_all(
     return cast(list[dict[str, Any]], response.data)
 
 
+@coalesce
+async def get_by_id(client: AsyncClient, company_id: int) -> dict[str, Any] | None:
+    """Fetch one company by primary key with its industry, location and investors.
+
+    Args:
+        client: Async Supabase client instance.
+        company_id: Company primary key.
+
+    Returns:
+        The company record with embedded relations, or None if it does not exist.
+    """
+    query = client.table("company").select(build_select(DETAIL_FIELDS))
+    response = await query.eq("id", company_id).limit(1).execute()
+    rows = cast(list[dict[str, Any]], response.data)
+    return rows[0] if rows else None
+
+
+@coalesce
+async def get_by_ids(client: AsyncClient, company_ids: tuple[int, ...]) -> list[dict[str, Any]]:
+    """Fetch several companies by primary key with one ``in`` query.
+
+    Args:
+        client: Async Supabase client instance.
+        company_ids: Company primary keys.
+
+    Returns:
+        The existing companies with embedded relations, in no particular order.
+    """
+    query = client.table("company").select(build_select(DETAIL_FIELDS))
+    response = await query.in_("id", company_ids).execute()
+    return cast(list[dict[str, Any]], response.data)
+
+
+@coalesce
+async def get_after(
+    client: AsyncClient,
+    *,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
+    after_id: int | None = None,
+    limit: int = 20,
+    fields: tuple[str, ...] | None = None,
+    sort: CompanySortKey | None = None,
+    order: SortOrder = "asc",
+    after_value: int | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch companies using keyset pagination ordered by id or by a metric.
+
+    Instead of an OFFSET scan, rows are selected with ``id > after_id`` so
+    every page costs the same index range scan regardless of its depth.
+    When sorted by a metric the keyset is ``(after_value, after_id)``.
+
+    Args:
+        client: Async Supabase client instance.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
+        after_id: Return only companies with an id greater than this one.
+        limit: Maximum number of rows to return.
+        fields: Optional API fields to project; all fields when None.
+        sort: Optional metric to sort by; id order when None.
+        order: Sort direction of ``sort``.
+        after_value: ``sort`` value of the row ``after_id`` refers to.
+
+    Returns:
+        List of company records as dictionaries with embedded relations.
+    """
+    query = client.table("company").select(build_select(fields, investor_id=investor_id))
+    query = _apply_filters(
+        query,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        investor_id=investor_id,
+    )
+
+    if sort is None:
+        if after_id is not None:
+            query = query.gt("id", after_id)
+        query = query.order("id")
+    else:
+        if after_id is not None:
+            query = _apply_sorted_keyset(
+                query, sort=sort, order=order, after_id=after_id, after_value=after_value
+            )
+        query = _apply_sort(query, sort, order)
+
+    response = await query.limit(limit).execute()
+    return cast(list[dict[str, Any]], response.data)
+
+
+async def iter_chunks(
+    client: AsyncClient,
+    *,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
+    chunk_size: int = 1000,
+    fields: tuple[str, ...] | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Walk every matching company in id order, one keyset chunk at a time.
+
+    Args:
+        client: Async Supabase client instance.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
+        chunk_size: Number of rows fetched per upstream query.
+        fields: Optional fields to project; list endpoint fields when None.
+
+    Yields:
+        Lists of company records, each at most ``chunk_size`` long.
+    """
+    after_id: int | None = None
+    while True:
+        raw_data = await get_after(
+            client,
+            industry_id=industry_id,
+            location_id=location_id,
+            ranges=ranges,
+            investor_id=investor_id,
+            after_id=after_id,
+            limit=chunk_size,
+            fields=fields,
+        )
+        if not raw_data:
+            return
+
+        yield raw_data
+
+        if len(raw_data) < chunk_size:
+            return
+        after_id = raw_data[-1]["id"]
+
+
+@coalesce
 async def count(
     client: AsyncClient,
     *,
-    industry_id: int | None = None,
-    location_id: int | None = None,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
+    count_method: CountMethod = "exact",
 ) -> int:
     """Count companies matching the given filters.
 
+    ``exact`` runs a full ``COUNT(*)``; ``planned`` uses the Postgres planner
+    estimate; ``estimated`` counts exactly for small results and falls back
+    to the planner estimate for large ones.
+
     Args:
         client: Async Supabase client instance.
-        industry_id: Optional industry ID to filter by.
-        location_id: Optional location ID to filter by.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
+        count_method: PostgREST count strategy.
 
     Returns:
         Total number of matching companies.
     """
-    query = client.table("company").select("*", count="exact", head=True)  # type: ignore
-
-    if industry_id is not None:
-        query = query.eq("industry_id", industry_id)
-
-    if location_id is not None:
-        query = query.eq("location_id", location_id)
+    select = "*" if investor_id is None else f"*, {INVESTOR_FILTER_JOIN}"
+    query = client.table("company").select(select, count=count_method, head=True)  # type: ignore
+    query = _apply_filters(
+        query,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        investor_id=investor_id,
+    )
 
     response = await query.execute()
     return response.count or 0
+
+
+@coalesce
+async def get_version(client: AsyncClient) -> tuple[int, str | None]:
+    """Return a cheap fingerprint of the company table.
+
+    Inserts and deletes change the row count and the ``updated_at`` trigger
+    moves the latest update time on every change, so the pair changes
+    whenever the table does. One indexed query returns both.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Row count and latest ``updated_at`` (None for an empty table).
+    """
+    query = client.table("company").select("updated_at", count="exact")  # type: ignore
+    response = await query.order("updated_at", desc=True).limit(1).execute()
+    rows = cast(list[dict[str, Any]], response.data)
+    return response.count or 0, rows[0]["updated_at"] if rows else None
+
+
+@coalesce
+async def get_investor_links_version(
+    client: AsyncClient,
+) -> tuple[int, tuple[int, int] | None]:
+    """Return a cheap fingerprint of the ``company_investor`` link table.
+
+    Links have no ``updated_at`` and changing them does not touch the
+    company row, so the probe pairs the row count with the highest
+    ``(company_id, investor_id)`` key. Adding or removing a link changes
+    the count unless another link is swapped in below the highest key in
+    the same round.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Row count and highest link key (None for an empty table).
+    """
+    links = client.table("company_investor")
+    query = links.select("company_id, investor_id", count="exact")  # type: ignore
+    response = (
+        await query.order("company_id", desc=True)
+        .order("investor_id", desc=True)
+        .limit(1)
+        .execute()
+    )
+    rows = cast(list[dict[str, Any]], response.data)
+    last = (rows[0]["company_id"], rows[0]["investor_id"]) if rows else None
+    return response.count or 0, last
+
+
+async def get_updated_since(
+    client: AsyncClient,
+    since: str,
+    *,
+    fields: tuple[str, ...] | None = None,
+    limit: int = 1000,
+) -> list[dict[str, Any]]:
+    """Fetch companies changed at or after a point in time, oldest change first.
+
+    The bound is inclusive, so a row updated in the same instant as the
+    previous fingerprint is not missed; callers apply rows idempotently.
+
+    Args:
+        client: Async Supabase client instance.
+        since: ``updated_at`` timestamp from a previous ``get_version``.
+        fields: Optional API fields to project; all list fields when None.
+        limit: Maximum number of rows to return.
+
+    Returns:
+        Up to ``limit`` changed company records with embedded relations.
+    """
+    query = client.table("company").select(build_select(fields))
+    response = await query.gte("updated_at", since).order("updated_at").limit(limit).execute()
+    return cast(list[dict[str, Any]], response.data)
@@ -0,0 +1,225 @@
+"""In-memory trigram index over company names and products.
+
+Answers fuzzy, typo-tolerant search in-process so search-as-you-type does
+not turn into an ``ilike`` scan per keystroke. Requires numpy (the
+``search`` extra).
+"""
+
+import bisect
+import unicodedata
+from typing import Any
+
+from backend.schemas.company import CompanyRead
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional "search" extra
+    np = None  # type: ignore[assignment]
+
+PRODUCT_WEIGHT = 0.6
+"""Weight of a full product match relative to an exact name match."""
+
+PREFIX_BONUS = 0.5
+"""Score added when the name starts with the query, so typeahead ranks well."""
+
+MIN_SCORE = 0.2
+"""Results scoring below this are considered noise and dropped."""
+
+_FIELDS = ("name", "products")
+"""Indexed text fields."""
+
+
+def normalize(text: str) -> str:
+    """Fold case and accents and keep only letters and digits as words.
+
+    Args:
+        text: Raw text.
+
+    Returns:
+        Lowercase ASCII-folded words separated by single spaces.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    folded = "".join(c if c.isalnum() else " " for c in decomposed if not unicodedata.combining(c))
+    return " ".join(folded.split())
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Split normalized text into the padded word trigrams used by pg_trgm.
+
+    Each word is padded with two leading spaces and one trailing space, so
+    word starts weigh more and one- or two-letter queries still match.
+
+    Args:
+        text: Output of ``normalize``.
+
+    Returns:
+        Distinct trigrams of all words.
+    """
+    grams: set[str] = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class CompanySearchIndex:
+    """Inverted trigram index of company names and products.
+
+    Every indexed company gets a position; postings map each trigram to the
+    positions containing it. A query counts shared trigrams for all
+    positions at once with ``np.bincount`` over its postings and ranks the
+    scores vectorized, so no Python code runs per company.
+
+    Names are scored by trigram similarity (shared / union, as pg_trgm
+    does) plus a prefix bonus; products by the share of query trigrams they
+    contain, weighted by ``PRODUCT_WEIGHT``. A company scores the best of
+    the two.
+
+    Updates are incremental: a changed company is removed from its old
+    postings and appended at a new position. Posting arrays are rebuilt
+    lazily, per trigram, the next time a query needs them.
+
+    Attributes:
+        generation: Incremented on every change, so results computed from
+            an earlier state can be told apart.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]], items: list[CompanyRead]) -> None:
+        """Index raw company rows.
+
+        Args:
+            rows: Raw company records with ``id``, ``name`` and ``products``.
+            items: Response objects for ``rows``, in the same order.
+        """
+        self._positions: dict[int, int] = {}
+        self._items: list[CompanyRead | None] = []
+        self._ids: list[int] = []
+        self._names: list[str] = []
+        self._grams: list[tuple[frozenset[str], frozenset[str]]] = []
+        self._sorted_names: list[tuple[str, int]] = []
+        self._postings: dict[tuple[str, str], set[int]] = {}
+        self._arrays: dict[tuple[str, str], Any] = {}
+        self._columns: tuple[Any, Any] | None = None
+        self.generation = 0
+        self.upsert(rows, items)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def dead_positions(self) -> int:
+        """Positions left behind by updated or removed companies."""
+        return len(self._items) - len(self._positions)
+
+    def upsert(self, rows: list[dict[str, Any]], items: list[CompanyRead]) -> None:
+        """Add companies or replace the indexed text of existing ones.
+
+        Args:
+            rows: Raw company records with ``id``, ``name`` and ``products``.
+            items: Response objects for ``rows``, in the same order.
+        """
+        sorted_names = []
+        for row, item in zip(rows, items, strict=True):
+            self.remove(row["id"])
+            position = len(self._items)
+            name = normalize(row.get("name") or "")
+            grams = (trigrams(name), trigrams(normalize(row.get("products") or "")))
+            for field, field_grams in zip(_FIELDS, grams, strict=True):
+                for gram in field_grams:
+                    self._postings.setdefault((field, gram), set()).add(position)
+                    self._arrays.pop((field, gram), None)
+            self._positions[row["id"]] = position
+            self._items.append(item)
+            self._ids.append(row["id"])
+            self._names.append(name)
+            self._grams.append(grams)
+            sorted_names.append((name, position))
+
+        if len(sorted_names) > len(self._sorted_names):
+            self._sorted_names = sorted(self._sorted_names + sorted_names)
+        else:
+            for entry in sorted_names:
+                bisect.insort(self._sorted_names, entry)
+        self._columns = None
+        self.generation += 1
+
+    def remove(self, company_id: int) -> None:
+        """Drop a company from the index; unknown ids are ignored.
+
+        Args:
+            company_id: Company primary key.
+        """
+        position = self._positions.pop(company_id, None)
+        if position is None:
+            return
+        for field, field_grams in zip(_FIELDS, self._grams[position], strict=True):
+            for gram in field_grams:
+                key = (field, gram)
+                postings = self._postings[key]
+                postings.discard(position)
+                if not postings:
+                    del self._postings[key]
+                self._arrays.pop(key, None)
+        entry = (self._names[position], position)
+        del self._sorted_names[bisect.bisect_left(self._sorted_names, entry)]
+        self._items[position] = None
+        self._grams[position] = (frozenset(), frozenset())
+        self._columns = None
+        self.generation += 1
+
+    def _postings_array(self, field: str, gram: str) -> Any:
+        """Positions containing ``gram`` in ``field`` as an int array, cached."""
+        key = (field, gram)
+        array = self._arrays.get(key)
+        if array is None:
+            postings = self._postings.get(key, ())
+            array = self._arrays[key] = np.fromiter(postings, dtype=np.int64, count=len(postings))
+        return array
+
+    def _shared(self, field: str, grams: frozenset[str], size: int) -> Any:
+        """Count the query trigrams each position shares in ``field``."""
+        arrays = [self._postings_array(field, gram) for gram in grams]
+        return np.bincount(np.concatenate(arrays), minlength=size)
+
+    def _prefix_positions(self, text: str) -> list[int]:
+        """Positions of names starting with ``text``, from the sorted names."""
+        start = bisect.bisect_left(self._sorted_names, (text,))
+        end = bisect.bisect_left(self._sorted_names, (text + "\U0010ffff",))
+        return [position for _, position in self._sorted_names[start:end]]
+
+    def search(self, query: str, *, limit: int) -> list[tuple[CompanyRead, float]]:
+        """Find the companies best matching a free-text query.
+
+        Args:
+            query: Search text; case, accents and punctuation are ignored.
+            limit: Maximum number of results.
+
+        Returns:
+            Up to ``limit`` (company, score) pairs, best first; ties by id.
+        """
+        text = normalize(query)
+        grams = trigrams(text)
+        if not grams or not self._positions:
+            return []
+
+        if self._columns is None:
+            self._columns = (
+                np.array(self._ids, dtype=np.int64),
+                np.array([len(name) for name, _ in self._grams], dtype=np.int64),
+            )
+        ids, name_sizes = self._columns
+        size = len(self._items)
+        total = len(grams)
+
+        shared = self._shared("name", grams, size)
+        scores = shared / (total + name_sizes - shared)
+        scores[self._prefix_positions(text)] += PREFIX_BONUS
+        products = PRODUCT_WEIGHT * self._shared("products", grams, size) / total
+        np.maximum(scores, products, out=scores)
+
+        candidates = np.flatnonzero(scores >= MIN_SCORE)
+        if len(candidates) > limit:
+            kth = np.partition(scores[candidates], len(candidates) - limit)[-limit]
+            candidates = candidates[scores[candidates] >= kth]
+        best = candidates[np.lexsort((ids[candidates], -scores[candidates]))][:limit]
+        return [(self._items[p], round(float(scores[p]), 4)) for p in best]  # type: ignore[misc]
@@ -0,0 +1,323 @@
+"""In-memory columnar snapshot of the company table.
+
+An alternative to querying PostgREST for every page: the joined company data
+is loaded once into NumPy columns and filters, counts and pagination are
+answered in-process. Requires the optional ``snapshot`` extra (numpy).
+"""
+
+from collections import OrderedDict
+from typing import Any, Literal, get_args
+
+from supabase._async.client import AsyncClient
+
+from backend.repositories import company_repository
+from backend.schemas.company import (
+    CompanyRanges,
+    CompanyRead,
+    CompanySortKey,
+    IdFilter,
+    SortOrder,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional "snapshot" extra
+    np = None  # type: ignore[assignment]
+
+SNAPSHOT_AVAILABLE = np is not None
+"""Whether numpy is installed and the snapshot backend can be used."""
+
+SNAPSHOT_FIELDS = company_repository.LIST_FIELDS + ("employees", "g2_rating", "investors")
+"""Company fields loaded into the snapshot."""
+
+_MISSING_ID = -1
+"""Sentinel stored in id columns for NULL foreign keys."""
+
+_BUCKET_CACHE_SIZE = 256
+"""Filter/sort combinations whose matching positions are kept per snapshot."""
+
+
+async def fetch_rows(client: AsyncClient, chunk_size: int = 1000) -> list[dict[str, Any]]:
+    """Fetch the whole company table in id order through keyset chunks.
+
+    Args:
+        client: Async Supabase client instance.
+        chunk_size: Number of rows fetched per upstream query.
+
+    Returns:
+        Raw company records with the snapshot fields.
+    """
+    rows: list[dict[str, Any]] = []
+    async for chunk in company_repository.iter_chunks(
+        client, chunk_size=chunk_size, fields=SNAPSHOT_FIELDS
+    ):
+        rows.extend(chunk)
+    return rows
+
+
+class CompanySnapshot:
+    """Immutable columnar copy of the joined company table, ordered by id.
+
+    Attributes:
+        ids: Company ids, ascending.
+        industry_ids: Industry id per company, ``-1`` when NULL.
+        location_ids: Location id per company, ``-1`` when NULL.
+        metrics: float64 column per range-filterable metric, NaN when NULL.
+        investor_positions: Company position of every company/investor pair.
+        investor_ids: Investor id of every company/investor pair.
+        items: Validated response objects, aligned with the columns.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]], items: list[CompanyRead]) -> None:
+        """Build the columns from raw company rows.
+
+        Args:
+            rows: Raw company records with embedded relations, ordered by id.
+            items: Response objects for ``rows``, in the same order.
+        """
+        self.ids = np.fromiter((row["id"] for row in rows), dtype=np.int64, count=len(rows))
+        self.industry_ids = self._id_column(rows, "industry_id")
+        self.location_ids = self._id_column(rows, "location_id")
+        self.metrics = {
+            column: self._metric_column(rows, column)
+            for column, _ in company_repository.RANGE_BOUNDS.values()
+        }
+        pairs = [
+            (position, investor["id"])
+            for position, row in enumerate(rows)
+            for investor in row.get("investors") or ()
+        ]
+        self.investor_positions = np.array([p for p, _ in pairs], dtype=np.int64)
+        self.investor_ids = np.array([i for _, i in pairs], dtype=np.int64)
+        self.items = items
+        self._orders = {
+            (sort, order): self._permutation(self.metrics[sort], order)
+            for sort in get_args(CompanySortKey)
+            for order in get_args(SortOrder)
+        }
+        self._buckets: OrderedDict[tuple[object, ...], Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @staticmethod
+    def _id_column(rows: list[dict[str, Any]], key: str) -> Any:
+        """Build an int64 foreign-key column with NULL mapped to ``-1``."""
+        return np.fromiter(
+            (_MISSING_ID if row.get(key) is None else row[key] for row in rows),
+            dtype=np.int64,
+            count=len(rows),
+        )
+
+    def _permutation(self, values: Any, order: SortOrder) -> Any:
+        """Positions sorted by ``values`` with NaN last and ties broken by id."""
+        keys = -values if order == "desc" else values
+        return np.lexsort((self.ids, keys))
+
+    @staticmethod
+    def _metric_column(rows: list[dict[str, Any]], key: str) -> Any:
+        """Build a float64 metric column with NULL mapped to NaN.
+
+        NaN compares false against any bound, matching SQL NULL semantics.
+        """
+        return np.fromiter(
+            (np.nan if row.get(key) is None else row[key] for row in rows),
+            dtype=np.float64,
+            count=len(rows),
+        )
+
+    def positions(
+        self,
+        *,
+        industry_id: IdFilter | None = None,
+        location_id: IdFilter | None = None,
+        ranges: CompanyRanges | None = None,
+        investor_id: int | None = None,
+        sort: CompanySortKey | None = None,
+        order: SortOrder = "asc",
+    ) -> Any:
+        """Return the row positions matching the filters, in id or sort order.
+
+        Every filter is evaluated as one vectorized boolean mask over its
+        column and the masks are combined with AND. Sorted results are
+        gathered from a precomputed permutation, and each filter bucket is
+        memoized, so paging through it only slices an array.
+
+        Args:
+            industry_id: Optional industry ID, or IDs matching any, to filter by.
+            location_id: Optional location ID, or IDs matching any, to filter by.
+            ranges: Optional bounds on numeric company metrics.
+            investor_id: Optional investor ID to filter by.
+            sort: Optional metric to sort by; id order when None.
+            order: Sort direction of ``sort``.
+
+        Returns:
+            Integer array of matching positions.
+        """
+        key = (industry_id, location_id, ranges, investor_id, sort, order)
+        cached = self._buckets.get(key)
+        if cached is not None:
+            self._buckets.move_to_end(key)
+            return cached
+
+        mask = self._mask(
+            industry_id=industry_id,
+            location_id=location_id,
+            ranges=ranges,
+            investor_id=investor_id,
+        )
+        if sort is None:
+            positions = np.arange(len(self.ids)) if mask is None else np.flatnonzero(mask)
+        else:
+            permutation = self._orders[sort, order]
+            positions = permutation if mask is None else permutation[mask[permutation]]
+
+        self._buckets[key] = positions
+        while len(self._buckets) > _BUCKET_CACHE_SIZE:
+            self._buckets.popitem(last=False)
+        return positions
+
+    @staticmethod
+    def _id_mask(column: Any, value: IdFilter) -> Any:
+        """Match a foreign-key column against one ID or any of several."""
+        if isinstance(value, tuple):
+            return np.isin(column, value)
+        return column == value
+
+    def _mask(
+        self,
+        *,
+        industry_id: IdFilter | None,
+        location_id: IdFilter | None,
+        ranges: CompanyRanges | None,
+        investor_id: int | None = None,
+    ) -> Any:
+        """Build the boolean filter mask, or None when nothing is filtered."""
+        bounds = []
+        if ranges is not None:
+            bounds = [
+                (column, operator, value)
+                for bound, (column, operator) in company_repository.RANGE_BOUNDS.items()
+                if (value := getattr(ranges, bound)) is not None
+            ]
+        if industry_id is None and location_id is None and investor_id is None and not bounds:
+            return None
+
+        mask = np.ones(len(self.ids), dtype=bool)
+        if industry_id is not None:
+            mask &= self._id_mask(self.industry_ids, industry_id)
+        if location_id is not None:
+            mask &= self._id_mask(self.location_ids, location_id)
+        if investor_id is not None:
+            invested = np.zeros(len(self.ids), dtype=bool)
+            invested[self.investor_positions[self.investor_ids == investor_id]] = True
+            mask &= invested
+        for column, operator, value in bounds:
+            if operator == "gte":
+                mask &= self.metrics[column] >= value
+            else:
+                mask &= self.metrics[column] <= value
+        return mask
+
+    def facet_counts(
+        self,
+        by: Literal["industry_id", "location_id"],
+        *,
+        industry_id: IdFilter | None = None,
+        location_id: IdFilter | None = None,
+        ranges: CompanyRanges | None = None,
+        investor_id: int | None = None,
+    ) -> dict[int, int]:
+        """Count matching companies per industry or location in one pass.
+
+        Args:
+            by: Foreign-key column to group by.
+            industry_id: Optional industry ID, or IDs matching any, to filter by.
+            location_id: Optional location ID, or IDs matching any, to filter by.
+            ranges: Optional bounds on numeric company metrics.
+            investor_id: Optional investor ID to filter by.
+
+        Returns:
+            Number of matching companies per ID, ascending by ID; NULL
+            foreign keys are left out.
+        """
+        column = self.industry_ids if by == "industry_id" else self.location_ids
+        mask = self._mask(
+            industry_id=industry_id,
+            location_id=location_id,
+            ranges=ranges,
+            investor_id=investor_id,
+        )
+        values = column if mask is None else column[mask]
+        keys, counts = np.unique(values[values != _MISSING_ID], return_counts=True)
+        return dict(zip(keys.tolist(), counts.tolist(), strict=True))
+
+    def get(self, company_id: int) -> CompanyRead | None:
+        """Look up one company by id with a binary search over the id column.
+
+        Args:
+            company_id: Company primary key.
+
+        Returns:
+            The company, or None if it is not in the snapshot.
+        """
+        position = int(np.searchsorted(self.ids, company_id))
+        if position < len(self.ids) and self.ids[position] == company_id:
+            return self.items[position]
+        return None
+
+    def page(self, positions: Any, *, page: int, size: int) -> list[CompanyRead]:
+        """Slice one page of items out of matching positions.
+
+        Args:
+            positions: Matching positions from ``positions``.
+            page: Page number (1-based).
+            size: Number of items per page.
+
+        Returns:
+            Items of the requested page.
+        """
+        start = (page - 1) * size
+        return [self.items[i] for i in positions[start : start + size]]
+
+    def after(
+        self,
+        positions: Any,
+        *,
+        after_id: int | None,
+        limit: int,
+        sort: CompanySortKey | None = None,
+        order: SortOrder = "asc",
+        after_value: int | None = None,
+    ) -> list[CompanyRead]:
+        """Slice the items that follow a keyset position.
+
+        Uses the same ordering as the repository: by id, or by ``sort`` with
+        NULLs last and id as the tie-breaker.
+
+        Args:
+            positions: Matching positions from ``positions`` in the same order.
+            after_id: Id of the last item of the previous page; None to start.
+            limit: Maximum number of items to return.
+            sort: Metric ``positions`` is sorted by; None for id order.
+            order: Sort direction of ``sort``.
+            after_value: ``sort`` value of the ``after_id`` item; None if NULL.
+
+        Returns:
+            Up to ``limit`` items in order.
+        """
+        start = 0
+        if after_id is not None:
+            if sort is None:
+                start = int(np.searchsorted(self.ids[positions], after_id, side="right"))
+            else:
+                values = self.metrics[sort][positions]
+                ids = self.ids[positions]
+                if after_value is None:
+                    later = np.isnan(values) & (ids > after_id)
+                else:
+                    beyond = values < after_value if order == "desc" else values > after_value
+                    later = beyond | ((values == after_value) & (ids > after_id)) | np.isnan(values)
+                # ``later`` is False then True along the sorted positions.
+                start = int(np.argmax(later)) if later.any() else len(positions)
+        return [self.items[i] for i in positions[start : start + limit]]
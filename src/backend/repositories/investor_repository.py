@@ -0,0 +1,21 @@
+"""Repository for investor data access via Supabase."""
+
+from typing import Any, cast
+
+from supabase._async.client import AsyncClient
+
+from backend.core.singleflight import coalesce
+
+
+@coalesce
+async def get_all(client: AsyncClient) -> list[dict[str, Any]]:
+    """Fetch all investors ordered by name.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        List of investor records as dictionaries.
+    """
+    response = await client.table("investor").select("id, name").order("name").execute()
+    return cast(list[dict[str, Any]], response.data)
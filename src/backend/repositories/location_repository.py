@@ -4,7 +4,10 @@ from typing import Any, cast
 
 from supabase._async.client import AsyncClient
 
+from backend.core.singleflight import coalesce
 
+
+@coalesce
 async def get_all(client: AsyncClient) -> list[dict[str, Any]]:
     """Fetch all locations ordered by city.
 
@@ -16,3 +19,22 @@ async def get_all(client: AsyncClient) -> list[dict[str, Any]]:
     """
     response = await client.table("location").select("*").order("city").execute()
     return cast(list[dict[str, Any]], response.data)
+
+
+async def get_version(client: AsyncClient) -> tuple[int, str | None]:
+    """Return a cheap fingerprint of the location table.
+
+    The ``updated_at`` trigger moves the latest update time on every
+    change, so together with the row count the pair changes whenever the
+    table does, renames included.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Row count and latest ``updated_at`` (None for an empty table).
+    """
+    query = client.table("location").select("updated_at", count="exact")  # type: ignore
+    response = await query.order("updated_at", desc=True).limit(1).execute()
+    rows = cast(list[dict[str, Any]], response.data)
+    return response.count or 0, rows[0]["updated_at"] if rows else None
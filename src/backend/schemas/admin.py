@@ -0,0 +1,31 @@
+"""Pydantic schemas for admin operations."""
+
+from pydantic import BaseModel
+
+
+class CacheInvalidateResponse(BaseModel):
+    """Schema for the result of a cache invalidation.
+
+    Attributes:
+        invalidated: Names of the caches that were invalidated.
+    """
+
+    invalidated: list[str]
+
+
+class CacheStats(BaseModel):
+    """Schema for the counters of a response cache.
+
+    Attributes:
+        hits: Requests served from a fresh entry.
+        stale_hits: Requests served from a stale entry while revalidating.
+        misses: Requests that waited for the upstream.
+        errors: Upstream failures while loading or revalidating.
+        size: Number of entries currently cached.
+    """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    errors: int
+    size: int
@@ -0,0 +1,61 @@
+"""Pydantic schemas for company aggregate statistics."""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+AggregateGroupBy = Literal["industry", "country"]
+"""Dimensions company statistics can be grouped by."""
+
+
+class MetricStats(BaseModel):
+    """Distribution of one company metric within a group.
+
+    Companies with a NULL metric are left out; the statistics are None when
+    no company in the group has a value.
+
+    Attributes:
+        count: Companies with a value for the metric.
+        sum: Sum of the values (in USD).
+        median: Median value.
+        p25: 25th percentile (linear interpolation).
+        p75: 75th percentile (linear interpolation).
+        p90: 90th percentile (linear interpolation).
+    """
+
+    count: int
+    sum: int
+    median: float | None
+    p25: float | None
+    p75: float | None
+    p90: float | None
+
+
+class GroupAggregates(BaseModel):
+    """Statistics of the companies in one group.
+
+    Attributes:
+        group: Industry name or country; None for companies without one.
+        companies: Number of companies in the group.
+        arr: Annual Recurring Revenue statistics.
+        valuation: Valuation statistics.
+        total_funding: Total funding statistics.
+    """
+
+    group: str | None
+    companies: int
+    arr: MetricStats
+    valuation: MetricStats
+    total_funding: MetricStats
+
+
+class CompanyAggregates(BaseModel):
+    """Company statistics per industry or per country.
+
+    Attributes:
+        group_by: Dimension the groups were built from.
+        groups: One entry per group, ordered by group name.
+    """
+
+    group_by: AggregateGroupBy
+    groups: list[GroupAggregates]
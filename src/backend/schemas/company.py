@@ -1,7 +1,10 @@
 """Pydantic schemas for Company."""
 
-from pydantic import BaseModel
+from typing import Literal
 
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.schemas.investor import InvestorRead
 from backend.schemas.pagination import PaginatedResponse
 
 
@@ -18,6 +21,7 @@ class CompanyRead(BaseModel):
         total_funding: Total funding received (in USD), nullable.
         arr: Annual Recurring Revenue (in USD), nullable.
         valuation: Company valuation (in USD), nullable.
+        investors: Investors of the company; only returned when requested.
     """
 
     id: int
@@ -29,7 +33,126 @@ class CompanyRead(BaseModel):
     total_funding: int | None = None
     arr: int | None = None
     valuation: int | None = None
+    investors: list[InvestorRead] | None = None
+
+
+DEFAULT_FIELDS = tuple(field for field in CompanyRead.model_fields if field != "investors")
+"""Company fields returned unless a sparse fieldset is requested."""
+
+
+IdFilter = int | tuple[int, ...]
+"""One foreign-key ID, or several sorted IDs of which any may match."""
+
+CompanySortKey = Literal["arr", "valuation", "total_funding", "founding_year"]
+"""Company metrics the list endpoint can sort by."""
+
+SortOrder = Literal["asc", "desc"]
+"""Sort direction; NULL metrics always sort last."""
+
+
+class CompanyRanges(BaseModel):
+    """Inclusive bounds on numeric company metrics used as list filters.
+
+    Companies with a NULL metric never match a bound on that metric.
+    Instances are immutable and hashable so they can be part of cache keys.
+
+    Attributes:
+        min_arr: Minimum Annual Recurring Revenue (in USD).
+        max_arr: Maximum Annual Recurring Revenue (in USD).
+        min_valuation: Minimum valuation (in USD).
+        min_total_funding: Minimum total funding (in USD).
+        founded_after: Earliest founding year.
+        founded_before: Latest founding year.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    min_arr: int | None = None
+    max_arr: int | None = None
+    min_valuation: int | None = None
+    min_total_funding: int | None = None
+    founded_after: int | None = None
+    founded_before: int | None = None
 
 
 CompanyListResponse = PaginatedResponse[CompanyRead]
 """Type alias for a paginated response of companies."""
+
+MAX_BATCH_IDS = 100
+"""Maximum number of company ids accepted by one batch lookup."""
+
+
+class CompanyBatchRequest(BaseModel):
+    """Schema for a batch lookup of companies by id.
+
+    Attributes:
+        ids: Company ids to fetch; duplicates are ignored.
+    """
+
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_IDS)
+
+
+class CompanyBatchResponse(BaseModel):
+    """Schema for the result of a batch lookup.
+
+    Attributes:
+        items: Found companies, in the order their ids were requested.
+        missing: Requested ids that do not exist, in request order.
+    """
+
+    items: list[CompanyRead]
+    missing: list[int]
+
+
+class FacetCount(BaseModel):
+    """Number of matching companies for one filter option.
+
+    Attributes:
+        id: Industry or location ID of the option.
+        count: Companies matching the other active filters with this option.
+    """
+
+    id: int
+    count: int
+
+
+class CompanyFacets(BaseModel):
+    """Facet counts for the company filter sidebar.
+
+    Each facet ignores its own filter so every option shows how many
+    companies selecting it would return; ``total`` applies every filter.
+    Options without matching companies are omitted.
+
+    Attributes:
+        total: Companies matching the whole filter set.
+        industries: Counts per industry, ordered by industry ID.
+        locations: Counts per location, ordered by location ID.
+    """
+
+    total: int
+    industries: list[FacetCount]
+    locations: list[FacetCount]
+
+
+class CompanySearchHit(BaseModel):
+    """One company matching a search query.
+
+    Attributes:
+        company: The matching company.
+        score: Relevance; higher is better, about 1.0 for an exact name match.
+    """
+
+    company: CompanyRead
+    score: float
+
+
+class CompanySearchResponse(BaseModel):
+    """Schema for the result of a company search.
+
+    Attributes:
+        query: The search text as received.
+        items: Matching companies, best first.
+    """
+
+    query: str
+    items: list[CompanySearchHit]
@@ -0,0 +1,21 @@
+"""Pydantic schemas for the dashboard bootstrap payload."""
+
+from pydantic import BaseModel
+
+from backend.schemas.company import CompanyListResponse
+from backend.schemas.industry import IndustryRead
+from backend.schemas.location import LocationRead
+
+
+class DashboardResponse(BaseModel):
+    """Everything the dashboard page needs to render, in one response.
+
+    Attributes:
+        industries: All industries for the filter options, ordered by name.
+        locations: All locations for the filter options.
+        companies: The requested page of companies.
+    """
+
+    industries: list[IndustryRead]
+    locations: list[LocationRead]
+    companies: CompanyListResponse
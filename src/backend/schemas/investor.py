@@ -0,0 +1,15 @@
+"""Pydantic schemas for Investor."""
+
+from pydantic import BaseModel
+
+
+class InvestorRead(BaseModel):
+    """Schema for reading an investor record.
+
+    Attributes:
+        id: Unique identifier of the investor.
+        name: Investor name.
+    """
+
+    id: int
+    name: str
@@ -12,14 +12,17 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
     Attributes:
         items: List of items for the current page.
-        total: Total number of items across all pages.
-        page: Current page number (1-based).
+        total: Total number of items across all pages, None when not requested.
+        page: Current page number (1-based), None in cursor mode.
         size: Number of items per page.
-        total_pages: Total number of pages.
+        total_pages: Total number of pages, None when not requested.
+        next_cursor: Opaque cursor for the next page in cursor mode, None when
+            there are no more items or page-number pagination is used.
     """
 
     items: list[T]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
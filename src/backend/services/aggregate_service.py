@@ -0,0 +1,212 @@
+"""Service layer for company aggregate statistics."""
+
+import asyncio
+from typing import Any, get_args
+
+from supabase._async.client import AsyncClient
+
+from backend.core import cache
+from backend.core.settings import settings
+from backend.core.versioned_cache import VersionedCache
+from backend.repositories import company_repository, industry_repository, location_repository
+from backend.schemas.aggregate import (
+    AggregateGroupBy,
+    CompanyAggregates,
+    GroupAggregates,
+    MetricStats,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional "analytics" extra
+    np = None  # type: ignore[assignment]
+
+AGGREGATES_AVAILABLE = np is not None
+"""Whether numpy is installed and aggregate statistics can be computed."""
+
+AGGREGATE_METRICS = ("arr", "valuation", "total_funding")
+"""Company metrics summarized per group."""
+
+_AGGREGATE_FIELDS = ("id", "industry", "location", *AGGREGATE_METRICS)
+"""Company fields fetched to build the statistics."""
+
+_QUANTILES = {"p25": 0.25, "median": 0.5, "p75": 0.75, "p90": 0.9}
+"""Reported quantiles by ``MetricStats`` field."""
+
+
+def _group_stats(codes: Any, values: Any, valid: Any, n_groups: int) -> list[MetricStats]:
+    """Summarize one metric per group with vectorized NumPy operations.
+
+    Rows are sorted once by (group, value), so every group is a contiguous
+    sorted run and all quantiles are gathered with index arithmetic. Sums
+    are accumulated in int64 so large totals stay exact.
+
+    Args:
+        codes: Group index per company.
+        values: Metric per company as int64, 0 when NULL.
+        valid: Whether each company has a value for the metric.
+        n_groups: Number of groups.
+
+    Returns:
+        Statistics per group, indexed by group code.
+    """
+    codes, values = codes[valid], values[valid]
+    order = np.lexsort((values, codes))
+    codes, values = codes[order], values[order]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.zeros(n_groups, dtype=np.int64)
+    np.add.at(sums, codes, values)
+    starts = np.cumsum(counts) - counts
+    values = values.astype(np.float64)
+    present = np.flatnonzero(counts)
+
+    quantiles: dict[str, Any] = {}
+    for name, q in _QUANTILES.items():
+        rank = q * (counts[present] - 1)
+        low = np.floor(rank).astype(np.int64)
+        high = np.ceil(rank).astype(np.int64)
+        low_values = values[starts[present] + low]
+        high_values = values[starts[present] + high]
+        column = np.full(n_groups, np.nan)
+        column[present] = low_values + (high_values - low_values) * (rank - low)
+        quantiles[name] = column
+
+    return [
+        MetricStats(
+            count=int(counts[i]),
+            sum=int(sums[i]),
+            **{name: float(column[i]) if counts[i] else None for name, column in quantiles.items()},
+        )
+        for i in range(n_groups)
+    ]
+
+
+def _aggregate(
+    group_by: AggregateGroupBy,
+    labels: list[str | None],
+    metrics: dict[str, tuple[Any, Any]],
+) -> CompanyAggregates:
+    """Group companies by label and summarize every metric.
+
+    Args:
+        group_by: Dimension the labels come from.
+        labels: Group label per company, None when missing.
+        metrics: int64 values and validity mask per metric, aligned with
+            ``labels``.
+
+    Returns:
+        Statistics per group, ordered by name with the missing group last.
+    """
+    names = sorted(set(labels), key=lambda name: (name is None, name or ""))
+    index = {name: i for i, name in enumerate(names)}
+    codes = np.fromiter((index[label] for label in labels), dtype=np.int64, count=len(labels))
+    companies = np.bincount(codes, minlength=len(names))
+    stats = {
+        metric: _group_stats(codes, values, valid, len(names))
+        for metric, (values, valid) in metrics.items()
+    }
+
+    return CompanyAggregates(
+        group_by=group_by,
+        groups=[
+            GroupAggregates(
+                group=name,
+                companies=int(companies[i]),
+                **{metric: stats[metric][i] for metric in AGGREGATE_METRICS},
+            )
+            for i, name in enumerate(names)
+        ],
+    )
+
+
+async def _load_aggregates(client: AsyncClient) -> dict[AggregateGroupBy, CompanyAggregates]:
+    """Fetch the company metrics and compute statistics for every dimension.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Statistics per dimension.
+    """
+    labels: dict[AggregateGroupBy, list[str | None]] = {"industry": [], "country": []}
+    values: dict[str, list[Any]] = {metric: [] for metric in AGGREGATE_METRICS}
+
+    async for chunk in company_repository.iter_chunks(
+        client, chunk_size=settings.export_chunk_size, fields=_AGGREGATE_FIELDS
+    ):
+        for row in chunk:
+            industry = row.get("industry")
+            location = row.get("location")
+            labels["industry"].append(industry.get("name") if isinstance(industry, dict) else None)
+            labels["country"].append(
+                location.get("country") if isinstance(location, dict) else None
+            )
+            for metric in AGGREGATE_METRICS:
+                values[metric].append(row.get(metric))
+
+    metrics = {
+        metric: (
+            np.array([v or 0 for v in column], dtype=np.int64),
+            np.array([v is not None for v in column], dtype=bool),
+        )
+        for metric, column in values.items()
+    }
+    return {
+        group_by: _aggregate(group_by, labels[group_by], metrics)
+        for group_by in get_args(AggregateGroupBy)
+    }
+
+
+async def _load_version(client: AsyncClient) -> tuple[tuple[int, str | None], ...]:
+    """Probe the versions of the tables the statistics depend on.
+
+    Groups are labelled with industry names and location countries, so a
+    renamed industry or location must rebuild the statistics as well.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Row count and latest update time of the company, industry and
+        location tables.
+    """
+    versions = await asyncio.gather(
+        company_repository.get_version(client),
+        industry_repository.get_version(client),
+        location_repository.get_version(client),
+    )
+    return tuple(versions)
+
+
+aggregates_cache = VersionedCache(
+    "company_aggregates",
+    _load_aggregates,
+    _load_version,
+    check_interval=settings.company_aggregates_check_interval,
+)
+"""Statistics for every dimension, rebuilt when company, industry or location data changes."""
+
+if AGGREGATES_AVAILABLE:
+    cache.register(aggregates_cache)
+
+
+async def get_aggregates(client: AsyncClient, group_by: AggregateGroupBy) -> CompanyAggregates:
+    """Return company statistics grouped by industry or country.
+
+    Statistics for every dimension are built in one pass over the company
+    table and cached until the version (row count and latest update) of the
+    company, industry or location table changes, so repeated calls only
+    cost a periodic version probe.
+
+    Requires numpy; check ``AGGREGATES_AVAILABLE`` before calling.
+
+    Args:
+        client: Async Supabase client instance.
+        group_by: Dimension to group by.
+
+    Returns:
+        Sum, median and percentiles of ARR, valuation and funding per group.
+    """
+    aggregates = await aggregates_cache.get(client)
+    return aggregates[group_by]
@@ -0,0 +1,105 @@
+"""Service layer for company lookups by id: detail and batch."""
+
+from supabase._async.client import AsyncClient
+
+from backend.core import cache
+from backend.core.settings import settings
+from backend.repositories import company_repository
+from backend.schemas.company import CompanyBatchResponse, CompanyRead
+from backend.services import company_service
+
+
+async def _load_company(client: AsyncClient, company_id: int) -> CompanyRead | None:
+    """Fetch one company with its relations and convert it to a response object.
+
+    Args:
+        client: Async Supabase client instance.
+        company_id: Company primary key.
+
+    Returns:
+        The company, or None if it does not exist.
+    """
+    row = await company_repository.get_by_id(client, company_id)
+    return None if row is None else company_service.to_company_reads([row])[0]
+
+
+detail_cache: cache.KeyedTTLCache[int, CompanyRead | None] = cache.register(
+    cache.KeyedTTLCache(
+        "company_detail",
+        _load_company,
+        ttl=settings.company_detail_cache_ttl,
+        max_size=settings.company_detail_cache_size,
+        reload_on_refresh=False,
+    )
+)
+"""Company details per id; unknown ids are cached as None.
+
+Registered for admin invalidation only: the periodic refresh purges
+expired ids instead of reloading them one query at a time.
+"""
+
+
+async def get_company(client: AsyncClient, company_id: int) -> CompanyRead | None:
+    """Fetch one company by id with its industry, location and investors.
+
+    Served from a bounded per-id LRU cache; a miss costs one primary key
+    lookup upstream. Unknown ids are cached as well, so repeated requests
+    for a missing company do not reach the database either. With the
+    ``snapshot`` backend the company is looked up in memory.
+
+    Args:
+        client: Async Supabase client instance.
+        company_id: Company primary key.
+
+    Returns:
+        The company, or None if it does not exist.
+    """
+    if settings.company_backend == "snapshot":
+        snapshot = await company_service.snapshot_cache.get(client)
+        return snapshot.get(company_id)
+    return await detail_cache.get(client, company_id)
+
+
+async def get_companies_by_ids(client: AsyncClient, company_ids: list[int]) -> CompanyBatchResponse:
+    """Fetch several companies by id, in request order.
+
+    All ids are resolved with one upstream query and converted with the
+    same batch transform as the list endpoint. Duplicate ids are returned
+    once, at their first position. With the ``snapshot`` backend the
+    companies are looked up in memory.
+
+    Args:
+        client: Async Supabase client instance.
+        company_ids: Company primary keys.
+
+    Returns:
+        Found companies in request order plus the ids that do not exist.
+    """
+    requested = tuple(dict.fromkeys(company_ids))
+    if settings.company_backend == "snapshot":
+        snapshot = await company_service.snapshot_cache.get(client)
+        found = {
+            company_id: company
+            for company_id in requested
+            if (company := snapshot.get(company_id)) is not None
+        }
+    else:
+        rows = await company_repository.get_by_ids(client, requested)
+        found = {company.id: company for company in company_service.to_company_reads(rows)}
+
+    return CompanyBatchResponse(
+        items=[found[company_id] for company_id in requested if company_id in found],
+        missing=[company_id for company_id in requested if company_id not in found],
+    )
+
+
+def invalidate_company(company_id: int) -> bool:
+    """Drop one company from the detail cache after it changed upstream.
+
+    Args:
+        company_id: Company primary key.
+
+    Returns:
+        Whether the company was cached.
+    """
+    return detail_cache.discard(company_id)
@@ -1,12 +1,95 @@
 """Service layer for company business logic."""
 
+import asyncio
 from math import ceil
-from typing import Any
+from typing import Any, Iterable
 
+from pydantic import TypeAdapter
 from supabase._async.client import AsyncClient
 
-from backend.repositories import company_repository
-from backend.schemas.company import CompanyListResponse, CompanyRead
+from backend.core import cache
+from backend.core.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from backend.core.response_cache import ResponseCache
+from backend.core.settings import settings
+from backend.repositories import company_repository, company_snapshot
+from backend.repositories.company_snapshot import CompanySnapshot
+from backend.schemas.company import (
+    CompanyListResponse,
+    CompanyRanges,
+    CompanyRead,
+    CompanySortKey,
+    IdFilter,
+    SortOrder,
+)
+
+_company_reads_adapter = TypeAdapter(list[CompanyRead])
+
+CountKey = tuple[IdFilter | None, IdFilter | None, CompanyRanges | None, int | None]
+"""Filter combination a total is cached for: (industry_id, location_id, ranges, investor_id)."""
+
+
+async def _load_total(client: AsyncClient, key: CountKey) -> int:
+    """Count companies for a filter combination with the configured strategy.
+
+    Args:
+        client: Async Supabase client instance.
+        key: Filter combination as (industry_id, location_id, ranges, investor_id).
+
+    Returns:
+        Number of companies matching the filters.
+    """
+    industry_id, location_id, ranges, investor_id = key
+    return await company_repository.count(
+        client,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        investor_id=investor_id,
+        count_method=settings.company_count_strategy,
+    )
+
+
+totals_cache = cache.register(
+    cache.KeyedTTLCache(
+        "company_totals",
+        _load_total,
+        ttl=settings.company_count_cache_ttl,
+        max_size=settings.company_count_cache_size,
+    )
+)
+"""Company totals per filter combination, refreshed in the background."""
+
+response_cache: ResponseCache[tuple[object, ...], CompanyListResponse] = cache.register(
+    ResponseCache(
+        "company_responses",
+        ttl=settings.company_response_cache_ttl,
+        stale_ttl=settings.company_response_cache_stale_ttl,
+        max_size=settings.company_response_cache_size,
+    )
+)
+"""Paginated company responses keyed by request parameters."""
+
+
+async def _load_snapshot(client: AsyncClient) -> CompanySnapshot:
+    """Load the company table into a new in-memory snapshot.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Snapshot of the current company data.
+    """
+    rows = await company_snapshot.fetch_rows(client, chunk_size=settings.export_chunk_size)
+    return CompanySnapshot(rows, to_company_reads(rows))
+
+
+snapshot_cache = cache.TTLCache(
+    "company_snapshot", _load_snapshot, ttl=settings.company_snapshot_ttl
+)
+"""In-memory company snapshot used when ``company_backend`` is ``snapshot``."""
+
+if settings.company_backend == "snapshot":
+    cache.register(snapshot_cache)
 
 
 def _format_location(location_data: dict[str, Any]) -> str:
@@ -27,77 +110,335 @@ def _format_location(location_data: dict[str, Any]) -> str:
     return f"{city}, {country}"
 
 
-def _to_company_read(raw: dict[str, Any]) -> CompanyRead:
-    """Transform a raw company dict with embedded relations to CompanyRead.
+def to_company_reads(rows: Iterable[dict[str, Any]]) -> list[CompanyRead]:
+    """Transform raw company dicts with embedded relations to CompanyRead in one pass.
+
+    Formatted location strings are memoized by ``location_id`` since a page
+    or an export repeats the same locations many times, and the whole batch
+    is validated with a single TypeAdapter call instead of one model
+    construction per row. Columns left out of a sparse projection fall back
+    to empty defaults.
 
     Args:
-        raw: Raw company record from Supabase with embedded industry and location.
+        rows: Raw company records from Supabase with embedded industry and location.
 
     Returns:
-        Validated CompanyRead schema instance.
+        Validated CompanyRead schema instances, in input order.
     """
-    industry_name = ""
-    if raw.get("industry") and isinstance(raw["industry"], dict):
-        industry_name = raw["industry"].get("name", "")
-
-    location_str = ""
-    if raw.get("location") and isinstance(raw["location"], dict):
-        location_str = _format_location(raw["location"])
-
-    return CompanyRead(
-        id=raw["id"],
-        name=raw["name"],
-        industry=industry_name,
-        location=location_str,
-        products=raw.get("products", ""),
-        founding_year=raw.get("founding_year"),
-        total_funding=raw.get("total_funding"),
-        arr=raw.get("arr"),
-        valuation=raw.get("valuation"),
-    )
+    locations: dict[int, str] = {}
+    records = []
+
+    for raw in rows:
+        industry = raw.get("industry")
+        industry_name = industry.get("name", "") if isinstance(industry, dict) else ""
+
+        location = raw.get("location")
+        location_id = raw.get("location_id")
+        location_str = ""
+        if location and isinstance(location, dict):
+            if location_id is None:
+                location_str = _format_location(location)
+            elif (cached := locations.get(location_id)) is not None:
+                location_str = cached
+            else:
+                location_str = locations[location_id] = _format_location(location)
+
+        records.append(
+            {
+                "id": raw["id"],
+                "name": raw.get("name", ""),
+                "industry": industry_name,
+                "location": location_str,
+                "products": raw.get("products", ""),
+                "founding_year": raw.get("founding_year"),
+                "total_funding": raw.get("total_funding"),
+                "arr": raw.get("arr"),
+                "valuation": raw.get("valuation"),
+                "investors": raw.get("investors"),
+            }
+        )
+
+    return _company_reads_adapter.validate_python(records)
 
 
 async def get_companies(
     client: AsyncClient,
     *,
-    industry_id: int | None = None,
-    location_id: int | None = None,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
     page: int = 1,
     size: int = 20,
+    include_total: bool = True,
+    cursor: str | None = None,
+    fields: tuple[str, ...] | None = None,
+    sort: CompanySortKey | None = None,
+    order: SortOrder = "asc",
 ) -> CompanyListResponse:
     """Fetch paginated companies with optional filters.
 
+    The page query and the count query are independent, so they are sent
+    upstream concurrently. Totals come from a per-filter cache, so the count
+    query only runs on a cache miss. When ``include_total`` is False the total
+    is skipped and ``total``/``total_pages`` are returned as None.
+
+    Passing ``cursor`` switches to keyset pagination in the requested order:
+    an empty string starts at the first row and ``next_cursor`` in the
+    response points to the following page. ``page`` is ignored in that mode.
+
+    With the ``snapshot`` backend the whole request is answered from the
+    in-memory company snapshot without any upstream query.
+
     Args:
         client: Async Supabase client instance.
-        industry_id: Optional industry ID to filter by.
-        location_id: Optional location ID to filter by.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
         page: Page number (1-based).
         size: Number of items per page.
+        include_total: Whether to compute the total count of matching companies.
+        cursor: Optional opaque keyset cursor; enables cursor mode when not None.
+        fields: Optional company fields to fetch; all fields when None.
+        sort: Optional metric to sort by; id order when None.
+        order: Sort direction of ``sort``; NULL metrics always come last.
 
     Returns:
         Paginated response with company items and metadata.
+
+    Raises:
+        InvalidCursorError: If ``cursor`` cannot be decoded.
     """
-    raw_data = await company_repository.get_all(
-        client,
-        industry_id=industry_id,
-        location_id=location_id,
+    after_id: int | None = None
+    after_value: int | None = None
+    if cursor:
+        after_id, after_value = _decode_position(cursor, sort=sort, order=order)
+
+    if settings.company_backend == "snapshot":
+        snapshot = await snapshot_cache.get(client)
+        positions = snapshot.positions(
+            industry_id=industry_id,
+            location_id=location_id,
+            ranges=ranges,
+            investor_id=investor_id,
+            sort=sort,
+            order=order,
+        )
+        if cursor is not None:
+            items = snapshot.after(
+                positions,
+                after_id=after_id,
+                limit=size + 1,
+                sort=sort,
+                order=order,
+                after_value=after_value,
+            )
+        else:
+            items = snapshot.page(positions, page=page, size=size)
+        total = len(positions) if include_total else None
+        return _to_list_response(
+            items, total=total, page=page, size=size, cursor=cursor, sort=sort, order=order
+        )
+
+    if sort is not None and fields is not None and sort not in fields:
+        # The next cursor needs the sort value of the last row.
+        fields = (*fields, sort)
+
+    if cursor is not None:
+        # Fetch one extra row to know whether a next page exists.
+        page_query = company_repository.get_after(
+            client,
+            industry_id=industry_id,
+            location_id=location_id,
+            ranges=ranges,
+            investor_id=investor_id,
+            after_id=after_id,
+            limit=size + 1,
+            fields=fields,
+            sort=sort,
+            order=order,
+            after_value=after_value,
+        )
+    else:
+        page_query = company_repository.get_all(
+            client,
+            industry_id=industry_id,
+            location_id=location_id,
+            ranges=ranges,
+            investor_id=investor_id,
+            page=page,
+            size=size,
+            fields=fields,
+            sort=sort,
+            order=order,
+        )
+
+    total = None
+    if include_total:
+        raw_data, total = await asyncio.gather(
+            page_query,
+            totals_cache.get(client, (industry_id, location_id, ranges, investor_id)),
+        )
+    else:
+        raw_data = await page_query
+
+    return _to_list_response(
+        to_company_reads(raw_data),
+        total=total,
         page=page,
         size=size,
+        cursor=cursor,
+        sort=sort,
+        order=order,
     )
 
-    total = await company_repository.count(
-        client,
-        industry_id=industry_id,
-        location_id=location_id,
-    )
 
-    total_pages = ceil(total / size) if total > 0 else 0
-    items = [_to_company_read(record) for record in raw_data]
+def _decode_position(
+    cursor: str, *, sort: CompanySortKey | None, order: SortOrder
+) -> tuple[int, int | None]:
+    """Decode a cursor and check it was issued for the same ordering.
+
+    Args:
+        cursor: Opaque cursor received from the client.
+        sort: Metric the request is sorted by; None for id order.
+        order: Sort direction of ``sort``.
+
+    Returns:
+        The ``(after_id, after_value)`` keyset of the previous page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or from another ordering.
+    """
+    position = decode_cursor(cursor)
+    expected = f"{sort}:{order}" if sort is not None else None
+    after_value = position.get("value")
+    if position.get("sort") != expected:
+        raise InvalidCursorError("Cursor does not match the requested sort")
+    if after_value is not None and not isinstance(after_value, int):
+        raise InvalidCursorError("Malformed cursor")
+    return position["id"], after_value
+
+
+def _to_list_response(
+    items: list[CompanyRead],
+    *,
+    total: int | None,
+    page: int,
+    size: int,
+    cursor: str | None,
+    sort: CompanySortKey | None = None,
+    order: SortOrder = "asc",
+) -> CompanyListResponse:
+    """Wrap a page of companies with pagination metadata.
+
+    In cursor mode ``items`` holds up to ``size + 1`` companies; the extra one
+    only signals that a next page exists and is dropped. When sorted by a
+    metric the next cursor also records the ordering and the last value.
+
+    Args:
+        items: Companies of the page.
+        total: Total matching companies, or None when not requested.
+        page: Page number (1-based).
+        size: Number of items per page.
+        cursor: Keyset cursor of the request; None in page-number mode.
+        sort: Metric the items are sorted by; None for id order.
+        order: Sort direction of ``sort``.
+
+    Returns:
+        Paginated response with company items and metadata.
+    """
+    next_cursor: str | None = None
+    if cursor is not None and len(items) > size:
+        items = items[:size]
+        position: dict[str, Any] = {"id": items[-1].id}
+        if sort is not None:
+            position.update(sort=f"{sort}:{order}", value=getattr(items[-1], sort))
+        next_cursor = encode_cursor(position)
+
+    total_pages: int | None = None
+    if total is not None:
+        total_pages = ceil(total / size) if total > 0 else 0
 
     return CompanyListResponse(
         items=items,
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         size=size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
+async def get_companies_cached(
+    client: AsyncClient,
+    *,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
+    page: int = 1,
+    size: int = 20,
+    include_total: bool = True,
+    cursor: str | None = None,
+    fields: tuple[str, ...] | None = None,
+    sort: CompanySortKey | None = None,
+    order: SortOrder = "asc",
+) -> CompanyListResponse:
+    """Fetch paginated companies through the response cache.
+
+    Same contract as ``get_companies``. Identical parameter sets are served
+    from memory, revalidated in the background once stale, and fall back to
+    the last good response if the upstream fails. ``page`` is left out of
+    the key in cursor mode, where it is ignored.
+
+    Args:
+        client: Async Supabase client instance.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
+        page: Page number (1-based).
+        size: Number of items per page.
+        include_total: Whether to compute the total count of matching companies.
+        cursor: Optional opaque keyset cursor; enables cursor mode when not None.
+        fields: Optional company fields to fetch; all fields when None.
+        sort: Optional metric to sort by; id order when None.
+        order: Sort direction of ``sort``; NULL metrics always come last.
+
+    Returns:
+        Paginated response with company items and metadata.
+
+    Raises:
+        InvalidCursorError: If ``cursor`` cannot be decoded.
+    """
+    key = (
+        industry_id,
+        location_id,
+        ranges,
+        investor_id,
+        page if cursor is None else None,
+        size,
+        include_total,
+        cursor,
+        fields,
+        sort,
+        order,
+    )
+    return await response_cache.get_or_load(
+        key,
+        lambda: get_companies(
+            client,
+            industry_id=industry_id,
+            location_id=location_id,
+            ranges=ranges,
+            investor_id=investor_id,
+            page=page,
+            size=size,
+            include_total=include_total,
+            cursor=cursor,
+            fields=fields,
+            sort=sort,
+            order=order,
+        ),
     )
@@ -0,0 +1,72 @@
+"""Service layer for the dashboard bootstrap payload."""
+
+import asyncio
+
+from supabase._async.client import AsyncClient
+
+from backend.core.responses import ComposedCache
+from backend.core.settings import settings
+from backend.schemas.company import CompanyRanges, CompanySortKey, IdFilter, SortOrder
+from backend.schemas.dashboard import DashboardResponse
+from backend.services import company_service, industry_service, location_service
+
+_dashboards: ComposedCache[DashboardResponse] = ComposedCache(settings.response_render_cache_size)
+"""Dashboard payloads by the identity of their cached parts."""
+
+
+async def get_dashboard(
+    client: AsyncClient,
+    *,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
+    page: int = 1,
+    size: int = 20,
+    include_total: bool = True,
+    sort: CompanySortKey | None = None,
+    order: SortOrder = "asc",
+) -> DashboardResponse:
+    """Fetch the filter options and a page of companies concurrently.
+
+    Industries and locations come from the reference data caches and the
+    companies from the response cache, so a warm dashboard render needs no
+    upstream query at all. While those parts are unchanged the same payload
+    object is returned, so its rendered body and ETag are reused.
+
+    Args:
+        client: Async Supabase client instance.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
+        page: Page number (1-based).
+        size: Number of items per page.
+        include_total: Whether to compute the total count of matching companies.
+        sort: Optional metric to sort by; id order when None.
+        order: Sort direction of ``sort``.
+
+    Returns:
+        Industries, locations and the requested page of companies.
+    """
+    industries, locations, companies = await asyncio.gather(
+        industry_service.get_all_industries(client),
+        location_service.get_all_locations(client),
+        company_service.get_companies_cached(
+            client,
+            industry_id=industry_id,
+            location_id=location_id,
+            ranges=ranges,
+            investor_id=investor_id,
+            page=page,
+            size=size,
+            include_total=include_total,
+            sort=sort,
+            order=order,
+        ),
+    )
+    return _dashboards.get(
+        (industries, locations, companies),
+        None,
+        lambda: DashboardResponse(industries=industries, locations=locations, companies=companies),
+    )
@@ -0,0 +1,212 @@
+"""Service layer for streaming bulk exports of companies."""
+
+import csv
+import io
+from typing import Any, AsyncIterator, Literal
+
+from pydantic import TypeAdapter
+from supabase._async.client import AsyncClient
+
+from backend.repositories import company_repository
+from backend.schemas.company import DEFAULT_FIELDS, CompanyRanges, CompanyRead, IdFilter
+from backend.services.company_service import to_company_reads
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional "analytics" extra
+    pa = None
+    pq = None
+
+COLUMNAR_AVAILABLE = pa is not None
+"""Whether pyarrow is installed and columnar exports can be produced."""
+
+EXPORT_COLUMNS = DEFAULT_FIELDS
+"""Columns written by the NDJSON and CSV exports, in schema order."""
+
+COLUMNAR_FIELDS = (
+    "id",
+    "name",
+    "industry",
+    "location",
+    "products",
+    "founding_year",
+    "total_funding",
+    "arr",
+    "valuation",
+    "employees",
+    "g2_rating",
+)
+"""Company fields fetched for columnar exports."""
+
+_company_adapter = TypeAdapter(CompanyRead)
+_EXPORT_INCLUDE = set(EXPORT_COLUMNS)
+
+
+async def iter_company_chunks(
+    client: AsyncClient,
+    *,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    chunk_size: int = 1000,
+) -> AsyncIterator[list[CompanyRead]]:
+    """Yield all matching companies in id order, one keyset chunk at a time.
+
+    Only one chunk is held in memory, so memory stays flat regardless of
+    the number of matching companies.
+
+    Args:
+        client: Async Supabase client instance.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        chunk_size: Number of rows fetched per upstream query.
+
+    Yields:
+        Lists of CompanyRead schemas, each at most ``chunk_size`` long.
+    """
+    async for raw_data in company_repository.iter_chunks(
+        client,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        chunk_size=chunk_size,
+    ):
+        yield to_company_reads(raw_data)
+
+
+async def stream_ndjson(chunks: AsyncIterator[list[CompanyRead]]) -> AsyncIterator[bytes]:
+    """Encode company chunks as newline-delimited JSON.
+
+    Args:
+        chunks: Async iterator of company chunks.
+
+    Yields:
+        One bytes block per chunk, one JSON object per line.
+    """
+    async for chunk in chunks:
+        yield b"".join(
+            _company_adapter.dump_json(company, include=_EXPORT_INCLUDE) + b"\n"
+            for company in chunk
+        )
+
+
+async def stream_csv(chunks: AsyncIterator[list[CompanyRead]]) -> AsyncIterator[bytes]:
+    """Encode company chunks as CSV with a header row.
+
+    Args:
+        chunks: Async iterator of company chunks.
+
+    Yields:
+        The header line, then one bytes block per chunk.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode()
+
+    async for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [getattr(company, column) for column in EXPORT_COLUMNS] for company in chunk
+        )
+        yield buffer.getvalue().encode()
+
+
+def _columnar_schema() -> Any:
+    """Arrow schema of the columnar company export."""
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("name", pa.string()),
+            ("industry", pa.string()),
+            ("city", pa.string()),
+            ("state", pa.string()),
+            ("country", pa.string()),
+            ("products", pa.string()),
+            ("founding_year", pa.int32()),
+            ("total_funding", pa.int64()),
+            ("arr", pa.int64()),
+            ("valuation", pa.int64()),
+            ("employees", pa.int32()),
+            ("g2_rating", pa.float32()),
+        ]
+    )
+
+
+def _to_record_batch(raw_data: list[dict[str, Any]], schema: Any) -> Any:
+    """Build an Arrow record batch column by column from raw repository rows."""
+    industries = [row.get("industry") or {} for row in raw_data]
+    locations = [row.get("location") or {} for row in raw_data]
+    columns = {
+        "industry": [industry.get("name") for industry in industries],
+        "city": [location.get("city") for location in locations],
+        "state": [location.get("state") for location in locations],
+        "country": [location.get("country") for location in locations],
+    }
+    arrays = [
+        pa.array(
+            columns[field.name]
+            if field.name in columns
+            else [row.get(field.name) for row in raw_data],
+            type=field.type,
+        )
+        for field in schema
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+async def stream_columnar(
+    client: AsyncClient,
+    *,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    chunk_size: int = 1000,
+    columnar_format: Literal["arrow", "parquet"] = "arrow",
+) -> AsyncIterator[bytes]:
+    """Encode matching companies as an Arrow IPC stream or a Parquet file.
+
+    Columns are built straight from the raw repository rows, without going
+    through the JSON response schemas; location is split into city, state
+    and country. Arrow IPC is streamed one record batch per upstream chunk.
+    Parquet needs its footer at the end, so each chunk becomes a row group
+    in an in-memory file that is emitted once complete. Requires pyarrow;
+    check ``COLUMNAR_AVAILABLE`` before streaming.
+
+    Args:
+        client: Async Supabase client instance.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        chunk_size: Number of rows fetched per upstream query.
+        columnar_format: ``arrow`` for Arrow IPC stream, ``parquet`` for Parquet.
+
+    Yields:
+        Encoded bytes blocks.
+    """
+    schema = _columnar_schema()
+    sink = io.BytesIO()
+    if columnar_format == "parquet":
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    async for raw_data in company_repository.iter_chunks(
+        client,
+        industry_id=industry_id,
+        location_id=location_id,
+        ranges=ranges,
+        chunk_size=chunk_size,
+        fields=COLUMNAR_FIELDS,
+    ):
+        writer.write_batch(_to_record_batch(raw_data, schema))
+        if columnar_format == "arrow":
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+
+    writer.close()
+    yield sink.getvalue()
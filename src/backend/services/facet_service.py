@@ -0,0 +1,254 @@
+"""Service layer for company facet counts."""
+
+import asyncio
+from collections import Counter
+from typing import NamedTuple
+
+from supabase._async.client import AsyncClient
+
+from backend.core import cache
+from backend.core.responses import ComposedCache
+from backend.core.settings import settings
+from backend.core.versioned_cache import VersionedCache
+from backend.repositories import company_repository
+from backend.repositories.company_snapshot import CompanySnapshot
+from backend.schemas.company import CompanyFacets, CompanyRanges, FacetCount, IdFilter
+from backend.services import company_service
+
+FacetMatrix = dict[tuple[int | None, int | None], int]
+"""Company count per (industry_id, location_id) pair."""
+
+_METRICS = tuple(dict.fromkeys(column for column, _ in company_repository.RANGE_BOUNDS.values()))
+"""Metric columns ``CompanyRanges`` bounds can filter on."""
+
+_TABLE_FIELDS = ("id", "industry_id", "location_id", *_METRICS, "investor_ids")
+"""Columns needed to filter and count; ``id`` drives the keyset walk."""
+
+
+class FacetRow(NamedTuple):
+    """The columns of one company that facet filters look at."""
+
+    industry_id: int | None
+    location_id: int | None
+    metrics: dict[str, float | None]
+    investor_ids: frozenset[int]
+
+
+class FacetTable(NamedTuple):
+    """Every company's filter columns plus the unfiltered count matrix."""
+
+    rows: list[FacetRow]
+    matrix: FacetMatrix
+
+
+async def _load_table(client: AsyncClient) -> FacetTable:
+    """Fetch the filter columns of every company and count the full matrix.
+
+    Only the foreign keys, the metric columns and investor ids are fetched,
+    in keyset chunks, once per company table version. Metric bounds and the
+    investor filter are then applied in memory.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Rows for in-memory filtering and the industry×location matrix of
+        all companies.
+    """
+    rows: list[FacetRow] = []
+    async for chunk in company_repository.iter_chunks(
+        client, chunk_size=settings.export_chunk_size, fields=_TABLE_FIELDS
+    ):
+        rows.extend(
+            FacetRow(
+                industry_id=row["industry_id"],
+                location_id=row["location_id"],
+                metrics={metric: row.get(metric) for metric in _METRICS},
+                investor_ids=frozenset(
+                    investor["investor_id"] for investor in row.get("investor_ids") or ()
+                ),
+            )
+            for row in chunk
+        )
+    matrix = Counter((row.industry_id, row.location_id) for row in rows)
+    return FacetTable(rows=rows, matrix=dict(matrix))
+
+
+async def _load_version(
+    client: AsyncClient,
+) -> tuple[tuple[int, str | None], tuple[int, tuple[int, int] | None]]:
+    """Probe the versions of the tables the facet table was built from.
+
+    Investor links are stored per company for the investor filter, and
+    changing them does not move the company's ``updated_at``, so the link
+    table is probed as well.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Versions of the company table and of the ``company_investor`` links.
+    """
+    companies, links = await asyncio.gather(
+        company_repository.get_version(client),
+        company_repository.get_investor_links_version(client),
+    )
+    return companies, links
+
+
+table_cache = cache.register(
+    VersionedCache(
+        "company_facets",
+        _load_table,
+        _load_version,
+        check_interval=settings.company_facets_check_interval,
+    )
+)
+"""Facet filter columns of every company, reloaded when companies or investor links change."""
+
+_facets: ComposedCache[CompanyFacets] = ComposedCache(settings.response_render_cache_size)
+"""Facet counts by data source identity and filter set."""
+
+
+def _filtered_matrix(
+    table: FacetTable, ranges: CompanyRanges | None, investor_id: int | None
+) -> FacetMatrix:
+    """Count the industry×location matrix of companies passing the filters.
+
+    NULL metrics never match a bound on that metric, as upstream.
+
+    Args:
+        table: Loaded facet table.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
+
+    Returns:
+        Company count per (industry_id, location_id) pair.
+    """
+    bounds = []
+    if ranges is not None:
+        bounds = [
+            (column, operator, value)
+            for bound, (column, operator) in company_repository.RANGE_BOUNDS.items()
+            if (value := getattr(ranges, bound)) is not None
+        ]
+    if not bounds and investor_id is None:
+        return table.matrix
+
+    def matches(row: FacetRow) -> bool:
+        if investor_id is not None and investor_id not in row.investor_ids:
+            return False
+        for column, operator, value in bounds:
+            metric = row.metrics[column]
+            if metric is None or (metric < value if operator == "gte" else metric > value):
+                return False
+        return True
+
+    return dict(Counter((row.industry_id, row.location_id) for row in table.rows if matches(row)))
+
+
+def _matches(value: int | None, id_filter: IdFilter | None) -> bool:
+    """Whether a matrix key passes an optional one-or-many ID filter."""
+    if id_filter is None:
+        return True
+    if isinstance(id_filter, tuple):
+        return value in id_filter
+    return value == id_filter
+
+
+def _to_facets(counts: dict[int, int]) -> list[FacetCount]:
+    """Convert a count mapping to facet entries ordered by ID."""
+    return [FacetCount(id=key, count=counts[key]) for key in sorted(counts)]
+
+
+def _snapshot_facets(
+    snapshot: CompanySnapshot,
+    industry_id: IdFilter | None,
+    location_id: IdFilter | None,
+    ranges: CompanyRanges | None,
+    investor_id: int | None,
+) -> CompanyFacets:
+    """Count facets from the in-memory snapshot columns."""
+    return CompanyFacets(
+        total=len(
+            snapshot.positions(
+                industry_id=industry_id,
+                location_id=location_id,
+                ranges=ranges,
+                investor_id=investor_id,
+            )
+        ),
+        industries=_to_facets(
+            snapshot.facet_counts(
+                "industry_id", location_id=location_id, ranges=ranges, investor_id=investor_id
+            )
+        ),
+        locations=_to_facets(
+            snapshot.facet_counts(
+                "location_id", industry_id=industry_id, ranges=ranges, investor_id=investor_id
+            )
+        ),
+    )
+
+
+def _table_facets(
+    table: FacetTable,
+    industry_id: IdFilter | None,
+    location_id: IdFilter | None,
+    ranges: CompanyRanges | None,
+    investor_id: int | None,
+) -> CompanyFacets:
+    """Count facets in one pass over the filtered industry×location matrix."""
+    industries: Counter[int] = Counter()
+    locations: Counter[int] = Counter()
+    total = 0
+    for (row_industry, row_location), count in _filtered_matrix(table, ranges, investor_id).items():
+        industry_matches = _matches(row_industry, industry_id)
+        location_matches = _matches(row_location, location_id)
+        if location_matches and row_industry is not None:
+            industries[row_industry] += count
+        if industry_matches and row_location is not None:
+            locations[row_location] += count
+        if industry_matches and location_matches:
+            total += count
+
+    return CompanyFacets(
+        total=total, industries=_to_facets(industries), locations=_to_facets(locations)
+    )
+
+
+async def get_facets(
+    client: AsyncClient,
+    *,
+    industry_id: IdFilter | None = None,
+    location_id: IdFilter | None = None,
+    ranges: CompanyRanges | None = None,
+    investor_id: int | None = None,
+) -> CompanyFacets:
+    """Count matching companies per industry and per location.
+
+    Industry counts apply every filter except ``industry_id`` and location
+    counts every filter except ``location_id``, so each option shows what
+    selecting it would return. With the ``snapshot`` backend the counts
+    are computed from the in-memory columns; otherwise they come from one
+    pass over an industry×location count matrix built from a cached table
+    of every company's filter columns. Results are memoized per data
+    source and filter set, so repeated requests reuse the rendered body.
+
+    Args:
+        client: Async Supabase client instance.
+        industry_id: Optional industry ID, or IDs matching any, to filter by.
+        location_id: Optional location ID, or IDs matching any, to filter by.
+        ranges: Optional bounds on numeric company metrics.
+        investor_id: Optional investor ID to filter by.
+
+    Returns:
+        Facet counts for industries and locations plus the filtered total.
+    """
+    filters = (industry_id, location_id, ranges, investor_id)
+    if settings.company_backend == "snapshot":
+        snapshot = await company_service.snapshot_cache.get(client)
+        return _facets.get((snapshot,), filters, lambda: _snapshot_facets(snapshot, *filters))
+
+    table = await table_cache.get(client)
+    return _facets.get((table,), filters, lambda: _table_facets(table, *filters))
@@ -2,12 +2,14 @@
 
 from supabase._async.client import AsyncClient
 
+from backend.core import cache
+from backend.core.settings import settings
 from backend.repositories import industry_repository
 from backend.schemas.industry import IndustryRead
 
 
-async def get_all_industries(client: AsyncClient) -> list[IndustryRead]:
-    """Fetch all industries and return as validated schemas.
+async def _load_industries(client: AsyncClient) -> list[IndustryRead]:
+    """Fetch all industries from the repository and validate them.
 
     Args:
         client: Async Supabase client instance.
@@ -17,3 +19,24 @@ async def get_all_industries(client: AsyncClient) -> list[IndustryRead]:
     """
     raw_data = await industry_repository.get_all(client)
     return [IndustryRead(**item) for item in raw_data]
+
+
+industries_cache = cache.register(
+    cache.TTLCache("industries", _load_industries, ttl=settings.reference_cache_ttl)
+)
+"""Reference data cache for the industry table."""
+
+
+async def get_all_industries(client: AsyncClient) -> list[IndustryRead]:
+    """Fetch all industries and return as validated schemas.
+
+    Served from the reference data cache; the table is only queried when the
+    cached list is missing or older than the configured TTL.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        List of IndustryRead schemas.
+    """
+    return await industries_cache.get(client)
@@ -0,0 +1,42 @@
+"""Service layer for investor business logic."""
+
+from supabase._async.client import AsyncClient
+
+from backend.core import cache
+from backend.core.settings import settings
+from backend.repositories import investor_repository
+from backend.schemas.investor import InvestorRead
+
+
+async def _load_investors(client: AsyncClient) -> list[InvestorRead]:
+    """Fetch all investors from the repository and validate them.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        List of InvestorRead schemas.
+    """
+    raw_data = await investor_repository.get_all(client)
+    return [InvestorRead(**item) for item in raw_data]
+
+
+investors_cache = cache.register(
+    cache.TTLCache("investors", _load_investors, ttl=settings.reference_cache_ttl)
+)
+"""Reference data cache for the investor table."""
+
+
+async def get_all_investors(client: AsyncClient) -> list[InvestorRead]:
+    """Fetch all investors and return as validated schemas.
+
+    Served from the reference data cache; the table is only queried when the
+    cached list is missing or older than the configured TTL.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        List of InvestorRead schemas.
+    """
+    return await investors_cache.get(client)
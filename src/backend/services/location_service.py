@@ -2,12 +2,14 @@
 
 from supabase._async.client import AsyncClient
 
+from backend.core import cache
+from backend.core.settings import settings
 from backend.repositories import location_repository
 from backend.schemas.location import LocationRead
 
 
-async def get_all_locations(client: AsyncClient) -> list[LocationRead]:
-    """Fetch all locations and return as validated schemas.
+async def _load_locations(client: AsyncClient) -> list[LocationRead]:
+    """Fetch all locations from the repository and validate them.
 
     Args:
         client: Async Supabase client instance.
@@ -17,3 +19,24 @@ async def get_all_locations(client: AsyncClient) -> list[LocationRead]:
     """
     raw_data = await location_repository.get_all(client)
     return [LocationRead(**item) for item in raw_data]
+
+
+locations_cache = cache.register(
+    cache.TTLCache("locations", _load_locations, ttl=settings.reference_cache_ttl)
+)
+"""Reference data cache for the location table."""
+
+
+async def get_all_locations(client: AsyncClient) -> list[LocationRead]:
+    """Fetch all locations and return as validated schemas.
+
+    Served from the reference data cache; the table is only queried when the
+    cached list is missing or older than the configured TTL.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        List of LocationRead schemas.
+    """
+    return await locations_cache.get(client)
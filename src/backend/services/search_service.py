@@ -0,0 +1,134 @@
+"""Service layer for company search."""
+
+from typing import Any
+
+from supabase._async.client import AsyncClient
+
+from backend.core import cache
+from backend.core.responses import ComposedCache
+from backend.core.settings import settings
+from backend.core.versioned_cache import VersionedCache
+from backend.repositories import company_repository, company_search
+from backend.repositories.company_search import CompanySearchIndex
+from backend.schemas.company import CompanySearchHit, CompanySearchResponse
+from backend.services.company_service import to_company_reads
+
+SEARCH_AVAILABLE = company_search.np is not None
+"""Whether numpy is installed and the search index can be built."""
+
+
+async def _load_index(client: AsyncClient) -> CompanySearchIndex:
+    """Build the search index from the whole company table.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        A new index over every company.
+    """
+    rows: list[dict[str, Any]] = []
+    async for chunk in company_repository.iter_chunks(
+        client, chunk_size=settings.export_chunk_size
+    ):
+        rows.extend(chunk)
+    return CompanySearchIndex(rows, to_company_reads(rows))
+
+
+async def _load_version(client: AsyncClient) -> tuple[int, str | None]:
+    """Probe the company table version the index was built from.
+
+    Args:
+        client: Async Supabase client instance.
+
+    Returns:
+        Row count and latest update time of the company table.
+    """
+    return await company_repository.get_version(client)
+
+
+async def _update_index(
+    client: AsyncClient,
+    index: CompanySearchIndex,
+    old: tuple[int, str | None],
+    new: tuple[int, str | None],
+) -> CompanySearchIndex | None:
+    """Apply the companies changed since the last version to the index.
+
+    Rows updated since the previous latest ``updated_at`` are re-indexed in
+    place. Deletions do not move ``updated_at``, so when the company count
+    no longer matches the index, or too many rows changed to fetch in one
+    query, the index is rebuilt instead. It is also rebuilt once updates
+    have left more stale positions behind than there are companies.
+
+    Args:
+        client: Async Supabase client instance.
+        index: Index built for version ``old``.
+        old: Previous (count, latest ``updated_at``) version.
+        new: Current (count, latest ``updated_at``) version.
+
+    Returns:
+        The updated index, or None to request a full rebuild.
+    """
+    _, since = old
+    count, _ = new
+    if since is None:
+        return None
+
+    limit = settings.export_chunk_size
+    rows = await company_repository.get_updated_since(client, since, limit=limit)
+    if len(rows) >= limit:
+        return None
+
+    index.upsert(rows, to_company_reads(rows))
+    if len(index) != count or index.dead_positions > count:
+        return None
+    return index
+
+
+index_cache = VersionedCache(
+    "company_search",
+    _load_index,
+    _load_version,
+    check_interval=settings.company_search_check_interval,
+    updater=_update_index,
+)
+"""Company search index, updated incrementally as companies change."""
+
+if SEARCH_AVAILABLE:
+    cache.register(index_cache)
+
+_results: ComposedCache[CompanySearchResponse] = ComposedCache(settings.response_render_cache_size)
+"""Search responses by index identity, index generation, query and limit."""
+
+
+async def search_companies(
+    client: AsyncClient, query: str, *, limit: int = 10
+) -> CompanySearchResponse:
+    """Search companies by name and products, typo-tolerant and ranked.
+
+    Served from an in-process trigram index; a search costs no upstream
+    query, only a periodic version probe keeps the index current. Repeated
+    searches against an unchanged index return the same response object.
+
+    Requires numpy; check ``SEARCH_AVAILABLE`` before calling.
+
+    Args:
+        client: Async Supabase client instance.
+        query: Free-text search.
+        limit: Maximum number of results.
+
+    Returns:
+        Matching companies with their scores, best first.
+    """
+    index = await index_cache.get(client)
+    return _results.get(
+        (index,),
+        (index.generation, query, limit),
+        lambda: CompanySearchResponse(
+            query=query,
+            items=[
+                CompanySearchHit(company=company, score=score)
+                for company, score in index.search(query, limit=limit)
+            ],
+        ),
+    )
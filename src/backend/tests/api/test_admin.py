@@ -0,0 +1,120 @@
+"""Tests for admin API endpoints."""
+
+from typing import Any
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+
+def test_invalidate_cache_requires_token(test_client: TestClient) -> None:
+    """Test that the endpoint is rejected without the admin token."""
+    # Setup
+    with patch("backend.api.admin.settings.admin_token", "secret"):
+        # Act
+        response = test_client.post("/api/v1/admin/cache/invalidate")
+
+    # Assert
+    assert response.status_code == 403
+
+
+def test_invalidate_cache_disabled_without_configured_token(test_client: TestClient) -> None:
+    """Test that admin endpoints are disabled when no token is configured."""
+    # Setup
+    with patch("backend.api.admin.settings.admin_token", ""):
+        # Act
+        response = test_client.post("/api/v1/admin/cache/invalidate", headers={"X-Admin-Token": ""})
+
+    # Assert
+    assert response.status_code == 403
+
+
+def test_invalidate_cache_reloads_industries(
+    test_client: TestClient, sample_industries: list[dict[str, Any]]
+) -> None:
+    """Test that invalidating makes the next request hit the repository again."""
+    # Setup
+    with (
+        patch("backend.api.admin.settings.admin_token", "secret"),
+        patch("backend.services.industry_service.industry_repository.get_all") as mock_get_all,
+    ):
+        mock_get_all.return_value = sample_industries
+        test_client.get("/api/v1/industries")
+        test_client.get("/api/v1/industries")
+        assert mock_get_all.call_count == 1
+
+        # Act
+        response = test_client.post(
+            "/api/v1/admin/cache/invalidate?name=industries",
+            headers={"X-Admin-Token": "secret"},
+        )
+        test_client.get("/api/v1/industries")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"invalidated": ["industries"]}
+        assert mock_get_all.call_count == 2
+
+
+def test_invalidate_unknown_cache_returns_404(test_client: TestClient) -> None:
+    """Test that an unknown cache name returns 404."""
+    # Setup
+    with patch("backend.api.admin.settings.admin_token", "secret"):
+        # Act
+        response = test_client.post(
+            "/api/v1/admin/cache/invalidate?name=unknown",
+            headers={"X-Admin-Token": "secret"},
+        )
+
+    # Assert
+    assert response.status_code == 404
+
+
+def test_cache_stats_reports_response_cache_counters(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that the stats endpoint exposes hit/miss counters."""
+    # Setup
+    with (
+        patch("backend.api.admin.settings.admin_token", "secret"),
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = len(sample_companies_raw)
+        test_client.get("/api/v1/companies?page=7")
+        test_client.get("/api/v1/companies?page=7")
+
+        # Act
+        response = test_client.get("/api/v1/admin/cache/stats", headers={"X-Admin-Token": "secret"})
+
+    # Assert
+    assert response.status_code == 200
+    stats = response.json()["company_responses"]
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
+
+
+def test_invalidate_company_reloads_detail(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that invalidating one company reloads only its details."""
+    # Setup
+    with (
+        patch("backend.api.admin.settings.admin_token", "secret"),
+        patch("backend.repositories.company_repository.get_by_id") as mock_get_by_id,
+    ):
+        mock_get_by_id.return_value = sample_companies_raw[0]
+        test_client.get("/api/v1/companies/1")
+        test_client.get("/api/v1/companies/1")
+        assert mock_get_by_id.call_count == 1
+
+        # Act
+        response = test_client.post(
+            "/api/v1/admin/cache/companies/1/invalidate", headers={"X-Admin-Token": "secret"}
+        )
+        test_client.get("/api/v1/companies/1")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"invalidated": ["company_detail"]}
+        assert mock_get_by_id.call_count == 2
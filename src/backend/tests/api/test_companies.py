@@ -3,8 +3,11 @@
 from typing import Any
 from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
 
+from backend.schemas.company import CompanyRanges
+
 
 def test_list_companies_returns_200(
     test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
@@ -103,6 +106,155 @@ def test_list_companies_with_combined_filters(
         assert len(data["items"]) == 1
 
 
+def test_list_companies_with_range_filters(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that metric range parameters reach the repository as one filter."""
+    # Setup
+    with (
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = len(sample_companies_raw)
+
+        # Act
+        response = test_client.get("/api/v1/companies?min_arr=1000000&founded_before=2015")
+
+        # Assert
+        assert response.status_code == 200
+        assert mock_get_all.call_args.kwargs["ranges"] == CompanyRanges(
+            min_arr=1_000_000, founded_before=2015
+        )
+        assert mock_count.call_args.kwargs["ranges"] == mock_get_all.call_args.kwargs["ranges"]
+
+
+def test_list_companies_without_range_filters_passes_none(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that requests without bounds share the unfiltered cache keys."""
+    # Setup
+    with (
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = len(sample_companies_raw)
+
+        # Act
+        test_client.get("/api/v1/companies")
+
+        # Assert
+        assert mock_get_all.call_args.kwargs["ranges"] is None
+
+
+def test_list_companies_negative_min_arr_returns_422(test_client: TestClient) -> None:
+    """Test that negative metric bounds are rejected."""
+    # Act
+    response = test_client.get("/api/v1/companies?min_arr=-1")
+
+    # Assert
+    assert response.status_code == 422
+
+
+def test_list_companies_sorted(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that sort and order reach the repository."""
+    # Setup
+    with (
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = len(sample_companies_raw)
+
+        # Act
+        response = test_client.get("/api/v1/companies?sort=valuation&order=desc")
+
+        # Assert
+        assert response.status_code == 200
+        assert mock_get_all.call_args.kwargs["sort"] == "valuation"
+        assert mock_get_all.call_args.kwargs["order"] == "desc"
+
+
+def test_list_companies_unknown_sort_returns_422(test_client: TestClient) -> None:
+    """Test that only metric sort keys are accepted."""
+    # Act
+    response = test_client.get("/api/v1/companies?sort=name")
+
+    # Assert
+    assert response.status_code == 422
+
+
+def test_list_companies_with_investors(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that investors are embedded only on request and filtered by id."""
+    # Setup
+    rows = [{**row, "investors": [{"id": 7, "name": "Accel"}]} for row in sample_companies_raw]
+
+    with (
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = rows
+        mock_count.return_value = len(rows)
+
+        # Act
+        embedded = test_client.get("/api/v1/companies?investor_id=7&include_investors=true")
+        plain = test_client.get("/api/v1/companies")
+
+        # Assert
+        assert embedded.status_code == 200
+        assert embedded.json()["items"][0]["investors"] == [{"id": 7, "name": "Accel"}]
+        assert mock_get_all.call_args_list[0].kwargs["investor_id"] == 7
+        assert "investors" in mock_get_all.call_args_list[0].kwargs["fields"]
+        assert "investors" not in plain.json()["items"][0]
+        assert mock_get_all.call_args_list[1].kwargs["fields"] is None
+
+
+def test_list_companies_with_multiple_industries(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that repeated and comma-separated IDs become one canonical filter."""
+    # Setup
+    with (
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = len(sample_companies_raw)
+
+        # Act
+        first = test_client.get("/api/v1/companies?industry_id=3,1&industry_id=1&location_id=2")
+        second = test_client.get("/api/v1/companies?industry_id=1&industry_id=3&location_id=2")
+
+        # Assert
+        assert first.status_code == second.status_code == 200
+        mock_get_all.assert_called_once()
+        assert mock_get_all.call_args.kwargs["industry_id"] == (1, 3)
+        assert mock_get_all.call_args.kwargs["location_id"] == 2
+        assert mock_count.call_args.kwargs["industry_id"] == (1, 3)
+
+
+def test_list_companies_invalid_industry_returns_422(test_client: TestClient) -> None:
+    """Test that non-integer IDs are rejected."""
+    # Act
+    response = test_client.get("/api/v1/companies?industry_id=1,abc")
+
+    # Assert
+    assert response.status_code == 422
+    assert response.json()["detail"] == [
+        {
+            "type": "int_parsing",
+            "loc": ["query", "industry_id"],
+            "msg": "Input should be a valid integer, unable to parse string as an integer",
+            "input": "abc",
+        }
+    ]
+
+
 def test_list_companies_pagination(
     test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
 ) -> None:
@@ -200,3 +352,110 @@ def test_list_companies_response_format(
         ]
         for field in required_fields:
             assert field in company
+
+
+def test_list_companies_without_total(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that include_total=false returns items without count metadata."""
+    # Setup
+    with (
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sample_companies_raw
+
+        # Act
+        response = test_client.get("/api/v1/companies?include_total=false")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == len(sample_companies_raw)
+        assert data["total"] is None
+        assert data["total_pages"] is None
+        mock_count.assert_not_called()
+
+
+@pytest.mark.parametrize("cursor", ["garbage!", "é"])
+def test_list_companies_invalid_cursor_returns_400(test_client: TestClient, cursor: str) -> None:
+    """Test that a malformed or non-ASCII cursor returns 400."""
+    # Act
+    response = test_client.get("/api/v1/companies", params={"cursor": cursor})
+
+    # Assert
+    assert response.status_code == 400
+
+
+def test_list_companies_served_from_response_cache(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that identical requests hit the upstream once."""
+    # Setup
+    with (
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = len(sample_companies_raw)
+
+        # Act
+        first = test_client.get("/api/v1/companies?industry_id=1")
+        second = test_client.get("/api/v1/companies?industry_id=1")
+
+        # Assert
+        assert first.json() == second.json()
+        mock_get_all.assert_called_once()
+
+
+def test_list_companies_cursor_mode_ignores_page_in_cache_key(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that the same cursor page is cached once whatever page is sent."""
+    # Setup
+    with patch("backend.repositories.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        first = test_client.get("/api/v1/companies?cursor=&include_total=false&page=1")
+        second = test_client.get("/api/v1/companies?cursor=&include_total=false&page=5")
+
+        # Assert
+        assert first.json() == second.json()
+        mock_get_after.assert_called_once()
+
+
+def test_list_companies_with_sparse_fields(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that fields= returns only the requested item fields plus id."""
+    # Setup
+    sparse = [
+        {"id": row["id"], "name": row["name"], "arr": row["arr"]} for row in sample_companies_raw
+    ]
+
+    with (
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sparse
+        mock_count.return_value = len(sparse)
+
+        # Act
+        response = test_client.get("/api/v1/companies?fields=name,arr")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == sparse
+        assert data["total"] == len(sparse)
+        assert mock_get_all.call_args.kwargs["fields"] == ("id", "name", "arr")
+
+
+def test_list_companies_with_unknown_field_returns_400(test_client: TestClient) -> None:
+    """Test that an unknown field name returns 400."""
+    # Act
+    response = test_client.get("/api/v1/companies?fields=name,created_by")
+
+    # Assert
+    assert response.status_code == 400
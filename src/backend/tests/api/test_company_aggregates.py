@@ -0,0 +1,55 @@
+"""Tests for the company aggregates endpoint."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_get_company_aggregates(test_client: TestClient) -> None:
+    """Test that aggregates are grouped by the requested dimension."""
+    pytest.importorskip("numpy")
+    # Setup
+    rows = [
+        {
+            "id": 1,
+            "industry": {"name": "CRM"},
+            "location": {"city": "Austin", "state": "TX", "country": "USA"},
+            "arr": 100,
+            "valuation": None,
+            "total_funding": 50,
+        }
+    ]
+
+    with (
+        patch("backend.repositories.company_repository.get_after") as mock_get_after,
+        patch("backend.repositories.company_repository.get_version") as mock_get_version,
+        patch("backend.repositories.industry_repository.get_version") as mock_industry_version,
+        patch("backend.repositories.location_repository.get_version") as mock_location_version,
+    ):
+        mock_get_after.return_value = rows
+        mock_get_version.return_value = (1, "2025-01-01T00:00:00Z")
+        mock_industry_version.return_value = (1, "2025-01-01T00:00:00Z")
+        mock_location_version.return_value = (1, "2025-01-01T00:00:00Z")
+
+        # Act
+        response = test_client.get("/api/v1/companies/aggregates?group_by=country")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["group_by"] == "country"
+        assert data["groups"][0]["group"] == "USA"
+        assert data["groups"][0]["arr"]["median"] == 100
+        assert data["groups"][0]["valuation"]["count"] == 0
+
+
+def test_get_company_aggregates_without_numpy_returns_501(test_client: TestClient) -> None:
+    """Test that aggregates report a missing optional dependency."""
+    # Setup
+    with patch("backend.services.aggregate_service.AGGREGATES_AVAILABLE", False):
+        # Act
+        response = test_client.get("/api/v1/companies/aggregates")
+
+    # Assert
+    assert response.status_code == 501
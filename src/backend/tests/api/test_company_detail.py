@@ -0,0 +1,89 @@
+"""Tests for the company detail and batch lookup endpoints."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_get_company(test_client: TestClient, sample_companies_raw: list[dict[str, Any]]) -> None:
+    """Test that the detail endpoint returns the company with its investors."""
+    # Setup
+    raw = {**sample_companies_raw[0], "investors": [{"id": 3, "name": "Accel"}]}
+
+    with patch("backend.repositories.company_repository.get_by_id") as mock_get_by_id:
+        mock_get_by_id.return_value = raw
+
+        # Act
+        response = test_client.get(f"/api/v1/companies/{raw['id']}")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["id"] == raw["id"]
+        assert response.json()["investors"] == [{"id": 3, "name": "Accel"}]
+
+
+def test_get_companies_batch(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that the batch endpoint returns found companies and missing ids."""
+    # Setup
+    raw = sample_companies_raw[0]
+
+    with patch("backend.repositories.company_repository.get_by_ids") as mock_get_by_ids:
+        mock_get_by_ids.return_value = [raw]
+
+        # Act
+        response = test_client.post("/api/v1/companies/batch", json={"ids": [999, raw["id"]]})
+
+        # Assert
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [raw["id"]]
+        assert response.json()["missing"] == [999]
+
+
+@pytest.mark.parametrize("ids", [[], list(range(101))])
+def test_get_companies_batch_validates_size(test_client: TestClient, ids: list[int]) -> None:
+    """Test that empty and oversized batches return 422."""
+    # Act
+    response = test_client.post("/api/v1/companies/batch", json={"ids": ids})
+
+    # Assert
+    assert response.status_code == 422
+
+
+def test_get_company_not_found_returns_404(test_client: TestClient) -> None:
+    """Test that an unknown company id returns 404."""
+    # Setup
+    with patch("backend.repositories.company_repository.get_by_id") as mock_get_by_id:
+        mock_get_by_id.return_value = None
+
+        # Act
+        response = test_client.get("/api/v1/companies/999")
+
+        # Assert
+        assert response.status_code == 404
+
+
+def test_get_company_does_not_shadow_static_routes(test_client: TestClient) -> None:
+    """Test that /companies/facets is not captured by the detail route."""
+    # Setup
+    with (
+        patch("backend.repositories.company_repository.get_by_id") as mock_get_by_id,
+        patch("backend.repositories.company_repository.get_after") as mock_get_after,
+        patch("backend.repositories.company_repository.get_version") as mock_get_version,
+        patch(
+            "backend.repositories.company_repository.get_investor_links_version"
+        ) as mock_get_links_version,
+    ):
+        mock_get_after.return_value = []
+        mock_get_version.return_value = (0, None)
+        mock_get_links_version.return_value = (0, None)
+
+        # Act
+        response = test_client.get("/api/v1/companies/facets")
+
+        # Assert
+        assert response.status_code == 200
+        mock_get_by_id.assert_not_called()
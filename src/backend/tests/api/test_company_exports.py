@@ -0,0 +1,75 @@
+"""Tests for the company export endpoints."""
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_export_companies_ndjson(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that GET /api/v1/companies/export streams NDJSON by default."""
+    # Setup
+    with patch("backend.repositories.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        response = test_client.get("/api/v1/companies/export?industry_id=1")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == [row["id"] for row in sample_companies_raw]
+        assert mock_get_after.call_args.kwargs["industry_id"] == 1
+
+
+def test_export_companies_csv(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that format=csv streams CSV with a header row."""
+    # Setup
+    with patch("backend.repositories.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        response = test_client.get("/api/v1/companies/export?format=csv")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert len(response.text.splitlines()) == len(sample_companies_raw) + 1
+
+
+def test_export_companies_columnar_arrow(
+    test_client: TestClient, sample_companies_raw: list[dict[str, Any]]
+) -> None:
+    """Test that the columnar export returns an Arrow IPC stream."""
+    # Setup
+    pa = pytest.importorskip("pyarrow")
+
+    with patch("backend.repositories.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        response = test_client.get("/api/v1/companies/export/columnar?format=arrow")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == len(sample_companies_raw)
+
+
+def test_export_companies_columnar_without_pyarrow_returns_501(test_client: TestClient) -> None:
+    """Test that the columnar export reports a missing optional dependency."""
+    # Setup
+    with patch("backend.services.export_service.COLUMNAR_AVAILABLE", False):
+        # Act
+        response = test_client.get("/api/v1/companies/export/columnar")
+
+    # Assert
+    assert response.status_code == 501
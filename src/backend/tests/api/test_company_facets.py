@@ -0,0 +1,37 @@
+"""Tests for the company facets endpoint."""
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+
+def test_get_company_facets(test_client: TestClient) -> None:
+    """Test that facets are returned for the current filter set."""
+    # Setup
+    rows = [
+        {"id": 1, "industry_id": 1, "location_id": 1, "investor_ids": [{"investor_id": 3}]},
+        {"id": 2, "industry_id": 2, "location_id": 1, "investor_ids": [{"investor_id": 3}]},
+        {"id": 3, "industry_id": 2, "location_id": 2, "investor_ids": []},
+    ]
+
+    with (
+        patch("backend.repositories.company_repository.get_after") as mock_get_after,
+        patch("backend.repositories.company_repository.get_version") as mock_get_version,
+        patch(
+            "backend.repositories.company_repository.get_investor_links_version"
+        ) as mock_get_links_version,
+    ):
+        mock_get_after.return_value = rows
+        mock_get_version.return_value = (3, "2025-01-01T00:00:00Z")
+        mock_get_links_version.return_value = (2, (2, 3))
+
+        # Act
+        response = test_client.get("/api/v1/companies/facets?industry_id=1&investor_id=3")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 1,
+            "industries": [{"id": 1, "count": 1}, {"id": 2, "count": 1}],
+            "locations": [{"id": 1, "count": 1}],
+        }
@@ -0,0 +1,55 @@
+"""Tests for the company search endpoint."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_search_companies(test_client: TestClient) -> None:
+    """Test that GET /api/v1/companies/search ranks typo-tolerant matches."""
+    pytest.importorskip("numpy")
+    # Setup
+    rows = [
+        {"id": 1, "name": "Salesforce", "products": "CRM"},
+        {"id": 2, "name": "Datadog", "products": "Observability"},
+    ]
+
+    with (
+        patch("backend.repositories.company_repository.get_after") as mock_get_after,
+        patch("backend.repositories.company_repository.get_version") as mock_get_version,
+    ):
+        mock_get_after.return_value = rows
+        mock_get_version.return_value = (2, "2025-01-01T00:00:00Z")
+
+        # Act
+        response = test_client.get("/api/v1/companies/search?q=salesfroce&limit=5")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query"] == "salesfroce"
+        assert [hit["company"]["id"] for hit in data["items"]] == [1]
+        assert 0 < data["items"][0]["score"] < 1
+        assert "stale-while-revalidate" in response.headers["cache-control"]
+
+
+@pytest.mark.parametrize("query", ["q=", "q=a&limit=0", "q=a&limit=51"])
+def test_search_companies_validates_query(test_client: TestClient, query: str) -> None:
+    """Test that an empty query or an out-of-range limit is rejected."""
+    # Act
+    response = test_client.get(f"/api/v1/companies/search?{query}")
+
+    # Assert
+    assert response.status_code == 422
+
+
+def test_search_companies_without_numpy_returns_501(test_client: TestClient) -> None:
+    """Test that search reports a missing optional dependency."""
+    # Setup
+    with patch("backend.services.search_service.SEARCH_AVAILABLE", False):
+        # Act
+        response = test_client.get("/api/v1/companies/search?q=sales")
+
+    # Assert
+    assert response.status_code == 501
@@ -0,0 +1,76 @@
+"""Tests for dashboard API endpoints."""
+
+from typing import Any
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+
+def test_get_dashboard_returns_all_payloads(
+    test_client: TestClient,
+    sample_industries: list[dict[str, Any]],
+    sample_locations: list[dict[str, Any]],
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that GET /api/v1/dashboard returns options and a company page."""
+    # Setup
+    with (
+        patch("backend.services.industry_service.industry_repository.get_all") as mock_industries,
+        patch("backend.services.location_service.location_repository.get_all") as mock_locations,
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_industries.return_value = sample_industries
+        mock_locations.return_value = sample_locations
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = len(sample_companies_raw)
+
+        # Act
+        response = test_client.get("/api/v1/dashboard?industry_id=1&page=1&size=10")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["industries"] == sample_industries
+        assert len(data["locations"]) == len(sample_locations)
+        assert data["companies"]["total"] == len(sample_companies_raw)
+        assert data["companies"]["size"] == 10
+        assert mock_get_all.call_args.kwargs["industry_id"] == 1
+
+
+def test_get_dashboard_invalid_page_returns_422(test_client: TestClient) -> None:
+    """Test that paging parameters are validated like /companies."""
+    # Act
+    response = test_client.get("/api/v1/dashboard?page=0")
+
+    # Assert
+    assert response.status_code == 422
+
+
+def test_get_dashboard_conditional_request_skips_serialization(
+    test_client: TestClient,
+    sample_industries: list[dict[str, Any]],
+    sample_locations: list[dict[str, Any]],
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that a revalidation of an unchanged dashboard is a 304 without re-rendering."""
+    # Setup
+    with (
+        patch("backend.services.industry_service.industry_repository.get_all") as mock_industries,
+        patch("backend.services.location_service.location_repository.get_all") as mock_locations,
+        patch("backend.repositories.company_repository.get_all") as mock_get_all,
+        patch("backend.repositories.company_repository.count") as mock_count,
+    ):
+        mock_industries.return_value = sample_industries
+        mock_locations.return_value = sample_locations
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = len(sample_companies_raw)
+        etag = test_client.get("/api/v1/dashboard").headers["etag"]
+
+        # Act
+        with patch("backend.core.responses._etag", side_effect=AssertionError) as mock_etag:
+            response = test_client.get("/api/v1/dashboard", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == 304
+    mock_etag.assert_not_called()
@@ -55,3 +55,25 @@ def test_list_industries_response_format(
         assert len(data) == 1
         assert data[0]["id"] == sample_industry["id"]
         assert data[0]["name"] == sample_industry["name"]
+
+
+def test_list_industries_conditional_get_returns_304(
+    test_client: TestClient, sample_industries: list[dict[str, Any]]
+) -> None:
+    """Test that revalidating with the ETag of the last response returns 304."""
+    # Setup
+    with patch("backend.services.industry_service.industry_repository.get_all") as mock_get_all:
+        mock_get_all.return_value = sample_industries
+        first = test_client.get("/api/v1/industries")
+
+        # Act
+        second = test_client.get(
+            "/api/v1/industries", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        # Assert
+        assert first.status_code == 200
+        assert first.headers["cache-control"].startswith("public, max-age=")
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == first.headers["etag"]
@@ -0,0 +1,22 @@
+"""Tests for investors API endpoints."""
+
+from typing import Any
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+
+def test_list_investors_returns_200(
+    test_client: TestClient, sample_investors: list[dict[str, Any]]
+) -> None:
+    """Test that GET /api/v1/investors returns the investors."""
+    # Setup
+    with patch("backend.services.investor_service.investor_repository.get_all") as mock_get_all:
+        mock_get_all.return_value = sample_investors
+
+        # Act
+        response = test_client.get("/api/v1/investors")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == sample_investors
@@ -7,9 +7,21 @@ import pytest
 from fastapi.testclient import TestClient
 from supabase._async.client import AsyncClient
 
+from backend.core import cache
 from backend.core.supabase_client import get_supabase
 from backend.main import app
 
+# ============================================================================
+# Cache Isolation
+# ============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    """Invalidate in-process caches so tests never see each other's data."""
+    cache.invalidate()
+
+
 # ============================================================================
 # Test Data Fixtures
 # ============================================================================
@@ -55,6 +67,15 @@ def sample_locations(sample_location: dict[str, Any]) -> list[dict[str, Any]]:
     ]
 
 
+@pytest.fixture
+def sample_investors() -> list[dict[str, Any]]:
+    """Sample list of investors for testing."""
+    return [
+        {"id": 1, "name": "Accel"},
+        {"id": 2, "name": "Sequoia Capital"},
+    ]
+
+
 @pytest.fixture
 def sample_company_raw() -> dict[str, Any]:
     """Raw company record as returned by Supabase with embedded relations."""
@@ -0,0 +1,174 @@
+"""Tests for in-process caching primitives."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.cache import KeyedTTLCache, TTLCache
+
+
+@pytest.mark.asyncio
+async def test_get_serves_fresh_value_from_memory() -> None:
+    """Test that a fresh value is returned without calling the loader again."""
+    # Setup
+    loader = AsyncMock(return_value=["a"])
+    ttl_cache = TTLCache("test", loader, ttl=60)
+
+    # Act
+    first = await ttl_cache.get(MagicMock())
+    second = await ttl_cache.get(MagicMock())
+
+    # Assert
+    assert first == second == ["a"]
+    loader.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_reloads_after_ttl_expires() -> None:
+    """Test that an expired value is reloaded from the loader."""
+    # Setup
+    loader = AsyncMock(side_effect=[["old"], ["new"]])
+    ttl_cache = TTLCache("test", loader, ttl=10)
+
+    with patch("backend.core.cache.time.monotonic", side_effect=[0.0, 20.0, 20.0, 20.0]):
+        # Act
+        first = await ttl_cache.get(MagicMock())
+        second = await ttl_cache.get(MagicMock())
+
+    # Assert
+    assert first == ["old"]
+    assert second == ["new"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_serves_stale_value_on_upstream_error() -> None:
+    """Test that a failing reload keeps serving the previous value."""
+    # Setup
+    loader = AsyncMock(side_effect=[["stale"], RuntimeError("upstream down")])
+    ttl_cache = TTLCache("test", loader, ttl=60)
+    await ttl_cache.get(MagicMock())
+
+    # Act
+    result = await ttl_cache.refresh(MagicMock())
+
+    # Assert
+    assert result == ["stale"]
+
+
+@pytest.mark.asyncio
+async def test_get_raises_when_nothing_cached_and_upstream_fails() -> None:
+    """Test that the loader error propagates when there is no stale value."""
+    # Setup
+    loader = AsyncMock(side_effect=RuntimeError("upstream down"))
+    ttl_cache = TTLCache("test", loader, ttl=60)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError):
+        await ttl_cache.get(MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reload() -> None:
+    """Test that invalidate drops the value and the next get reloads."""
+    # Setup
+    loader = AsyncMock(side_effect=[["old"], ["new"]])
+    ttl_cache = TTLCache("test", loader, ttl=60)
+    await ttl_cache.get(MagicMock())
+
+    # Act
+    ttl_cache.invalidate()
+    result = await ttl_cache.get(MagicMock())
+
+    # Assert
+    assert result == ["new"]
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_keyed_cache_loads_each_key_once() -> None:
+    """Test that each key is loaded once and then served from memory."""
+    # Setup
+    loader = AsyncMock(side_effect=lambda client, key: key * 10)
+    keyed_cache = KeyedTTLCache("test", loader, ttl=60, max_size=10)
+
+    # Act
+    results = [await keyed_cache.get(MagicMock(), key) for key in (1, 2, 1, 2)]
+
+    # Assert
+    assert results == [10, 20, 10, 20]
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_keyed_cache_evicts_least_recently_used() -> None:
+    """Test that the least recently used key is evicted at max_size."""
+    # Setup
+    loader = AsyncMock(side_effect=lambda client, key: key)
+    keyed_cache = KeyedTTLCache("test", loader, ttl=60, max_size=2)
+    await keyed_cache.get(MagicMock(), 1)
+    await keyed_cache.get(MagicMock(), 2)
+    await keyed_cache.get(MagicMock(), 1)
+
+    # Act
+    await keyed_cache.get(MagicMock(), 3)
+    await keyed_cache.get(MagicMock(), 1)
+
+    # Assert
+    assert len(keyed_cache) == 2
+    assert loader.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_keyed_cache_refresh_keeps_stale_value_on_error() -> None:
+    """Test that a failing background refresh keeps the previous value."""
+    # Setup
+    loader = AsyncMock(side_effect=[5, RuntimeError("upstream down")])
+    keyed_cache = KeyedTTLCache("test", loader, ttl=60, max_size=10)
+    await keyed_cache.get(MagicMock(), "key")
+
+    # Act
+    await keyed_cache.refresh(MagicMock())
+
+    # Assert
+    assert await keyed_cache.get(MagicMock(), "key") == 5
+
+
+@pytest.mark.asyncio
+async def test_keyed_cache_discard_reloads_one_key() -> None:
+    """Test that discarding a key reloads only that key."""
+    # Setup
+    loader = AsyncMock(side_effect=lambda client, key: key * 10)
+    keyed_cache = KeyedTTLCache("test", loader, ttl=60, max_size=10)
+    await keyed_cache.get(MagicMock(), 1)
+    await keyed_cache.get(MagicMock(), 2)
+
+    # Act
+    discarded = keyed_cache.discard(1)
+    missing = keyed_cache.discard(3)
+    await keyed_cache.get(MagicMock(), 1)
+    await keyed_cache.get(MagicMock(), 2)
+
+    # Assert
+    assert discarded is True
+    assert missing is False
+    assert loader.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_keyed_cache_refresh_without_reload_only_purges_expired_keys() -> None:
+    """Test that a purge-only refresh drops expired keys without calling the loader."""
+    # Setup
+    loader = AsyncMock(side_effect=lambda client, key: key * 10)
+    keyed_cache = KeyedTTLCache("test", loader, ttl=10, max_size=10, reload_on_refresh=False)
+
+    with patch("backend.core.cache.time.monotonic", side_effect=[0.0, 5.0, 12.0]):
+        await keyed_cache.get(MagicMock(), 1)
+        await keyed_cache.get(MagicMock(), 2)
+
+        # Act
+        await keyed_cache.refresh(MagicMock())
+
+    # Assert
+    assert loader.await_count == 2
+    assert len(keyed_cache) == 1
+    assert keyed_cache.discard(2) is True
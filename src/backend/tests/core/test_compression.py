@@ -0,0 +1,145 @@
+"""Tests for response compression."""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.core.compression import CompressionMiddleware, choose_encoding, compress
+from backend.core.http_cache import HTTPCacheMiddleware
+
+BODY = b'{"items": [' + b'{"name": "Company"},' * 200 + b"]}"
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Small app behind the same middleware stack as the API."""
+    app = FastAPI()
+    app.add_middleware(HTTPCacheMiddleware)
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/large")
+    async def get_large() -> Response:
+        return Response(BODY, media_type="application/json", headers={"ETag": '"large"'})
+
+    @app.get("/small")
+    async def get_small() -> Response:
+        return Response(b"{}", media_type="application/json")
+
+    @app.get("/binary")
+    async def get_binary() -> Response:
+        return Response(BODY, media_type="application/vnd.apache.parquet")
+
+    @app.get("/stream")
+    async def get_stream() -> StreamingResponse:
+        return StreamingResponse(iter([BODY, BODY]), media_type="application/x-ndjson")
+
+    @app.get("/text")
+    async def get_text() -> PlainTextResponse:
+        return PlainTextResponse(BODY.decode())
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip;q=0.5", "gzip"),
+        ("*", "br"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_choose_encoding(header: str, expected: str | None) -> None:
+    """Test that brotli is preferred and zero qualities are honoured."""
+    # Setup
+    with patch("backend.core.compression.BROTLI_AVAILABLE", True):
+        # Act / Assert
+        assert choose_encoding(header) == expected
+
+
+def test_choose_encoding_without_brotli_falls_back_to_gzip() -> None:
+    """Test that br is never chosen when brotli is not installed."""
+    # Setup
+    with patch("backend.core.compression.BROTLI_AVAILABLE", False):
+        # Act / Assert
+        assert choose_encoding("br, gzip") == "gzip"
+
+
+def test_compress_reuses_bytes_for_the_same_etag() -> None:
+    """Test that a tagged body is compressed once per coding."""
+    # Setup
+    with patch("backend.core.compression._encode", wraps=lambda body, coding: body[:5]) as encode:
+        # Act
+        first = compress(BODY, "gzip", '"same"')
+        second = compress(BODY, "gzip", '"same"')
+        compress(BODY, "gzip")
+        compress(BODY, "gzip")
+
+    # Assert
+    assert first == second
+    assert encode.call_count == 3
+
+
+def test_large_json_is_gzipped_with_weak_etag(client: TestClient) -> None:
+    """Test that large bodies are compressed and their ETag becomes weak."""
+    # Act
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    # Assert
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"large"'
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(BODY)
+    assert response.content == BODY
+
+
+def test_compressed_etag_revalidates_to_304(client: TestClient) -> None:
+    """Test that the weak ETag of a compressed response yields a 304 with the same tag."""
+    # Setup
+    etag = client.get("/large", headers={"Accept-Encoding": "gzip"}).headers["etag"]
+
+    # Act
+    response = client.get("/large", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag == 'W/"large"'
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.parametrize("path", ["/small", "/binary", "/stream"])
+def test_small_binary_and_streamed_bodies_are_not_compressed(client: TestClient, path: str) -> None:
+    """Test that only complete compressible bodies above the threshold are compressed."""
+    # Act
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    # Assert
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_identity_request_is_not_compressed(client: TestClient) -> None:
+    """Test that clients without an accepted coding get the plain body."""
+    # Act
+    response = client.get("/text", headers={"Accept-Encoding": "identity"})
+
+    # Assert
+    assert "content-encoding" not in response.headers
+    assert response.content == BODY
+
+
+def test_gzip_body_is_deterministic() -> None:
+    """Test that gzip output has no timestamp, so cached bytes are stable."""
+    # Act
+    first = compress(BODY, "gzip")
+    second = compress(BODY, "gzip")
+
+    # Assert
+    assert first == second
+    assert gzip.decompress(first) == BODY
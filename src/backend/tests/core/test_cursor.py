@@ -0,0 +1,26 @@
+"""Tests for keyset cursor encoding."""
+
+import pytest
+
+from backend.core.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    """Test that a decoded cursor matches the encoded position."""
+    # Act
+    cursor = encode_cursor({"id": 42})
+
+    # Assert
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == {"id": 42}
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-base64!", "bm90IGpzb24", "é", encode_cursor({"x": 1}), encode_cursor({"id": True})],
+)
+def test_decode_malformed_cursor_raises(cursor: str) -> None:
+    """Test that malformed cursors raise InvalidCursorError."""
+    # Act / Assert
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
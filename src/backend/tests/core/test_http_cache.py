@@ -0,0 +1,87 @@
+"""Tests for HTTP caching middleware."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from backend.core.http_cache import HTTPCacheMiddleware, etag_matches
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Small app with one tagged and one untagged route behind the middleware."""
+    app = FastAPI()
+    app.add_middleware(HTTPCacheMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> PlainTextResponse:
+        return PlainTextResponse(f"item {item_id}", headers={"ETag": f'"v{item_id}"'})
+
+    @app.get("/plain")
+    async def get_plain() -> PlainTextResponse:
+        return PlainTextResponse("plain", headers={"Cache-Control": "private"})
+
+    @app.post("/items")
+    async def post_item() -> PlainTextResponse:
+        return PlainTextResponse("created", headers={"ETag": '"v1"'})
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [('"a"', True), ('W/"a"', True), ('"b", "a"', True), ("*", True), ('"b"', False)],
+)
+def test_etag_matches(header: str, expected: bool) -> None:
+    """Test the weak comparison used for If-None-Match."""
+    # Act / Assert
+    assert etag_matches(header, '"a"') is expected
+
+
+def test_matching_etag_returns_304_without_body(client: TestClient) -> None:
+    """Test that a matching If-None-Match gets an empty 304 with the cache headers."""
+    # Setup
+    with (
+        patch(
+            "backend.core.http_cache.settings.http_cache_control",
+            {"get_item": "public, max-age=60"},
+        ),
+        patch("backend.core.http_cache.settings.http_vary", {}),
+    ):
+        # Act
+        response = client.get("/items/1", headers={"If-None-Match": '"v1"'})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"v1"'
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "content-length" not in response.headers
+
+
+def test_stale_etag_returns_full_response(client: TestClient) -> None:
+    """Test that a non-matching If-None-Match gets the full 200."""
+    # Act
+    response = client.get("/items/2", headers={"If-None-Match": '"v1"'})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.text == "item 2"
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_route_headers_and_unsafe_methods_are_left_alone(client: TestClient) -> None:
+    """Test that route-set headers win and POST responses are untouched."""
+    # Act
+    plain = client.get("/plain")
+    posted = client.post("/items", headers={"If-None-Match": '"v1"'})
+
+    # Assert
+    assert plain.headers["cache-control"] == "private"
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert posted.status_code == 200
+    assert "cache-control" not in posted.headers
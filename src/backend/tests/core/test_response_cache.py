@@ -0,0 +1,89 @@
+"""Tests for the stale-while-revalidate response cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.core.response_cache import ResponseCache
+
+
+@pytest.mark.asyncio
+async def test_response_cache_counts_hits_and_misses() -> None:
+    """Test that a repeated key is a hit and a new key is a miss."""
+    # Setup
+    response_cache: ResponseCache[str, str] = ResponseCache(
+        "test", ttl=60, stale_ttl=60, max_size=10
+    )
+    loader = AsyncMock(return_value="page")
+
+    # Act
+    await response_cache.get_or_load("a", loader)
+    await response_cache.get_or_load("a", loader)
+    await response_cache.get_or_load("b", loader)
+
+    # Assert
+    assert loader.await_count == 2
+    assert response_cache.stats() == {
+        "hits": 1,
+        "stale_hits": 0,
+        "misses": 2,
+        "errors": 0,
+        "size": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_response_cache_serves_stale_while_revalidating() -> None:
+    """Test that a stale entry is returned at once and refreshed in the background."""
+    # Setup
+    response_cache: ResponseCache[str, str] = ResponseCache(
+        "test", ttl=0, stale_ttl=60, max_size=10
+    )
+    await response_cache.get_or_load("a", AsyncMock(return_value="old"))
+
+    # Act
+    stale = await response_cache.get_or_load("a", AsyncMock(return_value="new"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    revalidated = await response_cache.get_or_load("a", AsyncMock(return_value="newer"))
+
+    # Assert
+    assert stale == "old"
+    assert revalidated == "new"
+    assert response_cache.stale_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_response_cache_serves_stale_on_error() -> None:
+    """Test that an expired entry is served when the reload fails."""
+    # Setup
+    response_cache: ResponseCache[str, str] = ResponseCache("test", ttl=0, stale_ttl=0, max_size=10)
+    await response_cache.get_or_load("a", AsyncMock(return_value="old"))
+
+    # Act
+    result = await response_cache.get_or_load("a", AsyncMock(side_effect=RuntimeError("down")))
+
+    # Assert
+    assert result == "old"
+    assert response_cache.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_discards_loads_started_before_invalidate() -> None:
+    """Test that a load finishing after invalidate is not stored."""
+    # Setup
+    response_cache: ResponseCache[str, str] = ResponseCache(
+        "test", ttl=60, stale_ttl=60, max_size=10
+    )
+
+    async def _loader() -> str:
+        response_cache.invalidate()
+        return "outdated"
+
+    # Act
+    result = await response_cache.get_or_load("a", _loader)
+
+    # Assert
+    assert result == "outdated"
+    assert len(response_cache) == 0
@@ -0,0 +1,106 @@
+"""Tests for response classes."""
+
+import json
+from unittest.mock import MagicMock
+
+from pydantic import TypeAdapter
+
+from backend.core.responses import ComposedCache, ModelResponse, render
+from backend.schemas.industry import IndustryRead
+
+
+def test_model_response_serializes_with_adapter() -> None:
+    """Test that ModelResponse encodes validated models as JSON bytes."""
+    # Setup
+    industries = [IndustryRead(id=1, name="SaaS"), IndustryRead(id=2, name="FinTech")]
+
+    # Act
+    response = ModelResponse(industries, adapter=TypeAdapter(list[IndustryRead]))
+
+    # Assert
+    assert response.media_type == "application/json"
+    assert json.loads(bytes(response.body)) == [
+        {"id": 1, "name": "SaaS"},
+        {"id": 2, "name": "FinTech"},
+    ]
+
+
+def test_model_response_applies_exclude() -> None:
+    """Test that the exclude specification is forwarded to the serializer."""
+    # Setup
+    industries = [IndustryRead(id=1, name="SaaS")]
+
+    # Act
+    response = ModelResponse(
+        industries, adapter=TypeAdapter(list[IndustryRead]), exclude={"__all__": {"name"}}
+    )
+
+    # Assert
+    assert json.loads(bytes(response.body)) == [{"id": 1}]
+
+
+def test_model_response_sets_etag_from_body() -> None:
+    """Test that equal bodies get equal ETags and different bodies do not."""
+    # Setup
+    adapter = TypeAdapter(list[IndustryRead])
+
+    # Act
+    first = ModelResponse([IndustryRead(id=1, name="SaaS")], adapter=adapter)
+    same = ModelResponse([IndustryRead(id=1, name="SaaS")], adapter=adapter)
+    other = ModelResponse([IndustryRead(id=2, name="SaaS")], adapter=adapter)
+
+    # Assert
+    assert first.headers["etag"] == same.headers["etag"]
+    assert first.headers["etag"] != other.headers["etag"]
+    assert first.headers["etag"].startswith('"')
+
+
+def test_render_reuses_bytes_for_the_same_object() -> None:
+    """Test that rendering the same cached object twice skips serialization."""
+    # Setup
+    industries = [IndustryRead(id=1, name="SaaS")]
+    adapter = MagicMock(wraps=TypeAdapter(list[IndustryRead]))
+
+    # Act
+    first = render(industries, adapter)
+    second = render(industries, adapter)
+    excluded = render(industries, adapter, exclude={"__all__": {"name"}})
+
+    # Assert
+    assert first == second
+    assert excluded != first
+    assert adapter.dump_json.call_count == 2
+
+
+def test_render_without_memoize_leaves_memo_untouched() -> None:
+    """Test that one-off content is serialized without entering the memo."""
+    # Setup
+    industries = [IndustryRead(id=1, name="SaaS")]
+    adapter = MagicMock(wraps=TypeAdapter(list[IndustryRead]))
+
+    # Act
+    first = render(industries, adapter, memoize=False)
+    second = render(industries, adapter)
+
+    # Assert
+    assert first == second
+    assert adapter.dump_json.call_count == 2
+
+
+def test_composed_cache_reuses_object_while_parts_are_unchanged() -> None:
+    """Test that a composition is rebuilt only when a part or parameter changes."""
+    # Setup
+    composed: ComposedCache[list[object]] = ComposedCache(max_size=8)
+    part, other = ["a"], ["a"]
+    build = MagicMock(side_effect=lambda: [object()])
+
+    # Act
+    first = composed.get((part,), 1, build)
+    second = composed.get((part,), 1, build)
+    new_part = composed.get((other,), 1, build)
+    new_params = composed.get((part,), 2, build)
+
+    # Assert
+    assert first is second
+    assert new_part is not first and new_params is not first
+    assert build.call_count == 3
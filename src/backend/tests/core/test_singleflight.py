@@ -0,0 +1,88 @@
+"""Tests for single-flight call coalescing."""
+
+import asyncio
+
+import pytest
+
+from backend.core.singleflight import SingleFlight, coalesce
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    """Test that concurrent calls with the same key run the function once."""
+    # Setup
+    flight = SingleFlight()
+    calls = 0
+
+    async def _fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    # Act
+    results = await asyncio.gather(*(flight.do("key", _fetch) for _ in range(10)))
+
+    # Assert
+    assert results == [42] * 10
+    assert calls == 1
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_coalesced() -> None:
+    """Test that a finished call is not reused by later callers."""
+    # Setup
+    calls = 0
+
+    @coalesce
+    async def _fetch(value: int) -> int:
+        nonlocal calls
+        calls += 1
+        return value
+
+    # Act
+    await _fetch(1)
+    await _fetch(1)
+
+    # Assert
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_different_arguments_are_not_coalesced() -> None:
+    """Test that calls with different arguments run independently."""
+    # Setup
+    calls: list[int] = []
+
+    @coalesce
+    async def _fetch(*, page: int) -> int:
+        calls.append(page)
+        await asyncio.sleep(0.01)
+        return page
+
+    # Act
+    results = await asyncio.gather(_fetch(page=1), _fetch(page=2), _fetch(page=1))
+
+    # Assert
+    assert results == [1, 2, 1]
+    assert sorted(calls) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_by_all_waiters() -> None:
+    """Test that every waiter receives the error of the shared call."""
+    # Setup
+    flight = SingleFlight()
+
+    async def _fail() -> int:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    # Act
+    results = await asyncio.gather(
+        flight.do("key", _fail), flight.do("key", _fail), return_exceptions=True
+    )
+
+    # Assert
+    assert all(isinstance(result, RuntimeError) for result in results)
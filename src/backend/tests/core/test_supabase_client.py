@@ -0,0 +1,66 @@
+"""Tests for the shared Supabase client lifecycle."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core import supabase_client
+
+
+@pytest.mark.asyncio
+async def test_init_supabase_reuses_single_client() -> None:
+    """Test that repeated init calls return the same pooled client."""
+    # Setup
+    fake_client = MagicMock()
+
+    with patch(
+        "backend.core.supabase_client.create_client", new=AsyncMock(return_value=fake_client)
+    ) as mock_create:
+        # Act
+        first = await supabase_client.init_supabase()
+        second = await supabase_client.init_supabase()
+
+        # Assert
+        assert first is fake_client
+        assert second is fake_client
+        mock_create.assert_awaited_once()
+        options = mock_create.call_args.kwargs["options"]
+        assert options.httpx_client is not None
+
+        await supabase_client.close_supabase()
+
+
+@pytest.mark.asyncio
+async def test_close_supabase_releases_http_client() -> None:
+    """Test that close_supabase closes the pool and resets the shared client."""
+    # Setup
+    with patch("backend.core.supabase_client.create_client", new=AsyncMock()):
+        await supabase_client.init_supabase()
+        http_client = supabase_client._http_client
+        assert http_client is not None
+
+        # Act
+        await supabase_client.close_supabase()
+
+        # Assert
+        assert http_client.is_closed
+        assert supabase_client._client is None
+        assert supabase_client._http_client is None
+
+
+@pytest.mark.asyncio
+async def test_get_supabase_yields_shared_client() -> None:
+    """Test that the dependency yields the process-wide client."""
+    # Setup
+    fake_client = MagicMock()
+
+    with patch(
+        "backend.core.supabase_client.create_client", new=AsyncMock(return_value=fake_client)
+    ):
+        # Act
+        yielded = [client async for client in supabase_client.get_supabase()]
+
+        # Assert
+        assert yielded == [fake_client]
+
+        await supabase_client.close_supabase()
@@ -0,0 +1,115 @@
+"""Tests for the version-probed single-value cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.core.versioned_cache import VersionedCache
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_rebuilds_only_when_version_changes() -> None:
+    """Test that the loader runs again only after the probed version changes."""
+    # Setup
+    loader = AsyncMock(side_effect=["v1 value", "v2 value"])
+    version_loader = AsyncMock(side_effect=[1, 1, 2])
+    versioned = VersionedCache("test", loader, version_loader, check_interval=0)
+
+    # Act
+    first = await versioned.get(MagicMock())
+    unchanged = await versioned.get(MagicMock())
+    changed = await versioned.get(MagicMock())
+
+    # Assert
+    assert (first, unchanged, changed) == ("v1 value", "v1 value", "v2 value")
+    assert loader.await_count == 2
+    assert version_loader.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_probes_at_most_once_per_interval() -> None:
+    """Test that a recently checked value is served without probing."""
+    # Setup
+    loader = AsyncMock(return_value="value")
+    version_loader = AsyncMock(return_value=1)
+    versioned = VersionedCache("test", loader, version_loader, check_interval=60)
+
+    # Act
+    await versioned.get(MagicMock())
+    await versioned.get(MagicMock())
+
+    # Assert
+    version_loader.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_serves_stale_value_when_probe_fails() -> None:
+    """Test that a failing version probe keeps the previous value."""
+    # Setup
+    loader = AsyncMock(return_value="value")
+    version_loader = AsyncMock(side_effect=[1, RuntimeError("upstream down")])
+    versioned = VersionedCache("test", loader, version_loader, check_interval=0)
+    await versioned.get(MagicMock())
+
+    # Act
+    result = await versioned.refresh(MagicMock())
+
+    # Assert
+    assert result == "value"
+    loader.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_refresh_skips_unused_value() -> None:
+    """Test that the background refresh does not build a value nobody requested."""
+    # Setup
+    loader = AsyncMock()
+    version_loader = AsyncMock()
+    versioned = VersionedCache("test", loader, version_loader, check_interval=0)
+
+    # Act
+    result = await versioned.refresh(MagicMock())
+
+    # Assert
+    assert result is None
+    loader.assert_not_awaited()
+    version_loader.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_applies_updater_on_version_change() -> None:
+    """Test that a changed version is applied incrementally when an updater is set."""
+    # Setup
+    loader = AsyncMock(return_value="v1 value")
+    version_loader = AsyncMock(side_effect=[1, 2])
+    updater = AsyncMock(return_value="v2 value")
+    versioned = VersionedCache("test", loader, version_loader, check_interval=0, updater=updater)
+    client = MagicMock()
+    await versioned.get(client)
+
+    # Act
+    result = await versioned.get(client)
+
+    # Assert
+    assert result == "v2 value"
+    loader.assert_awaited_once()
+    updater.assert_awaited_once_with(client, "v1 value", 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_reloads_when_updater_declines() -> None:
+    """Test that an updater returning None falls back to a full reload."""
+    # Setup
+    loader = AsyncMock(side_effect=["v1 value", "v2 value"])
+    version_loader = AsyncMock(side_effect=[1, 2])
+    updater = AsyncMock(return_value=None)
+    versioned = VersionedCache("test", loader, version_loader, check_interval=0, updater=updater)
+    await versioned.get(MagicMock())
+
+    # Act
+    result = await versioned.get(MagicMock())
+
+    # Assert
+    assert result == "v2 value"
+    assert loader.await_count == 2
+    updater.assert_awaited_once()
@@ -1,11 +1,13 @@
 """Tests for company repository."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from backend.repositories import company_repository
+from backend.schemas.company import CompanyRanges
 from backend.tests.conftest import mock_supabase_response
 
 
@@ -54,6 +56,30 @@ async def test_get_all_with_industry_filter(
     query.eq.assert_any_call("industry_id", 1)
 
 
+@pytest.mark.asyncio
+async def test_get_all_and_count_with_multiple_ids_use_in_filters() -> None:
+    """Test that several industry/location IDs are pushed down as ``in`` filters."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.eq = MagicMock(return_value=query)
+    query.in_ = MagicMock(return_value=query)
+    query.range = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response([], count=7))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    await company_repository.get_all(mock_client, industry_id=(1, 3), location_id=2)
+    total = await company_repository.count(mock_client, industry_id=(1, 3), location_id=2)
+
+    # Assert
+    assert total == 7
+    assert query.in_.call_count == 2
+    query.in_.assert_called_with("industry_id", (1, 3))
+    query.eq.assert_called_with("location_id", 2)
+
+
 @pytest.mark.asyncio
 async def test_get_all_with_location_filter(
     sample_companies_raw: list[dict[str, Any]],
@@ -176,3 +202,168 @@ async def test_count_with_location_filter() -> None:
     # Assert
     assert result == 30
     query.eq.assert_called_once_with("location_id", 1)
+
+
+@pytest.mark.asyncio
+async def test_count_with_planned_strategy() -> None:
+    """Test that the count strategy is forwarded to PostgREST."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response([], count=98))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    result = await company_repository.count(mock_client, count_method="planned")
+
+    # Assert
+    assert result == 98
+    query.select.assert_called_once_with("*", count="planned", head=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_get_all_calls_are_coalesced(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that N concurrent identical page queries produce one upstream call."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.range = MagicMock(return_value=query)
+
+    async def _execute() -> Any:
+        await asyncio.sleep(0.01)
+        return mock_supabase_response(sample_companies_raw)
+
+    query.execute = AsyncMock(side_effect=_execute)
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    results = await asyncio.gather(
+        *(company_repository.get_all(mock_client, page=1, size=20) for _ in range(10))
+    )
+
+    # Assert
+    assert all(result == sample_companies_raw for result in results)
+    query.execute.assert_awaited_once()
+
+
+def test_default_select_has_no_wildcard() -> None:
+    """Test that the default projection lists columns explicitly."""
+    # Assert
+    assert "*" not in company_repository.COMPANY_SELECT
+    assert "created_by" not in company_repository.COMPANY_SELECT
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_sparse_fields(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that a sparse fieldset projects only the requested columns."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.range = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    await company_repository.get_all(mock_client, fields=("id", "name", "location"))
+
+    # Assert
+    query.select.assert_called_once_with("id, name, location_id, location(city, state, country)")
+
+
+@pytest.mark.asyncio
+async def test_count_with_range_filters_pushed_down() -> None:
+    """Test that metric bounds become inclusive gte/lte conditions."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.gte = MagicMock(return_value=query)
+    query.lte = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response([], count=3))
+    mock_client.table = MagicMock(return_value=query)
+    ranges = CompanyRanges(min_arr=1_000_000, max_arr=5_000_000, founded_after=2010)
+
+    # Act
+    result = await company_repository.count(mock_client, ranges=ranges)
+
+    # Assert
+    assert result == 3
+    query.gte.assert_any_call("arr", 1_000_000)
+    query.gte.assert_any_call("founding_year", 2010)
+    query.lte.assert_called_once_with("arr", 5_000_000)
+    assert query.gte.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_sort_orders_nulls_last_then_id(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that sorting by a metric adds an id tie-breaker."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.range = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    await company_repository.get_all(mock_client, sort="arr", order="desc")
+
+    # Assert
+    assert query.order.call_args_list[0].args == ("arr",)
+    assert query.order.call_args_list[0].kwargs == {"desc": True, "nullsfirst": False}
+    assert query.order.call_args_list[1].args == ("id",)
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_investor_filter_joins_junction_table(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that the investor filter uses one inner-joined query."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.eq = MagicMock(return_value=query)
+    query.range = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    await company_repository.get_all(mock_client, investor_id=3, fields=("id", "name", "investors"))
+
+    # Assert
+    query.select.assert_called_once_with(
+        "id, name, investors:investor(id, name), company_investor!inner()"
+    )
+    query.eq.assert_called_once_with("company_investor.investor_id", 3)
+    query.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_count_with_investor_filter() -> None:
+    """Test that counting by investor joins the junction table."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.eq = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response([], count=4))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    result = await company_repository.count(mock_client, investor_id=3)
+
+    # Assert
+    assert result == 4
+    query.select.assert_called_once_with("*, company_investor!inner()", count="exact", head=True)
+    query.eq.assert_called_once_with("company_investor.investor_id", 3)
@@ -0,0 +1,109 @@
+"""Tests for keyset pagination in the company repository."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.repositories import company_repository
+from backend.tests.conftest import mock_supabase_response
+
+
+@pytest.mark.asyncio
+async def test_get_after_uses_keyset_condition(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that get_after pages with id > after_id ordered by id."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.eq = MagicMock(return_value=query)
+    query.gt = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    result = await company_repository.get_after(mock_client, industry_id=1, after_id=40, limit=21)
+
+    # Assert
+    assert result == sample_companies_raw
+    query.eq.assert_called_once_with("industry_id", 1)
+    query.gt.assert_called_once_with("id", 40)
+    query.order.assert_called_once_with("id")
+    query.limit.assert_called_once_with(21)
+
+
+@pytest.mark.asyncio
+async def test_get_after_first_page_has_no_keyset_condition(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that get_after without after_id starts from the first row."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.gt = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    await company_repository.get_after(mock_client, limit=21)
+
+    # Assert
+    query.gt.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_after_with_sort_uses_value_and_id_keyset(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that sorted keyset pages continue after (value, id)."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.or_ = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    await company_repository.get_after(
+        mock_client, sort="valuation", order="desc", after_id=7, after_value=500, limit=21
+    )
+
+    # Assert
+    query.or_.assert_called_once_with(
+        "valuation.lt.500,and(valuation.eq.500,id.gt.7),valuation.is.null"
+    )
+    assert query.order.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_after_with_sort_inside_null_tail(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that a cursor on a NULL value only walks the NULL tail by id."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.is_ = MagicMock(return_value=query)
+    query.gt = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    await company_repository.get_after(mock_client, sort="arr", after_id=7, limit=21)
+
+    # Assert
+    query.is_.assert_called_once_with("arr", "null")
+    query.gt.assert_called_once_with("id", 7)
@@ -0,0 +1,122 @@
+"""Tests for company repository lookups by id, by update time and version probes."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.repositories import company_repository
+from backend.tests.conftest import mock_supabase_response
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_embeds_relations(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that a detail lookup filters by primary key and embeds investors."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.eq = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw[:1]))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    result = await company_repository.get_by_id(mock_client, 1)
+
+    # Assert
+    assert result == sample_companies_raw[0]
+    assert "investors:investor(id, name)" in query.select.call_args.args[0]
+    query.eq.assert_called_once_with("id", 1)
+    query.limit.assert_called_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_returns_none_when_missing() -> None:
+    """Test that an unknown id returns None."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.eq = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response([]))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    result = await company_repository.get_by_id(mock_client, 999)
+
+    # Assert
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_uses_one_in_query(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that a batch lookup resolves every id with one ``in`` filter."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.in_ = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    result = await company_repository.get_by_ids(mock_client, (3, 1))
+
+    # Assert
+    assert result == sample_companies_raw
+    query.in_.assert_called_once_with("id", (3, 1))
+    query.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_updated_since_orders_by_update_time(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that changed rows are fetched with an inclusive bound, oldest first."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.gte = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_companies_raw))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    result = await company_repository.get_updated_since(mock_client, "2024-01-01", limit=50)
+
+    # Assert
+    assert result == sample_companies_raw
+    query.gte.assert_called_once_with("updated_at", "2024-01-01")
+    query.order.assert_called_once_with("updated_at")
+    query.limit.assert_called_once_with(50)
+
+
+@pytest.mark.asyncio
+async def test_get_investor_links_version_returns_count_and_last_link() -> None:
+    """Test that the link probe reads the row count and the highest link key."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(
+        return_value=mock_supabase_response([{"company_id": 9, "investor_id": 4}], count=12)
+    )
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    version = await company_repository.get_investor_links_version(mock_client)
+
+    # Assert
+    assert version == (12, (9, 4))
+    mock_client.table.assert_called_once_with("company_investor")
+    query.select.assert_called_once_with("company_id, investor_id", count="exact")
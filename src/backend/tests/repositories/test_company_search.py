@@ -0,0 +1,130 @@
+"""Tests for the in-memory company search index."""
+
+from typing import Any
+
+import pytest
+
+from backend.services.company_service import to_company_reads
+
+pytest.importorskip("numpy")
+
+from backend.repositories.company_search import (  # noqa: E402
+    CompanySearchIndex,
+    normalize,
+    trigrams,
+)
+
+
+def _rows() -> list[dict[str, Any]]:
+    """Companies with overlapping names and products."""
+    return [
+        {"id": company_id, "name": name, "products": products}
+        for company_id, name, products in [
+            (1, "Salesforce", "CRM, Marketing Automation"),
+            (2, "Datadog", "Observability, Log Management"),
+            (3, "Zendesk", "Customer Support, Help Desk"),
+            (4, "Gusto", "HR, Payroll"),
+            (5, "Sales Hub", "CRM"),
+            (6, "Société Générale", "Banking"),
+        ]
+    ]
+
+
+@pytest.fixture
+def index() -> CompanySearchIndex:
+    """Index built from the sample rows."""
+    rows = _rows()
+    return CompanySearchIndex(rows, to_company_reads(rows))
+
+
+def _ids(hits: list[tuple[Any, float]]) -> list[int]:
+    return [company.id for company, _ in hits]
+
+
+def test_normalize_folds_case_accents_and_punctuation() -> None:
+    """Test that text is reduced to lowercase ASCII words."""
+    # Act
+    result = normalize("  Société-Générale, S.A. ")
+
+    # Assert
+    assert result == "societe generale s a"
+
+
+def test_trigrams_pad_each_word() -> None:
+    """Test that words are padded like pg_trgm so short queries still match."""
+    # Act
+    grams = trigrams("ab c")
+
+    # Assert
+    assert grams == {"  a", " ab", "ab ", "  c", " c "}
+
+
+def test_search_ranks_exact_name_first(index: CompanySearchIndex) -> None:
+    """Test that an exact name beats a company that only shares the prefix."""
+    # Act
+    hits = index.search("salesforce", limit=10)
+
+    # Assert
+    assert _ids(hits) == [1, 5]
+    assert hits[0][1] > hits[1][1]
+
+
+def test_search_tolerates_typos(index: CompanySearchIndex) -> None:
+    """Test that a misspelled name still finds the company."""
+    # Act
+    hits = index.search("zendsek", limit=3)
+
+    # Assert
+    assert _ids(hits)[0] == 3
+
+
+def test_search_prefix_and_ties_ordered_by_id(index: CompanySearchIndex) -> None:
+    """Test that typeahead prefixes match and equal scores are ordered by id."""
+    # Act
+    hits = index.search("sal", limit=10)
+
+    # Assert
+    assert set(_ids(hits)[:2]) == {1, 5}
+    assert _ids(index.search("crm", limit=10)) == [1, 5]
+
+
+def test_search_matches_products_and_accents(index: CompanySearchIndex) -> None:
+    """Test that product text and accent-free spellings match."""
+    # Act
+    payroll = index.search("payroll", limit=5)
+    societe = index.search("societe generale", limit=5)
+
+    # Assert
+    assert _ids(payroll) == [4]
+    assert _ids(societe)[0] == 6
+
+
+def test_search_respects_limit_and_ignores_empty_queries(index: CompanySearchIndex) -> None:
+    """Test that results are capped and a query without words matches nothing."""
+    # Act
+    limited = index.search("s", limit=1)
+    empty = index.search(" - ", limit=10)
+
+    # Assert
+    assert len(limited) == 1
+    assert empty == []
+
+
+def test_upsert_replaces_text_and_remove_drops_company(index: CompanySearchIndex) -> None:
+    """Test that updates re-index a company in place of its old text."""
+    # Setup
+    renamed = [{"id": 2, "name": "Doghouse", "products": "Pet Care"}]
+
+    generation = index.generation
+
+    # Act
+    index.upsert(renamed, to_company_reads(renamed))
+    index.remove(4)
+
+    # Assert
+    assert index.generation > generation
+    assert len(index) == 5
+    assert index.dead_positions == 2
+    assert _ids(index.search("doghouse", limit=5)) == [2]
+    assert index.search("observability", limit=5) == []
+    assert index.search("payroll", limit=5) == []
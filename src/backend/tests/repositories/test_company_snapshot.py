@@ -0,0 +1,207 @@
+"""Tests for the in-memory company snapshot."""
+
+from typing import Any
+
+import pytest
+
+from backend.schemas.company import CompanyRanges
+from backend.services.company_service import to_company_reads
+
+np = pytest.importorskip("numpy")
+
+from backend.repositories.company_snapshot import CompanySnapshot  # noqa: E402
+
+
+def _rows() -> list[dict[str, Any]]:
+    """Six companies spread over two industries and two locations."""
+    return [
+        {
+            "id": company_id,
+            "name": f"Company {company_id}",
+            "products": "Software",
+            "industry_id": industry_id,
+            "location_id": location_id,
+            "industry": {"name": f"Industry {industry_id}"} if industry_id else None,
+            "location": {"city": "Austin", "state": "TX", "country": "USA"},
+            "founding_year": 2000 + company_id,
+            "arr": arr,
+            "investors": [{"id": 5, "name": "Accel"}] if company_id % 2 else [],
+        }
+        for company_id, industry_id, location_id, arr in [
+            (1, 1, 1, 1_000_000),
+            (2, 2, 1, 5_000_000),
+            (4, 1, 2, None),
+            (7, 1, 1, 8_000_000),
+            (9, 2, 2, 2_000_000),
+            (12, None, 1, 9_000_000),
+        ]
+    ]
+
+
+@pytest.fixture
+def snapshot() -> CompanySnapshot:
+    """Snapshot built from the sample rows."""
+    rows = _rows()
+    return CompanySnapshot(rows, to_company_reads(rows))
+
+
+def test_positions_without_filters_returns_all(snapshot: CompanySnapshot) -> None:
+    """Test that no filters match every company."""
+    # Act
+    positions = snapshot.positions()
+
+    # Assert
+    assert len(positions) == len(snapshot) == 6
+
+
+def test_positions_with_combined_filters(snapshot: CompanySnapshot) -> None:
+    """Test that industry and location filters are combined with AND."""
+    # Act
+    positions = snapshot.positions(industry_id=1, location_id=1)
+
+    # Assert
+    assert snapshot.ids[positions].tolist() == [1, 7]
+
+
+def test_positions_with_multiple_ids_match_any(snapshot: CompanySnapshot) -> None:
+    """Test that a tuple of IDs matches companies with any of them."""
+    # Act
+    positions = snapshot.positions(industry_id=(1, 2), location_id=(2,))
+    counts = snapshot.facet_counts("location_id", industry_id=(1, 2))
+
+    # Assert
+    assert snapshot.ids[positions].tolist() == [4, 9]
+    assert counts == {1: 3, 2: 2}
+
+
+def test_null_foreign_keys_never_match(snapshot: CompanySnapshot) -> None:
+    """Test that a NULL industry does not match any industry filter."""
+    # Act
+    by_location = snapshot.positions(location_id=1)
+    by_industry = snapshot.positions(industry_id=1, location_id=1)
+
+    # Assert
+    assert snapshot.ids[by_location].tolist() == [1, 2, 7, 12]
+    assert 12 not in snapshot.ids[by_industry].tolist()
+
+
+def test_positions_with_range_filters(snapshot: CompanySnapshot) -> None:
+    """Test that inclusive metric bounds are combined with the id filters."""
+    # Setup
+    ranges = CompanyRanges(min_arr=2_000_000, max_arr=8_000_000, founded_before=2009)
+
+    # Act
+    positions = snapshot.positions(industry_id=1, ranges=ranges)
+    with_arr = snapshot.positions(ranges=CompanyRanges(min_arr=0))
+
+    # Assert
+    assert snapshot.ids[positions].tolist() == [7]
+    assert 4 not in snapshot.ids[with_arr].tolist()
+
+
+def test_page_slices_matching_positions(snapshot: CompanySnapshot) -> None:
+    """Test that page-number pagination slices the filtered positions."""
+    # Setup
+    positions = snapshot.positions(industry_id=1)
+
+    # Act
+    second_page = snapshot.page(positions, page=2, size=2)
+
+    # Assert
+    assert [item.id for item in second_page] == [7]
+
+
+def test_after_uses_keyset_position(snapshot: CompanySnapshot) -> None:
+    """Test that keyset pagination resumes after the given id."""
+    # Setup
+    positions = snapshot.positions()
+
+    # Act
+    items = snapshot.after(positions, after_id=4, limit=2)
+
+    # Assert
+    assert [item.id for item in items] == [7, 9]
+
+
+@pytest.mark.parametrize(
+    ("order", "expected"),
+    [("asc", [1, 9, 2, 7, 12, 4]), ("desc", [12, 7, 2, 9, 1, 4])],
+)
+def test_positions_sorted_with_nulls_last(
+    snapshot: CompanySnapshot, order: str, expected: list[int]
+) -> None:
+    """Test that sorted positions put NULL metrics last in both directions."""
+    # Act
+    positions = snapshot.positions(sort="arr", order=order)  # type: ignore[arg-type]
+
+    # Assert
+    assert snapshot.ids[positions].tolist() == expected
+
+
+def test_positions_sorted_bucket_is_memoized(snapshot: CompanySnapshot) -> None:
+    """Test that the same filter and sort reuse the computed positions."""
+    # Act
+    first = snapshot.positions(industry_id=1, sort="arr", order="desc")
+    second = snapshot.positions(industry_id=1, sort="arr", order="desc")
+
+    # Assert
+    assert first is second
+    assert snapshot.ids[first].tolist() == [7, 1, 4]
+
+
+def test_after_walks_sorted_positions_across_ties_and_nulls() -> None:
+    """Test that sorted keyset pages visit every company exactly once."""
+    # Setup
+    rows = [
+        {"id": company_id, "name": "", "products": "", "arr": arr}
+        for company_id, arr in [(1, 5), (2, None), (3, 5), (4, 1), (5, None), (6, 9)]
+    ]
+    snapshot = CompanySnapshot(rows, to_company_reads(rows))
+    positions = snapshot.positions(sort="arr", order="desc")
+
+    # Act
+    visited: list[int] = []
+    after_id, after_value = None, None
+    while page := snapshot.after(
+        positions, after_id=after_id, limit=2, sort="arr", order="desc", after_value=after_value
+    ):
+        visited.extend(item.id for item in page)
+        after_id, after_value = page[-1].id, page[-1].arr
+
+    # Assert
+    assert visited == [6, 1, 3, 4, 2, 5]
+
+
+def test_facet_counts_group_matching_rows(snapshot: CompanySnapshot) -> None:
+    """Test that facet counts group by a foreign key and skip NULLs."""
+    # Act
+    industries = snapshot.facet_counts("industry_id", location_id=1)
+    locations = snapshot.facet_counts("location_id", ranges=CompanyRanges(min_arr=2_000_000))
+
+    # Assert
+    assert industries == {1: 2, 2: 1}
+    assert locations == {1: 3, 2: 1}
+
+
+def test_positions_with_investor_filter(snapshot: CompanySnapshot) -> None:
+    """Test that the investor filter keeps companies with that investor."""
+    # Act
+    positions = snapshot.positions(investor_id=5, location_id=1)
+    unknown = snapshot.positions(investor_id=6)
+    counts = snapshot.facet_counts("industry_id", investor_id=5)
+
+    # Assert
+    assert snapshot.ids[positions].tolist() == [1, 7]
+    assert len(unknown) == 0
+    assert counts == {1: 2, 2: 1}
+
+
+def test_get_looks_up_company_by_id(snapshot: CompanySnapshot) -> None:
+    """Test that a company is found by id and unknown ids return None."""
+    # Act
+    company = snapshot.get(7)
+
+    # Assert
+    assert company is not None and company.id == 7
+    assert snapshot.get(5) is None
+    assert snapshot.get(100) is None
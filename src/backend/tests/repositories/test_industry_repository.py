@@ -1,5 +1,6 @@
 """Tests for industry repository."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -46,3 +47,52 @@ async def test_get_all_empty_list() -> None:
 
     # Assert
     assert result == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_all_calls_are_coalesced(
+    sample_industries: list[dict[str, Any]],
+) -> None:
+    """Test that N concurrent industries queries produce one upstream call."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+
+    async def _execute() -> Any:
+        await asyncio.sleep(0.01)
+        return mock_supabase_response(sample_industries)
+
+    query.execute = AsyncMock(side_effect=_execute)
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    results = await asyncio.gather(*(industry_repository.get_all(mock_client) for _ in range(10)))
+
+    # Assert
+    assert all(result == sample_industries for result in results)
+    query.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_version_returns_count_and_latest_update() -> None:
+    """Test that the version probe reads the newest updated_at and the row count."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.limit = MagicMock(return_value=query)
+    query.execute = AsyncMock(
+        return_value=mock_supabase_response([{"updated_at": "2025-01-02"}], count=4)
+    )
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    version = await industry_repository.get_version(mock_client)
+
+    # Assert
+    assert version == (4, "2025-01-02")
+    mock_client.table.assert_called_once_with("industry")
+    query.order.assert_called_once_with("updated_at", desc=True)
@@ -0,0 +1,32 @@
+"""Tests for investor repository."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.repositories import investor_repository
+from backend.tests.conftest import mock_supabase_response
+
+
+@pytest.mark.asyncio
+async def test_get_all_selects_columns_ordered_by_name(
+    sample_investors: list[dict[str, Any]],
+) -> None:
+    """Test that investors are fetched with explicit columns ordered by name."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+    query.execute = AsyncMock(return_value=mock_supabase_response(sample_investors))
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    result = await investor_repository.get_all(mock_client)
+
+    # Assert
+    assert result == sample_investors
+    mock_client.table.assert_called_once_with("investor")
+    query.select.assert_called_once_with("id, name")
+    query.order.assert_called_once_with("name")
@@ -1,5 +1,6 @@
 """Tests for location repository."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -46,3 +47,29 @@ async def test_get_all_empty_list() -> None:
 
     # Assert
     assert result == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_all_calls_are_coalesced(
+    sample_locations: list[dict[str, Any]],
+) -> None:
+    """Test that N concurrent locations queries produce one upstream call."""
+    # Setup
+    mock_client = AsyncMock()
+    query = AsyncMock()
+    query.select = MagicMock(return_value=query)
+    query.order = MagicMock(return_value=query)
+
+    async def _execute() -> Any:
+        await asyncio.sleep(0.01)
+        return mock_supabase_response(sample_locations)
+
+    query.execute = AsyncMock(side_effect=_execute)
+    mock_client.table = MagicMock(return_value=query)
+
+    # Act
+    results = await asyncio.gather(*(location_repository.get_all(mock_client) for _ in range(10)))
+
+    # Assert
+    assert all(result == sample_locations for result in results)
+    query.execute.assert_awaited_once()
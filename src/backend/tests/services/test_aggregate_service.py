@@ -0,0 +1,155 @@
+"""Tests for aggregate service."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.services.aggregate_service import get_aggregates  # noqa: E402
+
+
+def _row(company_id: int, industry: str | None, country: str, arr: int | None) -> dict[str, Any]:
+    return {
+        "id": company_id,
+        "industry": {"name": industry} if industry else None,
+        "location": {"city": "X", "state": None, "country": country},
+        "arr": arr,
+        "valuation": 1_000 * company_id,
+        "total_funding": None,
+    }
+
+
+_ROWS = [
+    _row(1, "CRM", "USA", 10),
+    _row(2, "CRM", "USA", 40),
+    _row(3, "CRM", "France", 20),
+    _row(4, "CRM", "USA", None),
+    _row(5, "Security", "France", 7),
+    _row(6, None, "USA", 100),
+]
+
+
+@contextmanager
+def _reference_versions(*versions: tuple[int, str]) -> Iterator[None]:
+    """Fix the industry and location table versions, one per probe if several."""
+    industry = AsyncMock(side_effect=list(versions) or [(3, "2025-01-01")] * 3)
+    location = AsyncMock(return_value=(5, "2025-01-01"))
+    with (
+        patch("backend.services.aggregate_service.industry_repository.get_version", new=industry),
+        patch("backend.services.aggregate_service.location_repository.get_version", new=location),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_get_aggregates_by_industry_matches_numpy_percentiles() -> None:
+    """Test that grouped statistics match NumPy on each group's values."""
+    # Setup
+    with (
+        patch("backend.services.aggregate_service.company_repository.get_after") as mock_get_after,
+        patch(
+            "backend.services.aggregate_service.company_repository.get_version",
+            new=AsyncMock(return_value=(6, "2025-01-01")),
+        ),
+        _reference_versions(),
+    ):
+        mock_get_after.return_value = _ROWS
+
+        # Act
+        result = await get_aggregates(AsyncMock(), "industry")
+
+    # Assert
+    assert [group.group for group in result.groups] == ["CRM", "Security", None]
+    crm = result.groups[0]
+    assert crm.companies == 4
+    assert crm.arr.count == 3
+    assert crm.arr.sum == 70
+    assert crm.arr.median == np.median([10, 20, 40])
+    assert crm.arr.p25 == np.percentile([10, 20, 40], 25)
+    assert crm.arr.p90 == pytest.approx(np.percentile([10, 20, 40], 90))
+    assert crm.valuation.p75 == np.percentile([1_000, 2_000, 3_000, 4_000], 75)
+    assert crm.total_funding.count == 0
+    assert crm.total_funding.median is None
+
+
+@pytest.mark.asyncio
+async def test_get_aggregates_rebuilt_only_when_data_changes() -> None:
+    """Test that statistics are cached across dimensions until the version changes."""
+    # Setup
+    version = AsyncMock(side_effect=[(6, "a"), (6, "a"), (7, "b")])
+
+    with (
+        patch("backend.services.aggregate_service.company_repository.get_after") as mock_get_after,
+        patch("backend.services.aggregate_service.company_repository.get_version", new=version),
+        patch("backend.services.aggregate_service.aggregates_cache.check_interval", 0),
+        _reference_versions(),
+    ):
+        mock_get_after.return_value = _ROWS
+
+        # Act
+        by_country = await get_aggregates(AsyncMock(), "country")
+        await get_aggregates(AsyncMock(), "industry")
+        mock_get_after.return_value = _ROWS[:2]
+        rebuilt = await get_aggregates(AsyncMock(), "country")
+
+    # Assert
+    assert mock_get_after.call_count == 2
+    assert [(group.group, group.companies) for group in by_country.groups] == [
+        ("France", 2),
+        ("USA", 4),
+    ]
+    assert [(group.group, group.companies) for group in rebuilt.groups] == [("USA", 2)]
+
+
+@pytest.mark.asyncio
+async def test_get_aggregates_rebuilt_when_an_industry_is_renamed() -> None:
+    """Test that a changed industry table rebuilds statistics labelled by its names."""
+    # Setup
+    renamed = [_row(1, "Sales", "USA", 10)]
+
+    with (
+        patch("backend.services.aggregate_service.company_repository.get_after") as mock_get_after,
+        patch(
+            "backend.services.aggregate_service.company_repository.get_version",
+            new=AsyncMock(return_value=(1, "a")),
+        ),
+        patch("backend.services.aggregate_service.aggregates_cache.check_interval", 0),
+        _reference_versions((3, "a"), (3, "b")),
+    ):
+        mock_get_after.return_value = [_row(1, "CRM", "USA", 10)]
+        await get_aggregates(AsyncMock(), "industry")
+        mock_get_after.return_value = renamed
+
+        # Act
+        result = await get_aggregates(AsyncMock(), "industry")
+
+    # Assert
+    assert [group.group for group in result.groups] == ["Sales"]
+
+
+@pytest.mark.asyncio
+async def test_get_aggregates_sums_exactly_beyond_float_precision() -> None:
+    """Test that sums stay exact where float64 would round."""
+    # Setup
+    big = 2**53 + 1
+    rows = [_row(1, "CRM", "USA", big), _row(2, "CRM", "USA", 2)]
+
+    with (
+        patch("backend.services.aggregate_service.company_repository.get_after") as mock_get_after,
+        patch(
+            "backend.services.aggregate_service.company_repository.get_version",
+            new=AsyncMock(return_value=(2, "a")),
+        ),
+        _reference_versions(),
+    ):
+        mock_get_after.return_value = rows
+
+        # Act
+        result = await get_aggregates(AsyncMock(), "industry")
+
+    # Assert
+    assert result.groups[0].arr.sum == big + 2
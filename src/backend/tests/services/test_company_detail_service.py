@@ -0,0 +1,65 @@
+"""Tests for company detail service."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services.company_detail_service import (
+    get_companies_by_ids,
+    get_company,
+    invalidate_company,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_company_is_cached_per_id(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that details and misses are cached per id until invalidated."""
+    # Setup
+    mock_client = AsyncMock()
+    raw = {**sample_companies_raw[0], "investors": [{"id": 3, "name": "Accel"}]}
+
+    with patch(
+        "backend.services.company_detail_service.company_repository.get_by_id"
+    ) as mock_get_by_id:
+        mock_get_by_id.side_effect = lambda client, company_id: raw if company_id == 1 else None
+
+        # Act
+        first = await get_company(mock_client, 1)
+        second = await get_company(mock_client, 1)
+        missing = await get_company(mock_client, 2)
+        await get_company(mock_client, 2)
+        invalidate_company(1)
+        await get_company(mock_client, 1)
+
+        # Assert
+        assert first is second
+        assert first is not None and first.investors is not None
+        assert first.investors[0].name == "Accel"
+        assert missing is None
+        assert mock_get_by_id.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_companies_by_ids_keeps_request_order(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that batch results follow the request order and report missing ids."""
+    # Setup
+    mock_client = AsyncMock()
+    first, second = sample_companies_raw[0], {**sample_companies_raw[0], "id": 42}
+
+    with patch(
+        "backend.services.company_detail_service.company_repository.get_by_ids"
+    ) as mock_get_by_ids:
+        mock_get_by_ids.return_value = [first, second]
+
+        # Act
+        result = await get_companies_by_ids(mock_client, [42, 999, first["id"], 42])
+
+        # Assert
+        mock_get_by_ids.assert_called_once_with(mock_client, (42, 999, first["id"]))
+        assert [item.id for item in result.items] == [42, first["id"]]
+        assert result.missing == [999]
@@ -1,13 +1,19 @@
 """Tests for company service."""
 
+import asyncio
 from math import ceil
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from backend.core.cursor import InvalidCursorError, decode_cursor, encode_cursor
 from backend.schemas.company import CompanyRead
-from backend.services.company_service import get_companies
+from backend.services.company_service import (
+    get_companies,
+    snapshot_cache,
+    to_company_reads,
+)
 
 
 @pytest.mark.asyncio
@@ -151,3 +157,264 @@ async def test_get_companies_transforms_to_schema(
             assert hasattr(item, "name")
             assert hasattr(item, "industry")
             assert hasattr(item, "location")
+
+
+@pytest.mark.asyncio
+async def test_get_companies_without_total_skips_count(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that include_total=False skips the count query."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with (
+        patch("backend.services.company_service.company_repository.get_all") as mock_get_all,
+        patch("backend.services.company_service.company_repository.count") as mock_count,
+    ):
+        mock_get_all.return_value = sample_companies_raw
+
+        # Act
+        result = await get_companies(mock_client, include_total=False)
+
+        # Assert
+        mock_count.assert_not_called()
+        assert len(result.items) == len(sample_companies_raw)
+        assert result.total is None
+        assert result.total_pages is None
+
+
+@pytest.mark.asyncio
+async def test_get_companies_runs_queries_concurrently(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that the page and count queries are in flight at the same time."""
+    # Setup
+    mock_client = AsyncMock()
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    async def _track(name: str) -> None:
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    async def _get_all(*args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        await _track("get_all")
+        return sample_companies_raw
+
+    async def _count(*args: Any, **kwargs: Any) -> int:
+        await _track("count")
+        return 2
+
+    with (
+        patch("backend.services.company_service.company_repository.get_all", side_effect=_get_all),
+        patch("backend.services.company_service.company_repository.count", side_effect=_count),
+    ):
+        # Act
+        result = await get_companies(mock_client)
+
+        # Assert
+        assert sorted(started) == ["count", "get_all"]
+        assert result.total == 2
+
+
+@pytest.mark.asyncio
+async def test_get_companies_cursor_mode_returns_next_cursor(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that cursor mode trims the extra row and emits next_cursor."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with (
+        patch("backend.services.company_service.company_repository.get_after") as mock_get_after,
+        patch("backend.services.company_service.company_repository.count") as mock_count,
+    ):
+        mock_get_after.return_value = sample_companies_raw
+        mock_count.return_value = 10
+
+        # Act
+        result = await get_companies(mock_client, size=1, cursor="")
+
+        # Assert
+        assert mock_get_after.call_args.kwargs["after_id"] is None
+        assert mock_get_after.call_args.kwargs["limit"] == 2
+        assert [item.id for item in result.items] == [sample_companies_raw[0]["id"]]
+        assert result.page is None
+        assert decode_cursor(result.next_cursor or "") == {"id": sample_companies_raw[0]["id"]}
+
+
+@pytest.mark.asyncio
+async def test_get_companies_cursor_mode_last_page(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that the last cursor page has no next_cursor."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with patch("backend.services.company_service.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        result = await get_companies(
+            mock_client, size=20, cursor=encode_cursor({"id": 5}), include_total=False
+        )
+
+        # Assert
+        assert mock_get_after.call_args.kwargs["after_id"] == 5
+        assert len(result.items) == len(sample_companies_raw)
+        assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_companies_caches_totals_per_filter(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that totals are counted once per filter combination."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with (
+        patch("backend.services.company_service.company_repository.get_all") as mock_get_all,
+        patch("backend.services.company_service.company_repository.count") as mock_count,
+        patch("backend.services.company_service.settings.company_count_strategy", "planned"),
+    ):
+        mock_get_all.return_value = sample_companies_raw
+        mock_count.return_value = 40
+
+        # Act
+        await get_companies(mock_client, industry_id=1, page=1)
+        await get_companies(mock_client, industry_id=1, page=2)
+        result = await get_companies(mock_client, industry_id=2, page=1)
+
+        # Assert
+        assert mock_count.call_count == 2
+        assert mock_count.call_args.kwargs["count_method"] == "planned"
+        assert result.total == 40
+        assert result.total_pages == 2
+
+
+@pytest.mark.asyncio
+async def test_get_companies_sorted_cursor_records_sort_value(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that sorted cursor pages carry the ordering and the last value."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with patch("backend.services.company_service.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        first = await get_companies(
+            mock_client,
+            size=1,
+            cursor="",
+            include_total=False,
+            sort="arr",
+            order="desc",
+            fields=("id", "name"),
+        )
+        await get_companies(
+            mock_client,
+            size=1,
+            cursor=first.next_cursor,
+            include_total=False,
+            sort="arr",
+            order="desc",
+        )
+
+        # Assert
+        first_call, second_call = mock_get_after.call_args_list
+        assert first_call.kwargs["fields"] == ("id", "name", "arr")
+        assert decode_cursor(first.next_cursor or "") == {
+            "id": sample_companies_raw[0]["id"],
+            "sort": "arr:desc",
+            "value": sample_companies_raw[0]["arr"],
+        }
+        assert second_call.kwargs["after_value"] == sample_companies_raw[0]["arr"]
+        assert second_call.kwargs["sort"] == "arr"
+
+
+@pytest.mark.asyncio
+async def test_get_companies_rejects_cursor_from_other_sort() -> None:
+    """Test that a cursor issued for one ordering is refused for another."""
+    # Setup
+    cursor = encode_cursor({"id": 3, "sort": "arr:asc", "value": 10})
+
+    # Act / Assert
+    with pytest.raises(InvalidCursorError):
+        await get_companies(AsyncMock(), cursor=cursor, sort="valuation")
+    with pytest.raises(InvalidCursorError):
+        await get_companies(AsyncMock(), cursor=cursor)
+
+
+def test_to_company_reads_memoizes_locations(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that a location shared by several rows is formatted once."""
+    # Setup
+    rows = sample_companies_raw * 5
+
+    with patch(
+        "backend.services.company_service._format_location", return_value="San Francisco, CA, USA"
+    ) as mock_format:
+        # Act
+        result = to_company_reads(rows)
+
+    # Assert
+    assert len(result) == len(rows)
+    assert all(item.location == "San Francisco, CA, USA" for item in result)
+    mock_format.assert_called_once()
+
+
+def test_to_company_reads_handles_missing_relations() -> None:
+    """Test that rows without embedded relations get empty strings."""
+    # Act
+    result = to_company_reads(
+        [{"id": 1, "name": "Acme", "products": "Widgets", "industry": None, "location": None}]
+    )
+
+    # Assert
+    assert result == [CompanyRead(id=1, name="Acme", industry="", location="", products="Widgets")]
+
+
+@pytest.mark.asyncio
+async def test_get_companies_snapshot_backend_answers_in_memory(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that the snapshot backend serves pages without per-request queries."""
+    pytest.importorskip("numpy")
+    # Setup
+    mock_client = AsyncMock()
+    rows = [{**sample_companies_raw[0], "id": company_id} for company_id in range(1, 6)]
+    snapshot_cache.invalidate()
+
+    with (
+        patch("backend.services.company_service.settings.company_backend", "snapshot"),
+        patch(
+            "backend.services.company_service.company_snapshot.fetch_rows",
+            new=AsyncMock(return_value=rows),
+        ) as mock_fetch,
+        patch("backend.services.company_service.company_repository.get_all") as mock_get_all,
+        patch("backend.services.company_service.company_repository.count") as mock_count,
+    ):
+        # Act
+        paged = await get_companies(mock_client, page=2, size=2)
+        first = await get_companies(mock_client, size=2, cursor="", include_total=False)
+        second = await get_companies(mock_client, size=2, cursor=first.next_cursor)
+
+    snapshot_cache.invalidate()
+
+    # Assert
+    mock_fetch.assert_awaited_once()
+    mock_get_all.assert_not_called()
+    mock_count.assert_not_called()
+    assert [item.id for item in paged.items] == [3, 4]
+    assert paged.total == 5
+    assert paged.total_pages == 3
+    assert [item.id for item in first.items] == [1, 2]
+    assert first.total is None
+    assert [item.id for item in second.items] == [3, 4]
+    assert decode_cursor(second.next_cursor or "") == {"id": 4}
@@ -0,0 +1,89 @@
+"""Tests for dashboard service."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services.dashboard_service import get_dashboard
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_runs_services_concurrently(
+    sample_industries: list[dict[str, Any]],
+    sample_locations: list[dict[str, Any]],
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that the three upstream loads are in flight at the same time."""
+    # Setup
+    mock_client = AsyncMock()
+    all_started = asyncio.Event()
+    started: list[str] = []
+
+    def _tracked(name: str, result: Any) -> Any:
+        async def _load(*args: Any, **kwargs: Any) -> Any:
+            started.append(name)
+            if len(started) == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return result
+
+        return _load
+
+    with (
+        patch(
+            "backend.services.industry_service.industry_repository.get_all",
+            side_effect=_tracked("industries", sample_industries),
+        ),
+        patch(
+            "backend.services.location_service.location_repository.get_all",
+            side_effect=_tracked("locations", sample_locations),
+        ),
+        patch(
+            "backend.services.company_service.company_repository.get_all",
+            side_effect=_tracked("companies", sample_companies_raw),
+        ),
+    ):
+        # Act
+        result = await get_dashboard(mock_client, include_total=False)
+
+        # Assert
+        assert sorted(started) == ["companies", "industries", "locations"]
+        assert len(result.industries) == len(sample_industries)
+        assert len(result.locations) == len(sample_locations)
+        assert len(result.companies.items) == len(sample_companies_raw)
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_passes_filters_to_company_service() -> None:
+    """Test that filters and paging reach the cached company listing."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with (
+        patch("backend.services.dashboard_service.industry_service.get_all_industries") as mock_ind,
+        patch("backend.services.dashboard_service.location_service.get_all_locations") as mock_loc,
+        patch(
+            "backend.services.dashboard_service.company_service.get_companies_cached"
+        ) as mock_companies,
+    ):
+        mock_ind.return_value = []
+        mock_loc.return_value = []
+        mock_companies.return_value = {
+            "items": [],
+            "total": 0,
+            "page": 2,
+            "size": 10,
+            "total_pages": 0,
+        }
+
+        # Act
+        await get_dashboard(mock_client, industry_id=3, page=2, size=10, sort="arr")
+
+        # Assert
+        kwargs = mock_companies.call_args.kwargs
+        assert kwargs["industry_id"] == 3
+        assert kwargs["page"] == 2
+        assert kwargs["size"] == 10
+        assert kwargs["sort"] == "arr"
@@ -0,0 +1,117 @@
+"""Tests for export service."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services.export_service import (
+    COLUMNAR_FIELDS,
+    iter_company_chunks,
+    stream_columnar,
+    stream_csv,
+    stream_ndjson,
+)
+
+
+@pytest.mark.asyncio
+async def test_iter_company_chunks_pages_with_keyset(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that chunks are fetched with after_id until a short chunk arrives."""
+    # Setup
+    mock_client = AsyncMock()
+    first, second = sample_companies_raw
+
+    with patch("backend.services.export_service.company_repository.get_after") as mock_get_after:
+        mock_get_after.side_effect = [[first], [second], []]
+
+        # Act
+        chunks = [chunk async for chunk in iter_company_chunks(mock_client, chunk_size=1)]
+
+        # Assert
+        assert [[company.id for company in chunk] for chunk in chunks] == [[1], [2]]
+        after_ids = [call.kwargs["after_id"] for call in mock_get_after.call_args_list]
+        assert after_ids == [None, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_iter_company_chunks_passes_filters(
+    sample_companies_raw: list[dict[str, Any]],
+) -> None:
+    """Test that filters are forwarded and a short chunk ends the export."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with patch("backend.services.export_service.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        chunks = [
+            chunk
+            async for chunk in iter_company_chunks(
+                mock_client, industry_id=1, location_id=2, chunk_size=10
+            )
+        ]
+
+        # Assert
+        assert len(chunks) == 1
+        mock_get_after.assert_called_once()
+        assert mock_get_after.call_args.kwargs["industry_id"] == 1
+        assert mock_get_after.call_args.kwargs["location_id"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_ndjson_and_csv(sample_companies_raw: list[dict[str, Any]]) -> None:
+    """Test that both encoders emit one record per company."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with patch("backend.services.export_service.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        ndjson = b"".join([part async for part in stream_ndjson(iter_company_chunks(mock_client))])
+        csv_body = b"".join([part async for part in stream_csv(iter_company_chunks(mock_client))])
+
+    # Assert
+    assert len(ndjson.splitlines()) == len(sample_companies_raw)
+    csv_lines = csv_body.decode().splitlines()
+    assert csv_lines[0].startswith("id,name,industry,location")
+    assert len(csv_lines) == len(sample_companies_raw) + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("columnar_format", ["arrow", "parquet"])
+async def test_stream_columnar_round_trip(
+    sample_companies_raw: list[dict[str, Any]], columnar_format: str
+) -> None:
+    """Test that columnar exports decode back to the repository values."""
+    # Setup
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    mock_client = AsyncMock()
+
+    with patch("backend.services.export_service.company_repository.get_after") as mock_get_after:
+        mock_get_after.return_value = sample_companies_raw
+
+        # Act
+        body = b"".join(
+            [
+                part
+                async for part in stream_columnar(
+                    mock_client,
+                    columnar_format=columnar_format,  # type: ignore[arg-type]
+                )
+            ]
+        )
+
+    # Assert
+    if columnar_format == "arrow":
+        table = pa.ipc.open_stream(body).read_all()
+    else:
+        table = pq.read_table(pa.BufferReader(body))
+    assert table.column("id").to_pylist() == [row["id"] for row in sample_companies_raw]
+    assert table.column("arr").to_pylist() == [row["arr"] for row in sample_companies_raw]
+    assert table.column("city").to_pylist() == ["San Francisco", "San Francisco"]
+    assert mock_get_after.call_args.kwargs["fields"] == COLUMNAR_FIELDS
@@ -0,0 +1,188 @@
+"""Tests for facet service."""
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.schemas.company import CompanyRanges, FacetCount
+from backend.services.facet_service import get_facets, table_cache
+
+_PAIRS = [(1, 10), (1, 10), (1, 20), (2, 10), (None, 20), (3, None)]
+
+
+def _rows() -> list[dict[str, Any]]:
+    return [
+        {
+            "id": company_id,
+            "industry_id": industry_id,
+            "location_id": location_id,
+            "arr": None if company_id == 6 else company_id * 1_000_000,
+            "valuation": None,
+            "total_funding": None,
+            "founding_year": 2000 + company_id,
+            "investor_ids": [{"investor_id": 7}] if company_id % 2 else [],
+        }
+        for company_id, (industry_id, location_id) in enumerate(_PAIRS, start=1)
+    ]
+
+
+@pytest.fixture
+def mock_get_after() -> Iterator[MagicMock]:
+    """Serve the sample rows as one keyset chunk at a fixed table version."""
+    with (
+        patch("backend.services.facet_service.company_repository.get_after") as mock_get_after,
+        patch(
+            "backend.services.facet_service.company_repository.get_version",
+            new=AsyncMock(return_value=(6, "2025-01-01")),
+        ),
+        patch(
+            "backend.services.facet_service.company_repository.get_investor_links_version",
+            new=AsyncMock(return_value=(3, (5, 7))),
+        ),
+    ):
+        mock_get_after.return_value = _rows()
+        yield mock_get_after
+
+
+@pytest.mark.asyncio
+async def test_get_facets_without_filters_counts_every_option(
+    mock_get_after: MagicMock,
+) -> None:
+    """Test that counts skip NULL foreign keys and total counts everything."""
+    # Act
+    facets = await get_facets(AsyncMock())
+
+    # Assert
+    assert facets.total == 6
+    assert facets.industries == [
+        FacetCount(id=1, count=3),
+        FacetCount(id=2, count=1),
+        FacetCount(id=3, count=1),
+    ]
+    assert facets.locations == [FacetCount(id=10, count=3), FacetCount(id=20, count=2)]
+
+
+@pytest.mark.asyncio
+async def test_get_facets_ignores_own_filter_per_facet(mock_get_after: MagicMock) -> None:
+    """Test that each facet applies only the other filters, from one table load."""
+    # Act
+    by_location = await get_facets(AsyncMock(), location_id=10)
+    by_both = await get_facets(AsyncMock(), industry_id=1, location_id=10)
+
+    # Assert
+    mock_get_after.assert_called_once()
+    assert mock_get_after.call_args.kwargs["ranges"] is None
+    assert by_location.industries == [FacetCount(id=1, count=2), FacetCount(id=2, count=1)]
+    assert by_location.locations == [FacetCount(id=10, count=3), FacetCount(id=20, count=2)]
+    assert by_location.total == 3
+    assert by_both.locations == [FacetCount(id=10, count=2), FacetCount(id=20, count=1)]
+    assert by_both.total == 2
+
+
+@pytest.mark.asyncio
+async def test_get_facets_with_multiple_ids_matches_any(mock_get_after: MagicMock) -> None:
+    """Test that several IDs per filter are combined with OR from the same matrix."""
+    # Act
+    facets = await get_facets(AsyncMock(), industry_id=(1, 3), location_id=(10, 20))
+
+    # Assert
+    assert facets.total == 3
+    assert facets.locations == [FacetCount(id=10, count=2), FacetCount(id=20, count=1)]
+    assert facets.industries == [FacetCount(id=1, count=3), FacetCount(id=2, count=1)]
+
+
+@pytest.mark.asyncio
+async def test_get_facets_applies_ranges_in_memory(mock_get_after: MagicMock) -> None:
+    """Test that metric bounds filter the cached table without new upstream walks."""
+    # Act
+    at_least_3m = await get_facets(AsyncMock(), ranges=CompanyRanges(min_arr=3_000_000))
+    repeated = await get_facets(AsyncMock(), ranges=CompanyRanges(min_arr=3_000_000))
+    band = await get_facets(
+        AsyncMock(), ranges=CompanyRanges(min_arr=2_000_000, max_arr=4_000_000), industry_id=1
+    )
+
+    # Assert
+    mock_get_after.assert_called_once()
+    assert at_least_3m.total == 3  # NULL arr of company 6 never matches
+    assert repeated is at_least_3m
+    assert band.total == 2
+    assert band.locations == [FacetCount(id=10, count=1), FacetCount(id=20, count=1)]
+
+
+@pytest.mark.asyncio
+async def test_get_facets_with_investor_filter(mock_get_after: MagicMock) -> None:
+    """Test that only companies backed by the investor are counted."""
+    # Act
+    facets = await get_facets(AsyncMock(), investor_id=7)
+    unknown = await get_facets(AsyncMock(), investor_id=8)
+
+    # Assert
+    assert mock_get_after.call_args.kwargs["fields"][-1] == "investor_ids"
+    assert facets.total == 3
+    assert facets.industries == [FacetCount(id=1, count=2)]
+    assert facets.locations == [FacetCount(id=10, count=1), FacetCount(id=20, count=2)]
+    assert unknown.total == 0
+    assert unknown.industries == []
+
+
+@pytest.mark.asyncio
+async def test_table_reloaded_when_version_changes() -> None:
+    """Test that a changed company table version rebuilds the facet table."""
+    # Setup
+    client = AsyncMock()
+    with (
+        patch(
+            "backend.services.facet_service.company_repository.get_after",
+            new=AsyncMock(side_effect=[_rows(), _rows()[:2]]),
+        ),
+        patch(
+            "backend.services.facet_service.company_repository.get_version",
+            new=AsyncMock(side_effect=[(6, "2025-01-01"), (2, "2025-01-02")]),
+        ),
+        patch(
+            "backend.services.facet_service.company_repository.get_investor_links_version",
+            new=AsyncMock(return_value=(3, (5, 7))),
+        ),
+    ):
+        await get_facets(client)
+
+        # Act
+        await table_cache.refresh(client)
+        facets = await get_facets(client)
+
+    # Assert
+    assert facets.total == 2
+
+
+@pytest.mark.asyncio
+async def test_table_reloaded_when_investor_links_change() -> None:
+    """Test that a new investor link is picked up although no company row changed."""
+    # Setup
+    client = AsyncMock()
+    linked = _rows()
+    linked[1]["investor_ids"] = [{"investor_id": 7}]
+    with (
+        patch(
+            "backend.services.facet_service.company_repository.get_after",
+            new=AsyncMock(side_effect=[_rows(), linked]),
+        ),
+        patch(
+            "backend.services.facet_service.company_repository.get_version",
+            new=AsyncMock(return_value=(6, "2025-01-01")),
+        ),
+        patch(
+            "backend.services.facet_service.company_repository.get_investor_links_version",
+            new=AsyncMock(side_effect=[(3, (5, 7)), (4, (5, 7))]),
+        ),
+    ):
+        before = await get_facets(client, investor_id=7)
+
+        # Act
+        await table_cache.refresh(client)
+        after = await get_facets(client, investor_id=7)
+
+    # Assert
+    assert before.total == 3
+    assert after.total == 4
@@ -64,3 +64,23 @@ async def test_get_all_industries_transforms_to_schema(
             assert isinstance(item, IndustryRead)
             assert hasattr(item, "id")
             assert hasattr(item, "name")
+
+
+@pytest.mark.asyncio
+async def test_get_all_industries_served_from_cache(
+    sample_industries: list[dict[str, Any]],
+) -> None:
+    """Test that repeated calls hit the repository only once."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with patch("backend.services.industry_service.industry_repository.get_all") as mock_get_all:
+        mock_get_all.return_value = sample_industries
+
+        # Act
+        first = await get_all_industries(mock_client)
+        second = await get_all_industries(mock_client)
+
+        # Assert
+        mock_get_all.assert_called_once()
+        assert first == second
@@ -0,0 +1,46 @@
+"""Tests for investor service."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.schemas.investor import InvestorRead
+from backend.services.investor_service import get_all_investors
+
+
+@pytest.mark.asyncio
+async def test_get_all_investors_transforms_to_schema(
+    sample_investors: list[dict[str, Any]],
+) -> None:
+    """Test that raw investor data is transformed to InvestorRead schema."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with patch("backend.services.investor_service.investor_repository.get_all") as mock_get_all:
+        mock_get_all.return_value = sample_investors
+
+        # Act
+        result = await get_all_investors(mock_client)
+
+        # Assert
+        assert result == [InvestorRead(**item) for item in sample_investors]
+
+
+@pytest.mark.asyncio
+async def test_get_all_investors_served_from_cache(
+    sample_investors: list[dict[str, Any]],
+) -> None:
+    """Test that repeated calls only query the repository once."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with patch("backend.services.investor_service.investor_repository.get_all") as mock_get_all:
+        mock_get_all.return_value = sample_investors
+
+        # Act
+        await get_all_investors(mock_client)
+        await get_all_investors(mock_client)
+
+        # Assert
+        mock_get_all.assert_called_once()
@@ -65,3 +65,23 @@ async def test_get_all_locations_transforms_to_schema(
             assert hasattr(item, "id")
             assert hasattr(item, "city")
             assert hasattr(item, "country")
+
+
+@pytest.mark.asyncio
+async def test_get_all_locations_served_from_cache(
+    sample_locations: list[dict[str, Any]],
+) -> None:
+    """Test that repeated calls hit the repository only once."""
+    # Setup
+    mock_client = AsyncMock()
+
+    with patch("backend.services.location_service.location_repository.get_all") as mock_get_all:
+        mock_get_all.return_value = sample_locations
+
+        # Act
+        first = await get_all_locations(mock_client)
+        second = await get_all_locations(mock_client)
+
+        # Assert
+        mock_get_all.assert_called_once()
+        assert first == second
@@ -0,0 +1,105 @@
+"""Tests for search service."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from backend.services.search_service import index_cache, search_companies  # noqa: E402
+
+
+def _row(company_id: int, name: str, products: str = "") -> dict[str, Any]:
+    return {"id": company_id, "name": name, "products": products}
+
+
+_ROWS = [_row(1, "Salesforce", "CRM"), _row(2, "Datadog", "Observability")]
+
+
+@pytest.mark.asyncio
+async def test_search_companies_builds_index_once() -> None:
+    """Test that searches reuse the index built from the company table."""
+    # Setup
+    with (
+        patch(
+            "backend.services.search_service.company_repository.get_after",
+            new=AsyncMock(return_value=_ROWS),
+        ) as mock_get_after,
+        patch(
+            "backend.services.search_service.company_repository.get_version",
+            new=AsyncMock(return_value=(2, "2025-01-01")),
+        ),
+    ):
+        # Act
+        first = await search_companies(AsyncMock(), "salesforse", limit=5)
+        second = await search_companies(AsyncMock(), "datadog", limit=5)
+        repeated = await search_companies(AsyncMock(), "salesforse", limit=5)
+
+    # Assert
+    assert first.query == "salesforse"
+    assert [hit.company.id for hit in first.items] == [1]
+    assert [hit.company.id for hit in second.items] == [2]
+    assert repeated is first
+    mock_get_after.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_index_applies_changed_rows_incrementally() -> None:
+    """Test that a version change re-indexes only the rows updated since."""
+    # Setup
+    client = AsyncMock()
+    with (
+        patch(
+            "backend.services.search_service.company_repository.get_after",
+            new=AsyncMock(return_value=_ROWS),
+        ) as mock_get_after,
+        patch(
+            "backend.services.search_service.company_repository.get_version",
+            new=AsyncMock(side_effect=[(2, "2025-01-01"), (3, "2025-02-01")]),
+        ),
+        patch(
+            "backend.services.search_service.company_repository.get_updated_since",
+            new=AsyncMock(return_value=[_row(2, "Doghouse"), _row(3, "Zendesk")]),
+        ) as mock_updated_since,
+    ):
+        await index_cache.get(client)
+
+        # Act
+        index = await index_cache.refresh(client)
+
+    # Assert
+    assert index is not None and len(index) == 3
+    assert [company.id for company, _ in index.search("zendesk", limit=5)] == [3]
+    assert index.search("datadog", limit=5) == []
+    mock_get_after.assert_awaited_once()
+    assert mock_updated_since.call_args.args[1] == "2025-01-01"
+
+
+@pytest.mark.asyncio
+async def test_index_rebuilt_when_rows_were_deleted() -> None:
+    """Test that a count the changed rows cannot explain triggers a rebuild."""
+    # Setup
+    client = AsyncMock()
+    with (
+        patch(
+            "backend.services.search_service.company_repository.get_after",
+            new=AsyncMock(side_effect=[_ROWS, _ROWS[:1]]),
+        ) as mock_get_after,
+        patch(
+            "backend.services.search_service.company_repository.get_version",
+            new=AsyncMock(side_effect=[(2, "2025-01-01"), (1, "2025-01-01")]),
+        ),
+        patch(
+            "backend.services.search_service.company_repository.get_updated_since",
+            new=AsyncMock(return_value=[]),
+        ),
+    ):
+        await index_cache.get(client)
+
+        # Act
+        index = await index_cache.refresh(client)
+
+    # Assert
+    assert index is not None and len(index) == 1
+    assert mock_get_after.await_count == 2
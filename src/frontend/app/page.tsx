@@ -1,4 +1,4 @@
-import { fetchCompanies, fetchIndustries, fetchLocations } from "@/lib/api";
+import { fetchDashboard } from "@/lib/api";
 import CompanyFilters from "@/components/CompanyFilters";
 import CompanyTable from "@/components/CompanyTable";
 import Pagination from "@/components/Pagination";
@@ -14,7 +14,7 @@ interface PageProps {
 /**
  * Server Component — Top SaaS Dashboard.
  * Reads URL search params to apply filters and pagination,
- * fetches data in parallel from the backend, and renders the dashboard.
+ * fetches everything from the backend in one request, and renders the dashboard.
  */
 export default async function Home({ searchParams }: PageProps) {
   const params = await searchParams;
@@ -27,11 +27,17 @@ export default async function Home({ searchParams }: PageProps) {
     : undefined;
   const page = params.page ? Number(params.page) : 1;
 
-  const [companiesResponse, industries, locations] = await Promise.all([
-    fetchCompanies({ industry_id: industryId, location_id: locationId, page }),
-    fetchIndustries(),
-    fetchLocations(),
-  ]);
+  const {
+    companies: companiesResponse,
+    industries,
+    locations,
+  } = await fetchDashboard({
+    industry_id: industryId,
+    location_id: locationId,
+    page,
+  });
+  const { total, total_pages: totalPages } = companiesResponse;
+  const hasTotals = total !== null && totalPages !== null && totalPages > 0;
 
   return (
     <div className="min-h-screen bg-linear-to-br from-slate-900 to-slate-800">
@@ -72,11 +78,9 @@ export default async function Home({ searchParams }: PageProps) {
         </section>
 
         {/* Record count (above table) */}
-        {companiesResponse.total_pages > 0 && (
+        {hasTotals && (
           <p className="mb-4 text-sm text-slate-400">
-            <span className="font-medium text-slate-300">
-              {companiesResponse.total}
-            </span>{" "}
+            <span className="font-medium text-slate-300">{total}</span>{" "}
             registros encontrados
           </p>
         )}
@@ -87,11 +91,11 @@ export default async function Home({ searchParams }: PageProps) {
         </section>
 
         {/* Pagination */}
-        {companiesResponse.total_pages > 0 && (
+        {hasTotals && (
           <Pagination
-            page={companiesResponse.page}
-            totalPages={companiesResponse.total_pages}
-            total={companiesResponse.total}
+            page={companiesResponse.page ?? page}
+            totalPages={totalPages}
+            total={total}
           />
         )}
       </div>
@@ -1,5 +1,6 @@
 import {
   CompanyListResponse,
+  DashboardResponse,
   HealthResponse,
   Industry,
   Location,
@@ -53,14 +54,11 @@ interface FetchCompaniesParams {
 }
 
 /**
- * Fetch paginated list of companies with optional filters.
+ * Build the query string shared by the company list and dashboard endpoints.
  * @param params - Optional industry_id, location_id, page, size
- * @returns Paginated company list response
- * @throws Error if request fails
+ * @returns Query string including the leading "?", or "" when empty
  */
-export async function fetchCompanies(
-  params?: FetchCompaniesParams,
-): Promise<CompanyListResponse> {
+function companyQuery(params?: FetchCompaniesParams): string {
   const searchParams = new URLSearchParams();
 
   if (params?.industry_id != null) {
@@ -77,7 +75,19 @@ export async function fetchCompanies(
   }
 
   const query = searchParams.toString();
-  const path = `/api/v1/companies${query ? `?${query}` : ""}`;
+  return query ? `?${query}` : "";
+}
+
+/**
+ * Fetch paginated list of companies with optional filters.
+ * @param params - Optional industry_id, location_id, page, size
+ * @returns Paginated company list response
+ * @throws Error if request fails
+ */
+export async function fetchCompanies(
+  params?: FetchCompaniesParams,
+): Promise<CompanyListResponse> {
+  const path = `/api/v1/companies${companyQuery(params)}`;
 
   try {
     return await apiGet<CompanyListResponse>(path);
@@ -117,3 +127,23 @@ export async function fetchLocations(): Promise<Location[]> {
     );
   }
 }
+
+/**
+ * Fetch industries, locations and a page of companies in one request.
+ * @param params - Optional industry_id, location_id, page, size
+ * @returns Filter options and the paginated company list
+ * @throws Error if request fails
+ */
+export async function fetchDashboard(
+  params?: FetchCompaniesParams,
+): Promise<DashboardResponse> {
+  const path = `/api/v1/dashboard${companyQuery(params)}`;
+
+  try {
+    return await apiGet<DashboardResponse>(path);
+  } catch (error) {
+    throw new Error(
+      `Failed to fetch dashboard: ${error instanceof Error ? error.message : "Unknown error"}`,
+    );
+  }
+}
@@ -46,13 +46,27 @@ export interface Company {
  */
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
-  page: number;
+  /** Null when the total was not requested (`include_total=false`) */
+  total: number | null;
+  /** Null in cursor mode */
+  page: number | null;
   size: number;
-  total_pages: number;
+  /** Null when the total was not requested (`include_total=false`) */
+  total_pages: number | null;
+  /** Cursor for the next page in cursor mode, null on the last page */
+  next_cursor: string | null;
 }
 
 /**
  * Paginated response of companies
  */
 export type CompanyListResponse = PaginatedResponse<Company>;
+
+/**
+ * Dashboard bootstrap payload: filter options and a page of companies
+ */
+export interface DashboardResponse {
+  industries: Industry[];
+  locations: Location[];
+  companies: CompanyListResponse;
+}